@@ -0,0 +1,230 @@
+"""Profile result caching: canonical profile ids, a two-tier cache and shared in-flight scrapes."""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+from urllib.parse import quote, unquote, urlsplit
+
+T = TypeVar("T")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    key TEXT PRIMARY KEY,
+    output TEXT NOT NULL,
+    scraped_at REAL NOT NULL
+);
+"""
+
+
+def _profile_slug(linkedin_url: str) -> Optional[str]:
+    parts = urlsplit(linkedin_url.strip())
+    host = (parts.hostname or "").lower()
+    if host != "linkedin.com" and not host.endswith(".linkedin.com"):
+        return None
+    segments = [segment for segment in parts.path.split("/") if segment]
+    if len(segments) < 2 or segments[0].lower() != "in":
+        return None
+    return unquote(segments[1]).lower()
+
+
+def canonical_profile_id(linkedin_url: str) -> str:
+    """Collapse tracking params, trailing paths, case and country subdomains into one key.
+
+    ``https://in.linkedin.com/in/Some-User/?trk=pub-pbmap`` becomes ``in/some-user``.
+    URLs that are not member profiles fall back to their scheme-less host and path.
+    """
+    slug = _profile_slug(linkedin_url)
+    if slug:
+        return f"in/{slug}"
+    parts = urlsplit(linkedin_url.strip())
+    return f"{(parts.hostname or '').lower()}{parts.path.rstrip('/')}"
+
+
+def canonical_profile_url(linkedin_url: str) -> str:
+    """Return the ``https://www.linkedin.com/in/<slug>/`` form of a profile URL."""
+    slug = _profile_slug(linkedin_url)
+    if not slug:
+        return linkedin_url
+    return f"https://www.linkedin.com/in/{quote(slug)}/"
+
+
+@dataclass
+class CacheEntry:
+    output: str
+    scraped_at: float
+
+    @property
+    def age(self) -> float:
+        return max(time.time() - self.scraped_at, 0.0)
+
+
+class ProfileCache:
+    """In-memory LRU in front of a SQLite file.
+
+    Entries younger than ``ttl`` are fresh. Entries up to ``stale_ttl`` seconds
+    past that may still be served while a refresh runs in the background; older
+    ones are treated as missing.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path],
+        *,
+        ttl: float = 24 * 60 * 60,
+        stale_ttl: float = 6 * 60 * 60,
+        max_entries: int = 512,
+    ) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max(1, max_entries)
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @property
+    def max_lifetime(self) -> float:
+        return self.ttl + self.stale_ttl
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return entry.age <= self.ttl
+
+    def is_servable(self, entry: CacheEntry) -> bool:
+        return entry.age <= self.max_lifetime
+
+    async def open(self) -> None:
+        if self.path is not None:
+            await asyncio.to_thread(self._open)
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._close)
+
+    async def get(self, key: str, *, fallback: Optional[str] = None) -> Optional[CacheEntry]:
+        """Return the servable entry for ``key``, counting one hit or miss per call.
+
+        If ``key`` has nothing servable, a fresh entry under ``fallback`` is returned instead.
+        """
+        entry = await self._lookup(key)
+        if entry is None and fallback is not None:
+            entry = await self._lookup(fallback)
+            if entry is not None and not self.is_fresh(entry):
+                entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    async def _lookup(self, key: str) -> Optional[CacheEntry]:
+        entry = self._memory.get(key)
+        if entry is None and self._conn is not None:
+            entry = await asyncio.to_thread(self._read, key)
+            if entry is not None:
+                self._remember(key, entry)
+        if entry is None or not self.is_servable(entry):
+            return None
+        self._memory.move_to_end(key)
+        return entry
+
+    async def put(self, key: str, output: str) -> CacheEntry:
+        entry = CacheEntry(output=output, scraped_at=time.time())
+        self._remember(key, entry)
+        if self._conn is not None:
+            await asyncio.to_thread(self._write, key, entry)
+        return entry
+
+    def snapshot(self) -> dict:
+        return {
+            "entries": len(self._memory),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "stale_ttl": self.stale_ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        conn.execute("DELETE FROM profiles WHERE scraped_at < ?", (time.time() - self.max_lifetime,))
+        self._conn = conn
+
+    def _close(self) -> None:
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+    def _read(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            if not self._conn:
+                return None
+            row = self._conn.execute(
+                "SELECT output, scraped_at FROM profiles WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return CacheEntry(output=row[0], scraped_at=row[1])
+
+    def _write(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            if not self._conn:
+                return
+            self._conn.execute(
+                "INSERT OR REPLACE INTO profiles (key, output, scraped_at) VALUES (?, ?, ?)",
+                (key, entry.output, entry.scraped_at),
+            )
+
+
+class SingleFlight:
+    """Lets concurrent callers with the same key share one running coroutine.
+
+    The shared task is shielded from its callers, so a client that disconnects
+    does not cancel the work other callers are still waiting for.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[str, asyncio.Task] = {}
+        self.coalesced = 0
+
+    def in_flight(self, key: str) -> bool:
+        return key in self._calls
+
+    async def do(self, key: str, factory: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """Run ``factory()`` unless a call for ``key`` is already running.
+
+        Returns the result and whether it came from another caller's run.
+        """
+        task = self._calls.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return await asyncio.shield(task), True
+        task = asyncio.ensure_future(factory())
+        self._calls[key] = task
+        task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task), False
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every caller went away.
+            task.exception()
+
+    def snapshot(self) -> dict:
+        return {"in_flight": len(self._calls), "coalesced": self.coalesced}
@@ -0,0 +1,264 @@
+"""Durable queue for asynchronous scrape jobs, backed by a local SQLite file."""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, List, Optional
+
+logger = logging.getLogger("linkedin_scraper.api")
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    request TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    available_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_by_status ON jobs (status, available_at, created_at);
+"""
+
+
+class RetryJob(Exception):
+    """Raised by a job handler to put the job back in the queue after ``delay`` seconds."""
+
+    def __init__(self, message: str, *, delay: Optional[float] = None, count_attempt: bool = True) -> None:
+        super().__init__(message)
+        self.delay = delay
+        self.count_attempt = count_attempt
+
+
+def _isoformat(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+class JobStore:
+    """Synchronous SQLite access; callers run these methods in a worker thread."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        self._conn = conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+    def _execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        if not self._conn:
+            raise RuntimeError("JobStore is not open.")
+        return self._conn.execute(sql, params)
+
+    def requeue_running(self) -> int:
+        """Put jobs interrupted by a restart back into the queue."""
+        with self._lock:
+            cursor = self._execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE status = ?",
+                (QUEUED, time.time(), RUNNING),
+            )
+            return cursor.rowcount
+
+    def add(self, request: dict) -> dict:
+        now = time.time()
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._execute(
+                "INSERT INTO jobs (id, request, status, created_at, updated_at, available_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, json.dumps(request), QUEUED, now, now, now),
+            )
+            return self._get(job_id)
+
+    def get(self, job_id: str) -> Optional[dict]:
+        with self._lock:
+            return self._get(job_id)
+
+    def _get(self, job_id: str) -> Optional[dict]:
+        row = self._execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        return {
+            "id": row["id"],
+            "status": row["status"],
+            "request": json.loads(row["request"]),
+            "attempts": row["attempts"],
+            "result": row["result"],
+            "error": row["error"],
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+            "available_at": row["available_at"],
+        }
+
+    def claim_next(self) -> Optional[dict]:
+        """Atomically mark the oldest due job as running and return it."""
+        now = time.time()
+        with self._lock:
+            self._execute("BEGIN IMMEDIATE")
+            try:
+                row = self._execute(
+                    "SELECT id FROM jobs WHERE status = ? AND available_at <= ?"
+                    " ORDER BY available_at, created_at LIMIT 1",
+                    (QUEUED, now),
+                ).fetchone()
+                if row is None:
+                    self._execute("COMMIT")
+                    return None
+                self._execute(
+                    "UPDATE jobs SET status = ?, attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                    (RUNNING, now, row["id"]),
+                )
+                self._execute("COMMIT")
+            except Exception:
+                self._execute("ROLLBACK")
+                raise
+            return self._get(row["id"])
+
+    def complete(self, job_id: str, result: str) -> None:
+        with self._lock:
+            self._execute(
+                "UPDATE jobs SET status = ?, result = ?, error = NULL, updated_at = ? WHERE id = ?",
+                (SUCCEEDED, result, time.time(), job_id),
+            )
+
+    def fail(self, job_id: str, error: str) -> None:
+        with self._lock:
+            self._execute(
+                "UPDATE jobs SET status = ?, error = ?, updated_at = ? WHERE id = ?",
+                (FAILED, error, time.time(), job_id),
+            )
+
+    def retry(self, job_id: str, error: str, *, delay: float, count_attempt: bool = True) -> None:
+        now = time.time()
+        with self._lock:
+            self._execute(
+                "UPDATE jobs SET status = ?, error = ?, updated_at = ?, available_at = ?,"
+                " attempts = attempts - ? WHERE id = ?",
+                (QUEUED, error, now, now + delay, 0 if count_attempt else 1, job_id),
+            )
+
+    def counts(self) -> dict:
+        with self._lock:
+            rows = self._execute("SELECT status, COUNT(*) AS total FROM jobs GROUP BY status").fetchall()
+        return {row["status"]: row["total"] for row in rows}
+
+
+def job_view(job: dict) -> dict:
+    """Public representation of a stored job."""
+    return {
+        "id": job["id"],
+        "status": job["status"],
+        "linkedin_url": job["request"].get("linkedin_url"),
+        "attempts": job["attempts"],
+        "output": job["result"],
+        "error": job["error"],
+        "created_at": _isoformat(job["created_at"]),
+        "updated_at": _isoformat(job["updated_at"]),
+    }
+
+
+class JobRunner:
+    """Pulls jobs from a JobStore and runs them through ``handler`` with bounded concurrency."""
+
+    def __init__(
+        self,
+        store: JobStore,
+        handler: Callable[[dict], Awaitable[str]],
+        *,
+        concurrency: int = 3,
+        max_attempts: int = 3,
+        retry_delay: float = 30,
+        poll_interval: float = 5,
+    ) -> None:
+        self.store = store
+        self.handler = handler
+        self.concurrency = max(1, concurrency)
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.poll_interval = poll_interval
+        self.stop_event = asyncio.Event()
+        self._wakeup = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        await asyncio.to_thread(self.store.open)
+        replayed = await asyncio.to_thread(self.store.requeue_running)
+        if replayed:
+            logger.info("Replaying %s unfinished job(s) from the previous run.", replayed)
+        self._tasks = [asyncio.create_task(self._work_loop()) for _ in range(self.concurrency)]
+
+    async def stop(self) -> None:
+        self.stop_event.set()
+        self._wakeup.set()
+        for task in self._tasks:
+            task.cancel()
+        # Cancelled jobs stay "running" in the store and are replayed on the next start.
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        await asyncio.to_thread(self.store.close)
+
+    async def submit(self, request: dict) -> dict:
+        job = await asyncio.to_thread(self.store.add, request)
+        self._wakeup.set()
+        return job
+
+    async def get(self, job_id: str) -> Optional[dict]:
+        return await asyncio.to_thread(self.store.get, job_id)
+
+    async def snapshot(self) -> dict:
+        return await asyncio.to_thread(self.store.counts)
+
+    async def _work_loop(self) -> None:
+        while not self.stop_event.is_set():
+            self._wakeup.clear()
+            job = await asyncio.to_thread(self.store.claim_next)
+            if job is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._run(job)
+
+    async def _run(self, job: dict) -> None:
+        try:
+            result = await self.handler(job["request"])
+        except RetryJob as exc:
+            if exc.count_attempt and job["attempts"] >= self.max_attempts:
+                await asyncio.to_thread(self.store.fail, job["id"], str(exc))
+                return
+            delay = self.retry_delay if exc.delay is None else exc.delay
+            await asyncio.to_thread(
+                self.store.retry, job["id"], str(exc), delay=delay, count_attempt=exc.count_attempt
+            )
+        except Exception as exc:
+            logger.exception("Job %s failed.", job["id"])
+            await asyncio.to_thread(self.store.fail, job["id"], repr(exc))
+        else:
+            await asyncio.to_thread(self.store.complete, job["id"], result)
@@ -1,18 +1,33 @@
 """FastAPI app that wraps the linkedin_scraper with session management."""
 
 import asyncio
+import json
 import logging
+import multiprocessing
 import os
-import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Tuple
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
 
-import zendriver as zd
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, HttpUrl
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, HttpUrl
 
-from linkedin_scraper import Person, actions
+from linkedin_scraper.network import ResourcePolicy
+from linkedin_scraper.pacing import PacingPolicy
+from linkedin_scraper.person import SECTIONS, resolve_sections
+
+from .cache import CacheEntry, ProfileCache, SingleFlight, canonical_profile_id, canonical_profile_url
+from .jobs import JobRunner, JobStore, RetryJob, job_view
+from .memory import MB, RecyclePolicy
+from .session import PoolExhaustedError, SessionManager, SessionUnavailableError
+from .worker import run_worker
 
 load_dotenv()
 
@@ -28,103 +43,257 @@ def _env_bool(name: str, default: bool = True) -> bool:
     return value.lower() not in {"0", "false", "no", "off"}
 
 
+def _env_int(name: str, default: int) -> int:
+    """Parse integer environment variables, falling back on bad input."""
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r; using %s.", name, value, default)
+        return default
+
+
 class ScrapeRequest(BaseModel):
     linkedin_url: HttpUrl
+    # Oldest cached result (in seconds) the caller accepts; 0 forces a fresh scrape.
+    max_age: Optional[int] = Field(default=None, ge=0)
+    # Subset of linkedin_scraper.person.SECTIONS to collect; all of them when omitted.
+    sections: Optional[List[str]] = None
 
 
-class SessionUnavailableError(Exception):
-    """Raised when the browser is busy logging in or restarting."""
+class BatchScrapeRequest(BaseModel):
+    linkedin_urls: List[HttpUrl]
+    max_age: Optional[int] = Field(default=None, ge=0)
+    sections: Optional[List[str]] = None
 
 
-class SessionManager:
-    def __init__(self, *, headless: bool = True) -> None:
-        self.headless = headless
-        self.browser: Optional[zd.Browser] = None
-        self.tab: Optional[zd.Tab] = None
-        self.available: bool = False
-        self.lock = asyncio.Lock()
+def _normalize_sections(sections: Optional[List[str]]) -> Optional[List[str]]:
+    """Validate requested sections; ``None`` stands for a full scrape."""
+    try:
+        selected = resolve_sections(sections)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    if selected == frozenset(SECTIONS):
+        return None
+    return sorted(selected)
+
+
+class QuotaExceededError(Exception):
+    """Raised when the daily scrape quota is used up."""
+
+    def __init__(self, reset_at: datetime) -> None:
+        super().__init__("Tageslimit erreicht: maximal 50 Profile pro Tag.")
+        self.reset_at = reset_at
+
+
+class WorkerCrashedError(SessionUnavailableError):
+    """Raised for scrapes that were running on a worker process that died."""
+
+
+@dataclass
+class WorkerHandle:
+    worker_id: int
+    process: Optional[BaseProcess] = None
+    inbox: Any = None
+    available: bool = False
+    state: dict = field(default_factory=dict)
+    in_flight: Dict[str, asyncio.Future] = field(default_factory=dict)
+    restarts: int = 0
+    restart_at: float = 0.0
+    # Exits since the worker last reported an available session; reset once it does.
+    failed_starts: int = 0
+    failed: bool = False
+
+    @property
+    def alive(self) -> bool:
+        return bool(self.process and self.process.is_alive())
+
+
+class WorkerDispatcher:
+    """Runs K browser workers in their own processes and routes scrapes to the least-loaded one.
+
+    Each worker owns a SessionManager with its own event loop, browser and profile
+    directory, so a crashed or re-authenticating browser only takes its own share
+    of capacity offline. Dead workers are restarted by the monitor loop, waiting
+    twice as long after each exit that was not preceded by an available session,
+    and given up on after ``max_failed_starts`` such exits in a row.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int,
+        settings: dict,
+        profile_root: Path,
+        restart_backoff: float = 10,
+        max_restart_backoff: float = 900,
+        max_failed_starts: int = 6,
+    ) -> None:
+        self.settings = settings
+        self.profile_root = profile_root
+        self.restart_backoff = restart_backoff
+        self.max_restart_backoff = max_restart_backoff
+        self.max_failed_starts = max_failed_starts
+        self.handles = [WorkerHandle(worker_id=index) for index in range(max(1, workers))]
+        self._ctx = multiprocessing.get_context("spawn")
+        self._outbox = self._ctx.Queue()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._reader: Optional[threading.Thread] = None
         self.stop_event = asyncio.Event()
-        self.refresh_task: Optional[asyncio.Task] = None
-        self.refresh_min_seconds = 30 * 60
-        self.refresh_max_seconds = 90 * 60
+        self.monitor_task: Optional[asyncio.Task] = None
 
     @property
     def is_available(self) -> bool:
-        return self.available and self.tab is not None
+        return any(handle.available and handle.alive for handle in self.handles)
 
     async def start(self) -> None:
-        try:
-            await self._reset_and_login()
-        except Exception:
-            logger.exception("Failed to log into LinkedIn on startup.")
-            raise
-        self.refresh_task = asyncio.create_task(self._refresh_loop())
-
-    async def _reset_and_login(self) -> None:
-        async with self.lock:
-            self.available = False
-            await self._stop_browser()
-            logger.info("Logging into LinkedIn...")
-            await self._start_browser_and_login()
-            self.available = True
-            logger.info("Logged in; API ready.")
-
-    async def _start_browser_and_login(self) -> None:
-        config = actions.build_browser_config(headless=self.headless)
-        browser = await actions.start_browser(config)
-        tab = await browser.get("https://www.linkedin.com/")
-        tab = await actions.login(tab, timeout=20)
-        self.browser = tab.browser or browser
-        self.tab = tab
-
-    async def _stop_browser(self) -> None:
-        if self.browser:
-            try:
-                await self.browser.stop()
-            except Exception as exc:
-                logger.warning("Error while stopping browser: %s", exc)
-        self.browser = None
-        self.tab = None
-
-    async def refresh_session(self) -> None:
-        await self._reset_and_login()
-
-    async def _refresh_loop(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._reader = threading.Thread(target=self._read_outbox, name="worker-outbox", daemon=True)
+        self._reader.start()
+        for handle in self.handles:
+            self._spawn(handle)
+        self.monitor_task = asyncio.create_task(self._monitor_loop())
+
+    def _spawn(self, handle: WorkerHandle) -> None:
+        profile_dir = self.profile_root / f"worker-{handle.worker_id}"
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        settings = dict(self.settings, user_data_dir=str(profile_dir))
+        handle.inbox = self._ctx.Queue()
+        handle.available = False
+        handle.process = self._ctx.Process(
+            target=run_worker,
+            args=(handle.worker_id, settings, handle.inbox, self._outbox),
+            name=f"linkedin-worker-{handle.worker_id}",
+            daemon=True,
+        )
+        handle.process.start()
+        logger.info("Started browser worker %s (pid %s).", handle.worker_id, handle.process.pid)
+
+    def _read_outbox(self) -> None:
+        while True:
+            message = self._outbox.get()
+            if message is None:
+                return
+            if self._loop and not self._loop.is_closed():
+                self._loop.call_soon_threadsafe(self._handle_message, message)
+
+    def _handle_message(self, message: tuple) -> None:
+        kind, worker_id, *payload = message
+        handle = self.handles[worker_id]
+        if kind == "state":
+            handle.available, handle.state = payload
+            if handle.available:
+                handle.failed_starts = 0
+            return
+        job_id, error_kind, result = payload
+        future = handle.in_flight.pop(job_id, None)
+        if not future or future.done():
+            return
+        if error_kind is None:
+            future.set_result(result)
+        elif error_kind == "pool_exhausted":
+            future.set_exception(PoolExhaustedError(result))
+        elif error_kind == "unavailable":
+            future.set_exception(SessionUnavailableError(result))
+        else:
+            future.set_exception(RuntimeError(result))
+
+    async def _monitor_loop(self) -> None:
         while not self.stop_event.is_set():
-            wait_seconds = random.randint(self.refresh_min_seconds, self.refresh_max_seconds)
             try:
-                await asyncio.wait_for(self.stop_event.wait(), timeout=wait_seconds)
+                await asyncio.wait_for(self.stop_event.wait(), timeout=1)
                 break
             except asyncio.TimeoutError:
                 pass
-            try:
-                logger.info("Refreshing LinkedIn session...")
-                await self.refresh_session()
-            except Exception:
-                self.available = False
-                logger.exception("Failed to refresh session; API paused until next attempt.")
-
-    async def scrape_profile(self, linkedin_url: str) -> str:
-        if not self.is_available:
+            self._check_workers(time.monotonic())
+
+    def _check_workers(self, now: float) -> None:
+        for handle in self.handles:
+            if handle.alive or handle.failed:
+                continue
+            if handle.process is not None:
+                handle.failed_starts += 1
+                backoff = min(self.restart_backoff * 2 ** (handle.failed_starts - 1), self.max_restart_backoff)
+                logger.error(
+                    "Browser worker %s exited with code %s.", handle.worker_id, handle.process.exitcode
+                )
+                handle.process = None
+                handle.available = False
+                handle.restart_at = now + backoff
+                self._fail_in_flight(handle)
+                if handle.failed_starts >= self.max_failed_starts:
+                    # Every restart is another LinkedIn login; a rejected account only gets flagged more.
+                    handle.failed = True
+                    logger.error(
+                        "Browser worker %s failed %s times in a row; not restarting it.",
+                        handle.worker_id,
+                        handle.failed_starts,
+                    )
+                    continue
+                logger.info("Restarting browser worker %s in %ss.", handle.worker_id, backoff)
+            if now >= handle.restart_at:
+                handle.restarts += 1
+                self._spawn(handle)
+
+    def _fail_in_flight(self, handle: WorkerHandle) -> None:
+        for future in handle.in_flight.values():
+            if not future.done():
+                future.set_exception(WorkerCrashedError("Browser-Worker neu gestartet – bitte erneut versuchen."))
+        handle.in_flight.clear()
+
+    async def scrape_profile(self, linkedin_url: str, sections: Optional[List[str]] = None) -> str:
+        candidates = [handle for handle in self.handles if handle.available and handle.alive]
+        if not candidates:
             raise SessionUnavailableError("Anmeldung läuft – bitte kurz warten.")
-        async with self.lock:
-            if not self.is_available or not self.tab:
-                raise SessionUnavailableError("Anmeldung läuft – bitte kurz warten.")
-            person = Person(linkedin_url, driver=self.tab, scrape=False, close_on_complete=False)
-            await person.scrape_async(close_on_complete=False)
-            return str(person)
+        handle = min(candidates, key=lambda item: len(item.in_flight))
+        job_id = uuid.uuid4().hex
+        future = asyncio.get_running_loop().create_future()
+        handle.in_flight[job_id] = future
+        handle.inbox.put((job_id, linkedin_url, sections))
+        try:
+            return await future
+        finally:
+            handle.in_flight.pop(job_id, None)
+
+    async def snapshot(self) -> dict:
+        return {
+            "workers": [
+                {
+                    "worker_id": handle.worker_id,
+                    "alive": handle.alive,
+                    "available": handle.available,
+                    "in_flight": len(handle.in_flight),
+                    "restarts": handle.restarts,
+                    "failed_starts": handle.failed_starts,
+                    "failed": handle.failed,
+                    **handle.state,
+                }
+                for handle in self.handles
+            ]
+        }
 
     async def stop(self) -> None:
         self.stop_event.set()
-        if self.refresh_task:
-            self.refresh_task.cancel()
+        if self.monitor_task:
+            self.monitor_task.cancel()
             try:
-                await self.refresh_task
+                await self.monitor_task
             except asyncio.CancelledError:
                 pass
-        async with self.lock:
-            self.available = False
-            await self._stop_browser()
+        for handle in self.handles:
+            if handle.alive:
+                handle.inbox.put(None)
+        for handle in self.handles:
+            if handle.process is None:
+                continue
+            await asyncio.to_thread(handle.process.join, 30)
+            if handle.process.is_alive():
+                handle.process.terminate()
+            handle.available = False
+            self._fail_in_flight(handle)
+        self._outbox.put(None)
 
 
 class DailyRateLimiter:
@@ -183,6 +352,11 @@ class DailyRateLimiter:
             self.count += 1
             return True, self._reset_at
 
+    async def remaining(self) -> int:
+        async with self.lock:
+            self._reset_if_due()
+            return max(self.limit - self.count, 0)
+
     async def refund(self) -> None:
         async with self.lock:
             self._reset_if_due()
@@ -201,46 +375,283 @@ class DailyRateLimiter:
 
 
 app = FastAPI(title="LinkedIn Scraper API", version="0.1.0")
-session_manager = SessionManager(headless=_env_bool("LINKEDIN_SCRAPER_HEADLESS", False))
+data_dir = Path(os.getenv("LINKEDIN_SCRAPER_DATA_DIR", "data")).expanduser()
+if _env_bool("LINKEDIN_SCRAPER_PACING", True):
+    pacing_policy = PacingPolicy(budget=_env_int("LINKEDIN_SCRAPER_PACING_BUDGET", 0) or None)
+else:
+    pacing_policy = PacingPolicy.zero()
+recycle_policy = RecyclePolicy(
+    # 0 turns a limit off.
+    tab_max_page_loads=_env_int("LINKEDIN_SCRAPER_TAB_MAX_PAGE_LOADS", 200) or None,
+    tab_max_heap_bytes=_env_int("LINKEDIN_SCRAPER_TAB_MAX_HEAP_MB", 256) * MB or None,
+    browser_max_page_loads=_env_int("LINKEDIN_SCRAPER_BROWSER_MAX_PAGE_LOADS", 2000) or None,
+    browser_max_rss_bytes=_env_int("LINKEDIN_SCRAPER_BROWSER_MAX_RSS_MB", 1536) * MB or None,
+)
+session_settings = {
+    "headless": _env_bool("LINKEDIN_SCRAPER_HEADLESS", False),
+    "launch_profile": os.getenv("LINKEDIN_SCRAPER_LAUNCH_PROFILE", "default"),
+    "tab_pool_size": _env_int("LINKEDIN_SCRAPER_TABS", 3),
+    "max_waiters": _env_int("LINKEDIN_SCRAPER_MAX_WAITERS", 20),
+    "checkout_timeout": _env_int("LINKEDIN_SCRAPER_TAB_WAIT_SECONDS", 180),
+    "drain_timeout": _env_int("LINKEDIN_SCRAPER_DRAIN_SECONDS", 300),
+    "scrape_timeout": _env_int("LINKEDIN_SCRAPER_SCRAPE_TIMEOUT", 300),
+    "watchdog_interval": _env_int("LINKEDIN_SCRAPER_WATCHDOG_SECONDS", 15),
+    "recycle": recycle_policy,
+    "parallel_details": _env_bool("LINKEDIN_SCRAPER_PARALLEL_DETAILS", False),
+    "pacing": pacing_policy,
+    "resource_policy": ResourcePolicy() if _env_bool("LINKEDIN_SCRAPER_BLOCK_RESOURCES", False) else None,
+    # One directory for all workers, so every browser reuses what any of them downloaded.
+    "asset_cache_dir": str(data_dir / "assets") if _env_bool("LINKEDIN_SCRAPER_ASSET_CACHE", False) else None,
+    "asset_cache_max_bytes": _env_int("LINKEDIN_SCRAPER_ASSET_CACHE_MB", 256) * 1024 * 1024,
+}
+profile_root = Path(os.getenv("LINKEDIN_SCRAPER_PROFILE_ROOT", "~/.config/chromium/linkedin-scraper")).expanduser()
+worker_count = _env_int("LINKEDIN_SCRAPER_WORKERS", 1)
+if worker_count > 1:
+    session_manager = WorkerDispatcher(workers=worker_count, settings=session_settings, profile_root=profile_root)
+else:
+    session_manager = SessionManager(**session_settings, user_data_dir=str(profile_root / "worker-0"))
 rate_limiter = DailyRateLimiter(limit=50)
 
 
+async def scrape_with_quota(linkedin_url: str, sections: Optional[List[str]] = None) -> str:
+    """Scrape one profile, charging the daily quota and refunding it on failure."""
+    allowed, reset_at = await rate_limiter.try_acquire()
+    if not allowed:
+        raise QuotaExceededError(reset_at)
+    try:
+        return await session_manager.scrape_profile(linkedin_url, sections=sections)
+    except Exception:
+        await rate_limiter.refund()
+        raise
+
+
+profile_cache = ProfileCache(
+    data_dir / "cache.sqlite3",
+    ttl=_env_int("LINKEDIN_SCRAPER_CACHE_TTL", 24 * 60 * 60),
+    stale_ttl=_env_int("LINKEDIN_SCRAPER_CACHE_STALE_SECONDS", 6 * 60 * 60),
+    max_entries=_env_int("LINKEDIN_SCRAPER_CACHE_ENTRIES", 512),
+)
+# Concurrent requests for the same profile share one scrape and one quota charge.
+scrape_flights = SingleFlight()
+# Background refreshes of stale entries charge the daily quota like any scrape, so
+# they stop once only this many scrapes are left for callers that need fresh data.
+refresh_reserve = _env_int("LINKEDIN_SCRAPER_REFRESH_RESERVE", 10)
+# Strong references to running refreshes; the loop only keeps weak ones to tasks.
+revalidations: Set[asyncio.Task] = set()
+
+
+def _profile_view(entry: CacheEntry, *, cached: bool, coalesced: bool = False) -> dict:
+    return {
+        "output": entry.output,
+        "cached": cached,
+        "coalesced": coalesced,
+        "scraped_at": datetime.fromtimestamp(entry.scraped_at, tz=timezone.utc).isoformat(),
+    }
+
+
+async def _scrape_and_cache(
+    key: str, linkedin_url: str, sections: Optional[List[str]]
+) -> Tuple[CacheEntry, bool]:
+    async def scrape() -> CacheEntry:
+        output = await scrape_with_quota(canonical_profile_url(linkedin_url), sections)
+        return await profile_cache.put(key, output)
+
+    return await scrape_flights.do(key, scrape)
+
+
+async def _revalidate(key: str, linkedin_url: str, sections: Optional[List[str]]) -> None:
+    try:
+        remaining = await rate_limiter.remaining()
+        if remaining <= refresh_reserve:
+            logger.info("Background refresh of %s skipped: only %s scrapes left today.", key, remaining)
+            return
+        await _scrape_and_cache(key, linkedin_url, sections)
+    except Exception as exc:
+        logger.info("Background refresh of %s skipped: %s", key, exc)
+
+
+async def fetch_profile(
+    linkedin_url: str, max_age: Optional[int] = None, sections: Optional[List[str]] = None
+) -> dict:
+    """Serve a profile from cache when acceptable, otherwise scrape it.
+
+    Cache hits never touch the daily quota. Stale entries are served while a
+    background scrape refreshes them, unless the caller passed ``max_age``; that
+    scrape is charged to the quota and skipped once ``refresh_reserve`` is reached.
+    Partial scrapes are cached under their own key, but a cached full scrape
+    also answers requests for a subset of sections.
+    """
+    profile_id = canonical_profile_id(linkedin_url)
+    key = f"{profile_id}#{','.join(sections)}" if sections else profile_id
+    entry = await profile_cache.get(key, fallback=profile_id if sections else None)
+    if entry is not None:
+        if max_age is not None:
+            if entry.age <= max_age:
+                return _profile_view(entry, cached=True)
+        elif profile_cache.is_fresh(entry):
+            return _profile_view(entry, cached=True)
+        else:
+            if not scrape_flights.in_flight(key):
+                task = asyncio.create_task(_revalidate(key, linkedin_url, sections))
+                revalidations.add(task)
+                task.add_done_callback(revalidations.discard)
+            return _profile_view(entry, cached=True)
+    entry, shared = await _scrape_and_cache(key, linkedin_url, sections)
+    return _profile_view(entry, cached=False, coalesced=shared)
+
+
+async def run_job(request: dict) -> str:
+    try:
+        profile = await fetch_profile(request["linkedin_url"], request.get("max_age"), request.get("sections"))
+        return profile["output"]
+    except QuotaExceededError as exc:
+        wait_seconds = (exc.reset_at - datetime.now(tz=exc.reset_at.tzinfo)).total_seconds()
+        raise RetryJob(str(exc), delay=max(wait_seconds, 0), count_attempt=False) from exc
+    except SessionUnavailableError as exc:
+        # Busy or re-authenticating sessions are not the job's fault; keep its attempts.
+        raise RetryJob(str(exc), count_attempt=False) from exc
+    except Exception as exc:
+        logger.exception("Job scrape of %s failed.", request["linkedin_url"])
+        raise RetryJob(repr(exc)) from exc
+
+
+def _scrape_error(exc: Exception) -> Tuple[int, Any]:
+    """Map a scrape failure to the HTTP status and detail the API reports for it."""
+    if isinstance(exc, QuotaExceededError):
+        return 429, {"message": str(exc), "next_reset_at": exc.reset_at.isoformat()}
+    if isinstance(exc, SessionUnavailableError):
+        return 503, str(exc)
+    return 500, "Scraping failed. Check server logs."
+
+
+async def _batch_item(
+    index: int,
+    linkedin_url: str,
+    max_age: Optional[int],
+    sections: Optional[List[str]],
+    slots: asyncio.Semaphore,
+) -> dict:
+    item: Dict[str, Any] = {"index": index, "linkedin_url": linkedin_url}
+    async with slots:
+        try:
+            profile = await fetch_profile(linkedin_url, max_age, sections)
+        except Exception as exc:
+            status_code, detail = _scrape_error(exc)
+            if status_code == 500:
+                logger.exception("Unexpected scraping error in batch.")
+            item.update(output=None, error={"status": status_code, "detail": detail})
+            return item
+    item.update(profile, error=None)
+    return item
+
+
+async def _stream_batch(
+    linkedin_urls: List[str], max_age: Optional[int], sections: Optional[List[str]]
+) -> AsyncIterator[str]:
+    slots = asyncio.Semaphore(batch_concurrency)
+    tasks = [
+        asyncio.create_task(_batch_item(index, url, max_age, sections, slots))
+        for index, url in enumerate(linkedin_urls)
+    ]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            yield json.dumps(await finished) + "\n"
+    finally:
+        # The client went away or the stream ended. Items still waiting for a slot
+        # never start; scrapes already running are shielded by ``scrape_flights``,
+        # so they finish, are charged to the quota and are cached for the next caller.
+        for task in tasks:
+            task.cancel()
+
+
+batch_limit = _env_int("LINKEDIN_SCRAPER_BATCH_LIMIT", 100)
+batch_concurrency = max(
+    1,
+    _env_int(
+        "LINKEDIN_SCRAPER_BATCH_CONCURRENCY",
+        session_settings["tab_pool_size"] * max(worker_count, 1),
+    ),
+)
+job_runner = JobRunner(
+    JobStore(data_dir / "jobs.sqlite3"),
+    run_job,
+    concurrency=_env_int("LINKEDIN_SCRAPER_JOB_CONCURRENCY", 3),
+)
+
+
 @app.on_event("startup")
 async def on_startup() -> None:
     await session_manager.start()
     await rate_limiter.start()
+    await profile_cache.open()
+    await job_runner.start()
 
 
 @app.on_event("shutdown")
 async def on_shutdown() -> None:
+    for task in list(revalidations):
+        task.cancel()
+    await asyncio.gather(*revalidations, return_exceptions=True)
+    await job_runner.stop()
+    await profile_cache.close()
     await rate_limiter.stop()
     await session_manager.stop()
 
 
 @app.post("/scrape")
 async def scrape_profile(payload: ScrapeRequest) -> dict:
-    allowed, reset_at = await rate_limiter.try_acquire()
-    if not allowed:
+    sections = _normalize_sections(payload.sections)
+    try:
+        profile = await fetch_profile(str(payload.linkedin_url), payload.max_age, sections)
+    except Exception as exc:
+        status_code, detail = _scrape_error(exc)
+        if status_code == 500:
+            logger.exception("Unexpected scraping error.")
+        raise HTTPException(status_code=status_code, detail=detail) from exc
+    return profile
+
+
+@app.post("/scrape/batch")
+async def scrape_batch(payload: BatchScrapeRequest) -> StreamingResponse:
+    if len(payload.linkedin_urls) > batch_limit:
         raise HTTPException(
-            status_code=429,
-            detail={
-                "message": "Tageslimit erreicht: maximal 50 Profile pro Tag.",
-                "next_reset_at": reset_at.isoformat(),
-            },
+            status_code=422, detail=f"Maximal {batch_limit} Profile pro Batch erlaubt."
         )
-    try:
-        output = await session_manager.scrape_profile(str(payload.linkedin_url))
-    except SessionUnavailableError as exc:
-        await rate_limiter.refund()
-        raise HTTPException(status_code=503, detail=str(exc)) from exc
-    except Exception:
-        await rate_limiter.refund()
-        logger.exception("Unexpected scraping error.")
-        raise HTTPException(status_code=500, detail="Scraping failed. Check server logs.")
-    return {"output": output}
+    sections = _normalize_sections(payload.sections)
+    linkedin_urls = [str(url) for url in payload.linkedin_urls]
+    return StreamingResponse(
+        _stream_batch(linkedin_urls, payload.max_age, sections), media_type="application/x-ndjson"
+    )
+
+
+@app.post("/jobs", status_code=202)
+async def create_job(payload: ScrapeRequest) -> dict:
+    job = await job_runner.submit(
+        {
+            "linkedin_url": str(payload.linkedin_url),
+            "max_age": payload.max_age,
+            "sections": _normalize_sections(payload.sections),
+        }
+    )
+    return job_view(job)
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str) -> dict:
+    job = await job_runner.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job nicht gefunden.")
+    return job_view(job)
 
 
 @app.get("/status")
 async def status() -> dict:
     limiter_state = await rate_limiter.snapshot()
-    return {"available": session_manager.is_available, "rate_limit": limiter_state}
+    return {
+        "available": session_manager.is_available,
+        "rate_limit": limiter_state,
+        "jobs": await job_runner.snapshot(),
+        "cache": profile_cache.snapshot(),
+        "in_flight": scrape_flights.snapshot(),
+        **await session_manager.snapshot(),
+    }
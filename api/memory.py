@@ -0,0 +1,77 @@
+"""Memory limits for long-lived browsers: when a tab or a whole browser is swapped for a fresh one."""
+
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+MB = 1024 * 1024
+
+
+@dataclass
+class RecyclePolicy:
+    """Limits past which a pool tab or a browser is replaced between jobs; ``None`` disables a limit."""
+
+    tab_max_page_loads: Optional[int] = 200
+    tab_max_heap_bytes: Optional[int] = 256 * MB
+    browser_max_page_loads: Optional[int] = 2000
+    browser_max_rss_bytes: Optional[int] = 1536 * MB
+
+    def tab_due(self, page_loads: int, heap_bytes: Optional[int]) -> Optional[str]:
+        """Why a tab should be replaced, or ``None`` while it is within its limits."""
+        if self.tab_max_page_loads is not None and page_loads >= self.tab_max_page_loads:
+            return f"{page_loads} page loads"
+        if self.tab_max_heap_bytes is not None and heap_bytes is not None and heap_bytes >= self.tab_max_heap_bytes:
+            return f"a JS heap of {heap_bytes // MB} MB"
+        return None
+
+    def browser_due(self, page_loads: int, rss_bytes: Optional[int]) -> Optional[str]:
+        """Why a browser should be replaced, or ``None`` while it is within its limits."""
+        if self.browser_max_page_loads is not None and page_loads >= self.browser_max_page_loads:
+            return f"{page_loads} page loads"
+        if self.browser_max_rss_bytes is not None and rss_bytes is not None and rss_bytes >= self.browser_max_rss_bytes:
+            return f"{rss_bytes // MB} MB resident memory"
+        return None
+
+    def snapshot(self) -> dict:
+        return dict(vars(self))
+
+
+def process_tree_rss(pid: int) -> Optional[int]:
+    """Memory of ``pid`` and all its descendants in bytes, or ``None`` without ``/proc``.
+
+    Uses the proportional set size where the kernel reports it, so pages shared
+    between Chromium's processes are not counted once per process.
+    """
+    if not os.path.isdir("/proc"):
+        return None
+    children: Dict[int, List[int]] = {}
+    for name in os.listdir("/proc"):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{name}/stat") as stat_file:
+                stat = stat_file.read()
+        except OSError:
+            continue
+        # The command name may contain spaces, so fields are counted from its closing parenthesis.
+        parent = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(parent, []).append(int(name))
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        total += _process_memory(current)
+        pending.extend(children.get(current, ()))
+    return total
+
+
+def _process_memory(pid: int) -> int:
+    for path, field in ((f"/proc/{pid}/smaps_rollup", "Pss:"), (f"/proc/{pid}/status", "VmRSS:")):
+        try:
+            with open(path) as proc_file:
+                for line in proc_file:
+                    if line.startswith(field):
+                        return int(line.split()[1]) * 1024
+        except OSError:
+            continue
+    return 0
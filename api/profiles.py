@@ -0,0 +1,67 @@
+"""Managed Chrome profile directories: one per worker, locked while a browser uses it."""
+
+import fcntl
+import os
+from pathlib import Path
+from typing import IO, Optional
+
+# Left behind by a Chrome that did not shut down cleanly; they make the next start refuse the profile.
+CHROME_SINGLETON_FILES = ("SingletonLock", "SingletonSocket", "SingletonCookie")
+
+
+class ProfileInUseError(RuntimeError):
+    pass
+
+
+class ManagedProfile:
+    """A Chrome user-data directory that only one process on the host may use at a time.
+
+    The lock is an flock on a file inside the directory. The OS drops it when the
+    owning process exits, so a crashed worker never leaves its profile locked.
+    """
+
+    LOCK_NAME = ".linkedin-scraper.lock"
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._lock_file: Optional[IO[str]] = None
+
+    @property
+    def locked(self) -> bool:
+        return self._lock_file is not None
+
+    @property
+    def has_cookies(self) -> bool:
+        """Whether an earlier browser left a cookie store behind that may hold a session."""
+        default = self.path / "Default"
+        return (default / "Cookies").exists() or (default / "Network" / "Cookies").exists()
+
+    def acquire(self) -> None:
+        if self._lock_file is not None:
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        lock_file = open(self.path / self.LOCK_NAME, "a+")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            raise ProfileInUseError(f"Chrome profile {self.path} is in use by another process.") from None
+        lock_file.truncate(0)
+        lock_file.write(str(os.getpid()))
+        lock_file.flush()
+        self._lock_file = lock_file
+        # Holding the lock means no browser of ours is running on this profile.
+        for name in CHROME_SINGLETON_FILES:
+            try:
+                (self.path / name).unlink()
+            except FileNotFoundError:
+                pass
+
+    def release(self) -> None:
+        if self._lock_file is None:
+            return
+        try:
+            fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+        finally:
+            self._lock_file.close()
+            self._lock_file = None
@@ -0,0 +1,741 @@
+"""Browser session management: one logged-in browser and its pool of tabs."""
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Deque, Dict, List, Optional, Sequence, Set
+
+import zendriver as zd
+from zendriver import cdp
+
+from linkedin_scraper import Person, actions
+from linkedin_scraper.assets import DEFAULT_MAX_BYTES, AssetCache
+from linkedin_scraper.network import ResourcePolicy, ResourceStats
+from linkedin_scraper.pacing import PacingPolicy, PacingTracker
+
+from .memory import RecyclePolicy, process_tree_rss
+from .profiles import ManagedProfile
+
+logger = logging.getLogger("linkedin_scraper.api")
+
+SESSION_SLOTS = ("blue", "green")
+
+# Keep background tabs rendering at full speed while several scrapes share one window.
+TAB_POOL_BROWSER_ARGS = [
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+]
+
+
+class SessionUnavailableError(Exception):
+    """Raised when the browser is busy logging in or restarting."""
+
+
+class PoolExhaustedError(SessionUnavailableError):
+    """Raised when every tab is busy and the wait queue is full or timed out."""
+
+
+class PoolClosedError(SessionUnavailableError):
+    """Raised when the pool was closed before a tab could be handed out."""
+
+
+@dataclass
+class PooledTab:
+    tab: zd.Tab
+    index: int
+    healthy: bool = True
+    in_use: bool = False
+    scrapes: int = 0
+    failures: int = 0
+    last_error: Optional[str] = None
+    page_loads: int = 0
+    heap_bytes: Optional[int] = None
+    recycled: int = 0
+
+    def snapshot(self) -> dict:
+        return {
+            "index": self.index,
+            "healthy": self.healthy,
+            "in_use": self.in_use,
+            "scrapes": self.scrapes,
+            "failures": self.failures,
+            "last_error": self.last_error,
+            "page_loads": self.page_loads,
+            "heap_bytes": self.heap_bytes,
+            "recycled": self.recycled,
+        }
+
+
+class TabPool:
+    """Hands out the logged-in tabs of one browser, one scrape per tab at a time."""
+
+    def __init__(
+        self, *, max_waiters: int = 20, max_failures: int = 3, recycle: Optional[RecyclePolicy] = None
+    ) -> None:
+        self.max_waiters = max_waiters
+        self.max_failures = max_failures
+        self.recycle = recycle
+        self.browser: Optional[zd.Browser] = None
+        self.auth: Optional[actions.AuthState] = None
+        self.tabs: List[PooledTab] = []
+        self.page_loads = 0
+        self.recycled_tabs = 0
+        self.closed = True
+        self._idle: Deque[PooledTab] = deque()
+        self._waiting = 0
+        self._cond = asyncio.Condition()
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def healthy_count(self) -> int:
+        return sum(1 for pooled in self.tabs if pooled.healthy)
+
+    async def open(
+        self, browser: zd.Browser, tabs: Sequence[zd.Tab], auth: Optional[actions.AuthState] = None
+    ) -> None:
+        """Hand out ``tabs``; ``auth`` follows their navigations, and those of their replacements."""
+        async with self._cond:
+            self.browser = browser
+            self.auth = auth
+            self.tabs = [PooledTab(tab=tab, index=index) for index, tab in enumerate(tabs)]
+            for pooled in self.tabs:
+                self._track(pooled)
+            self._idle = deque(self.tabs)
+            self.closed = False
+            self._cond.notify_all()
+
+    async def close(self) -> None:
+        """Stop handing out tabs and wait until in-flight scrapes return theirs."""
+        async with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+            await self._cond.wait_for(lambda: not any(pooled.in_use for pooled in self.tabs))
+            self.tabs = []
+            self._idle.clear()
+            self.browser = None
+
+    @asynccontextmanager
+    async def checkout(self, timeout: Optional[float] = None) -> AsyncIterator[PooledTab]:
+        pooled = await self._acquire(timeout)
+        try:
+            yield pooled
+        except BaseException as exc:
+            if isinstance(exc, Exception):
+                pooled.failures += 1
+                pooled.last_error = repr(exc)
+                await self._check_health(pooled)
+            await self._release(pooled)
+            raise
+        pooled.scrapes += 1
+        pooled.failures = 0
+        if self.recycle is None:
+            await self._release(pooled)
+            return
+        # The caller's response does not wait for the heap check or a tab swap. The
+        # tab stays checked out until both are done, so nobody else gets it meanwhile.
+        task = asyncio.create_task(self._recycle_and_release(pooled))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _recycle_and_release(self, pooled: PooledTab) -> None:
+        try:
+            await self._maybe_recycle(pooled)
+        except Exception:
+            logger.exception("Could not check tab %s for recycling.", pooled.index)
+        finally:
+            await self._release(pooled)
+
+    def _track(self, pooled: PooledTab) -> None:
+        tab = pooled.tab
+
+        def on_navigated(event: cdp.page.FrameNavigated) -> None:
+            if event.frame.parent_id is None and pooled.tab is tab:
+                pooled.page_loads += 1
+                self.page_loads += 1
+
+        tab.add_handler(cdp.page.FrameNavigated, on_navigated)
+        if self.auth is not None:
+            self.auth.watch(tab)
+
+    async def _acquire(self, timeout: Optional[float]) -> PooledTab:
+        async with self._cond:
+            if self.closed:
+                raise PoolClosedError("Anmeldung läuft – bitte kurz warten.")
+            if not self._idle and self._waiting >= self.max_waiters:
+                raise PoolExhaustedError("Alle Browser-Tabs sind belegt – bitte später erneut versuchen.")
+            self._waiting += 1
+            try:
+                await asyncio.wait_for(
+                    self._cond.wait_for(lambda: self.closed or bool(self._idle)), timeout=timeout
+                )
+            except asyncio.TimeoutError as exc:
+                raise PoolExhaustedError("Alle Browser-Tabs sind belegt – bitte später erneut versuchen.") from exc
+            finally:
+                self._waiting -= 1
+            if self.closed:
+                raise PoolClosedError("Anmeldung läuft – bitte kurz warten.")
+            pooled = self._idle.popleft()
+            pooled.in_use = True
+            return pooled
+
+    async def ping_idle(self, timeout: float) -> None:
+        """Evaluate a no-op in every idle tab and replace those whose renderer stopped answering."""
+        async with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+            for pooled in idle:
+                pooled.in_use = True
+        await asyncio.gather(*(self._ping(pooled, timeout) for pooled in idle))
+
+    async def _ping(self, pooled: PooledTab, timeout: float) -> None:
+        try:
+            await asyncio.wait_for(pooled.tab.evaluate("1"), timeout=timeout)
+        except Exception as exc:
+            pooled.failures = self.max_failures
+            pooled.last_error = f"watchdog: {exc!r}"
+            await self._check_health(pooled)
+        finally:
+            await self._release(pooled)
+
+    async def _release(self, pooled: PooledTab) -> None:
+        async with self._cond:
+            pooled.in_use = False
+            if pooled.healthy and not self.closed and pooled in self.tabs:
+                self._idle.append(pooled)
+            self._cond.notify_all()
+
+    async def _check_health(self, pooled: PooledTab) -> None:
+        """Replace a tab that stopped responding or keeps failing."""
+        responsive = True
+        try:
+            await asyncio.wait_for(pooled.tab.evaluate("1"), timeout=5)
+        except Exception:
+            responsive = False
+        if responsive and pooled.failures < self.max_failures:
+            return
+        pooled.healthy = False
+        logger.warning("Replacing unhealthy tab %s after %s failures.", pooled.index, pooled.failures)
+        if await self._replace(pooled):
+            pooled.healthy = True
+            pooled.failures = 0
+
+    async def _maybe_recycle(self, pooled: PooledTab) -> None:
+        """Swap a tab for a fresh one between jobs once it passed the recycle limits."""
+        if self.recycle is None:
+            return
+        if self.recycle.tab_max_heap_bytes is not None:
+            try:
+                usage = await asyncio.wait_for(pooled.tab.send(cdp.runtime.get_heap_usage()), timeout=5)
+                pooled.heap_bytes = int(usage[0])
+            except Exception:
+                pooled.heap_bytes = None
+        reason = self.recycle.tab_due(pooled.page_loads, pooled.heap_bytes)
+        if reason is None:
+            return
+        logger.info("Recycling tab %s after %s.", pooled.index, reason)
+        if await self._replace(pooled):
+            pooled.recycled += 1
+            self.recycled_tabs += 1
+        else:
+            pooled.healthy = False
+
+    async def _replace(self, pooled: PooledTab) -> bool:
+        """Open a fresh tab for ``pooled`` and close the old one; ``False`` if none could be opened."""
+        new_tab = None
+        # The new tab opens first, so the browser never drops to zero tabs and quits.
+        if self.browser and not self.closed:
+            try:
+                new_tab = await actions.open_tab(self.browser)
+            except Exception:
+                logger.exception("Could not open a replacement for tab %s.", pooled.index)
+        if self.auth is not None:
+            self.auth.forget(pooled.tab)
+        try:
+            await pooled.tab.close()
+        except Exception:
+            pass
+        if new_tab is None:
+            return False
+        pooled.tab = new_tab
+        pooled.page_loads = 0
+        pooled.heap_bytes = None
+        self._track(pooled)
+        return True
+
+    async def snapshot(self) -> dict:
+        async with self._cond:
+            return {
+                "size": len(self.tabs),
+                "healthy": self.healthy_count,
+                "idle": len(self._idle),
+                "waiting": self._waiting,
+                "max_waiters": self.max_waiters,
+                "page_loads": self.page_loads,
+                "recycled_tabs": self.recycled_tabs,
+                "tabs": [pooled.snapshot() for pooled in self.tabs],
+            }
+
+
+class BrowserSession:
+    """One logged-in browser and its tab pool; a refresh starts a new one beside it."""
+
+    def __init__(
+        self, slot: str, profile: Optional[ManagedProfile], *, max_waiters: int, recycle: RecyclePolicy
+    ) -> None:
+        self.slot = slot
+        self.profile = profile
+        self.pool = TabPool(max_waiters=max_waiters, recycle=recycle)
+        self.browser: Optional[zd.Browser] = None
+        self.auth = actions.AuthState()
+        self.login_mode: Optional[str] = None
+        self.startup_seconds: Optional[float] = None
+        self.rss_bytes: Optional[int] = None
+
+    def snapshot(self) -> dict:
+        return {
+            "slot": self.slot,
+            "profile": str(self.profile.path) if self.profile else None,
+            "login_mode": self.login_mode,
+            "startup_seconds": round(self.startup_seconds, 3) if self.startup_seconds is not None else None,
+        }
+
+
+class SessionManager:
+    def __init__(
+        self,
+        *,
+        headless: bool = True,
+        launch_profile: str = "default",
+        tab_pool_size: int = 3,
+        max_waiters: int = 20,
+        checkout_timeout: float = 180,
+        drain_timeout: float = 300,
+        scrape_timeout: float = 300,
+        watchdog_interval: float = 15,
+        recycle: Optional[RecyclePolicy] = None,
+        user_data_dir: Optional[str] = None,
+        parallel_details: bool = False,
+        pacing: Optional[PacingPolicy] = None,
+        resource_policy: Optional[ResourcePolicy] = None,
+        asset_cache_dir: Optional[str] = None,
+        asset_cache_max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        if launch_profile not in actions.LAUNCH_PROFILES:
+            raise ValueError(f"Unknown launch profile {launch_profile!r}.")
+        self.headless = headless
+        self.launch_profile = launch_profile
+        self.parallel_details = parallel_details
+        self.pacing = pacing or PacingPolicy()
+        self.pause_seconds: Dict[str, float] = {}
+        self.paced_scrapes = 0
+        self.mouse_events = 0
+        self.resource_policy = resource_policy
+        self.resources_saved = ResourceStats()
+        # Shared with every other worker that points at the same directory.
+        self.asset_cache = (
+            AssetCache(Path(asset_cache_dir), max_bytes=asset_cache_max_bytes) if asset_cache_dir else None
+        )
+        self.user_data_dir = user_data_dir
+        # Two profiles, so a replacement browser can start while the current one still holds its profile.
+        # Each survives restarts, so a refresh can often keep its LinkedIn session instead of logging in.
+        self.profiles: Dict[str, Optional[ManagedProfile]] = {
+            slot: ManagedProfile(Path(user_data_dir) / slot) if user_data_dir else None for slot in SESSION_SLOTS
+        }
+        self.session: Optional[BrowserSession] = None
+        self.retiring: Optional[BrowserSession] = None
+        self.retire_task: Optional[asyncio.Task] = None
+        self.swaps = 0
+        self.tab_pool_size = max(1, tab_pool_size)
+        self.max_waiters = max_waiters
+        self.checkout_timeout = checkout_timeout
+        self.drain_timeout = drain_timeout
+        self.scrape_timeout = scrape_timeout
+        self.watchdog_interval = watchdog_interval
+        self.ping_timeout = 10
+        self.recycle = recycle or RecyclePolicy()
+        self.recycle_task: Optional[asyncio.Task] = None
+        self.browser_recycles = 0
+        self.watchdog_task: Optional[asyncio.Task] = None
+        self.recovery_task: Optional[asyncio.Task] = None
+        self.restarts = 0
+        self.failed_restarts = 0
+        self.retried_scrapes = 0
+        self.last_failure: Optional[str] = None
+        self.last_recovery_seconds: Optional[float] = None
+        self._next_restart_at = 0.0
+        self.available: bool = False
+        self.lock = asyncio.Lock()
+        self.refresh_lock = asyncio.Lock()
+        self.stop_event = asyncio.Event()
+        self.refresh_task: Optional[asyncio.Task] = None
+        self.relogin_task: Optional[asyncio.Task] = None
+        self.refresh_min_seconds = 30 * 60
+        self.refresh_max_seconds = 90 * 60
+
+    @property
+    def is_available(self) -> bool:
+        return self.available and self.session is not None and self.session.pool.healthy_count > 0
+
+    async def start(self) -> None:
+        if self.asset_cache:
+            await asyncio.to_thread(self.asset_cache.open)
+        try:
+            await self.refresh_session()
+        except Exception:
+            logger.exception("Failed to log into LinkedIn on startup.")
+            raise
+        self.refresh_task = asyncio.create_task(self._refresh_loop())
+        self.watchdog_task = asyncio.create_task(self._watchdog_loop())
+
+    async def refresh_session(self) -> None:
+        """Log in a replacement browser while the current one keeps serving, then swap them.
+
+        Only the swap holds the lock: the watchdog can recover a session that fails
+        while the replacement logs in, and the new one while the old one drains.
+        Refreshes run one at a time.
+        """
+        async with self.refresh_lock:
+            if self.retire_task is not None:
+                # The replacement takes the slot retired last time, whose profile must be free again.
+                await asyncio.shield(self.retire_task)
+            # A recovery restarts the current session on its own slot, so the other slot stays free.
+            current = self.session
+            slot = SESSION_SLOTS[1] if current is not None and current.slot == SESSION_SLOTS[0] else SESSION_SLOTS[0]
+            logger.info("Starting browser session %s...", slot)
+            replacement = await self._open_session(slot)
+            async with self.lock:
+                # Retire whatever serves now, which may be a session recovered in the meantime.
+                current = self.session
+                # Scrapes check out from self.session, so from here on they land on the replacement.
+                self.session = replacement
+                self.available = True
+                logger.info(
+                    "Session %s logged in (%s) in %.1fs; API ready.",
+                    slot,
+                    replacement.login_mode,
+                    replacement.startup_seconds,
+                )
+                if current is None:
+                    return
+                self.swaps += 1
+                self.retiring = current
+                retire_task = self.retire_task = asyncio.create_task(self._retire(current))
+        await asyncio.shield(retire_task)
+
+    async def _open_session(self, slot: str) -> BrowserSession:
+        session = BrowserSession(slot, self.profiles[slot], max_waiters=self.max_waiters, recycle=self.recycle)
+        started = time.monotonic()
+        try:
+            if session.profile:
+                await asyncio.to_thread(session.profile.acquire)
+            await self._start_browser_and_login(session)
+        except BaseException:
+            await self._close_session(session)
+            raise
+        session.startup_seconds = time.monotonic() - started
+        return session
+
+    async def _start_browser_and_login(self, session: BrowserSession) -> None:
+        browser_args = TAB_POOL_BROWSER_ARGS if self.tab_pool_size > 1 else None
+        config = actions.build_browser_config(
+            headless=self.headless,
+            user_data_dir=str(session.profile.path) if session.profile else None,
+            browser_args=browser_args,
+            resource_policy=self.resource_policy,
+            asset_cache=self.asset_cache,
+            launch_profile=self.launch_profile,
+        )
+        browser = await actions.start_browser(config)
+        session.browser = browser
+        tab = await browser.get("https://www.linkedin.com/")
+        if session.profile and session.profile.has_cookies and await session.auth.check(tab, timeout=10):
+            session.login_mode = "reused"
+        else:
+            tab = await actions.login(tab, timeout=20, pacing=self.pacing)
+            session.browser = tab.browser or browser
+            session.auth = actions.AuthState()
+            if not await session.auth.check(tab, timeout=20):
+                raise RuntimeError("LinkedIn login did not reach a signed-in page.")
+            session.login_mode = "login"
+        tabs = [tab]
+        # Extra tabs share the logged-in browser's cookies, so they need no login of their own.
+        for _ in range(self.tab_pool_size - 1):
+            tabs.append(await actions.open_tab(session.browser))
+        await session.pool.open(session.browser, tabs, auth=session.auth)
+
+    async def _retire(self, session: BrowserSession) -> None:
+        """Let the scrapes still running on a replaced session finish, then stop its browser."""
+        try:
+            await asyncio.wait_for(session.pool.close(), timeout=self.drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Scrapes on session %s still running after %ss; stopping it anyway.", session.slot, self.drain_timeout
+            )
+        finally:
+            await self._close_session(session)
+            if self.retiring is session:
+                self.retiring = None
+        logger.info("Session %s drained and stopped.", session.slot)
+
+    async def _close_session(self, session: BrowserSession) -> None:
+        if session.browser:
+            try:
+                await session.browser.stop()
+            except Exception as exc:
+                logger.warning("Error while stopping browser: %s", exc)
+            session.browser = None
+        if session.profile:
+            session.profile.release()
+
+    async def _refresh_loop(self) -> None:
+        while not self.stop_event.is_set():
+            wait_seconds = random.randint(self.refresh_min_seconds, self.refresh_max_seconds)
+            try:
+                await asyncio.wait_for(self.stop_event.wait(), timeout=wait_seconds)
+                break
+            except asyncio.TimeoutError:
+                pass
+            try:
+                logger.info("Refreshing LinkedIn session...")
+                await self.refresh_session()
+            except Exception:
+                # The current session was never taken down, so it keeps serving.
+                logger.exception("Failed to refresh session; keeping the current one until the next attempt.")
+
+    async def _watchdog_loop(self) -> None:
+        while not self.stop_event.is_set():
+            try:
+                await asyncio.wait_for(self.stop_event.wait(), timeout=self.watchdog_interval)
+                break
+            except asyncio.TimeoutError:
+                pass
+            session = self.session
+            if session is None or (self.recovery_task and not self.recovery_task.done()):
+                continue
+            failure = await self._browser_failure(session)
+            if failure is None:
+                await session.pool.ping_idle(self.ping_timeout)
+                if session.pool.healthy_count == 0:
+                    failure = "no tab answers anymore"
+            if failure is not None:
+                self._request_recovery(session, failure)
+            else:
+                await self._check_memory(session)
+
+    async def _browser_failure(self, session: BrowserSession) -> Optional[str]:
+        """Why the session's browser is dead or hung, or ``None`` if it answers a CDP ping."""
+        browser = session.browser
+        if browser is None:
+            return "browser is not running"
+        # zendriver keeps the Chromium Popen private; a missing attribute just skips this check.
+        process = getattr(browser, "_process", None)
+        exit_code = process.poll() if process is not None else None
+        if exit_code is not None:
+            return f"browser exited with code {exit_code}"
+        try:
+            await asyncio.wait_for(browser.connection.send(cdp.browser.get_version()), timeout=self.ping_timeout)
+        except Exception as exc:
+            return f"CDP ping failed: {exc!r}"
+        return None
+
+    async def _check_memory(self, session: BrowserSession) -> None:
+        """Sample the browser's memory and replace it blue/green once it passed the recycle limits."""
+        process = getattr(session.browser, "_process", None)
+        pid = getattr(process, "pid", None)
+        session.rss_bytes = await asyncio.to_thread(process_tree_rss, pid) if pid else None
+        reason = self.recycle.browser_due(session.pool.page_loads, session.rss_bytes)
+        if reason is None or self.refresh_lock.locked() or (self.recycle_task and not self.recycle_task.done()):
+            return
+        logger.info("Recycling browser session %s after %s.", session.slot, reason)
+        self.recycle_task = asyncio.create_task(self._recycle_browser())
+
+    async def _recycle_browser(self) -> None:
+        try:
+            await self.refresh_session()
+        except Exception:
+            logger.exception("Failed to recycle the browser; keeping the current one.")
+            return
+        self.browser_recycles += 1
+
+    def _request_recovery(self, session: BrowserSession, failure: str) -> Optional[asyncio.Task]:
+        if self.recovery_task is None or self.recovery_task.done():
+            if time.monotonic() < self._next_restart_at:
+                return None
+            self.recovery_task = asyncio.create_task(self._recover(session, failure, time.monotonic()))
+        return self.recovery_task
+
+    async def _recover(self, session: BrowserSession, failure: str, detected_at: float) -> None:
+        """Replace a crashed or hung browser with a new one on the same profile."""
+        async with self.lock:
+            if self.session is not session:
+                return
+            self.available = False
+            self.last_failure = failure
+            logger.error("Browser session %s failed (%s); restarting it.", session.slot, failure)
+            # Stopping the browser first makes scrapes still running on it fail fast.
+            await self._close_session(session)
+            try:
+                await asyncio.wait_for(session.pool.close(), timeout=self.ping_timeout)
+            except asyncio.TimeoutError:
+                pass
+            try:
+                replacement = await self._open_session(session.slot)
+            except Exception:
+                self.failed_restarts += 1
+                backoff = min(60 * 2 ** (self.failed_restarts - 1), 900)
+                self._next_restart_at = time.monotonic() + backoff
+                logger.exception("Could not restart browser session %s; next attempt in %ss.", session.slot, backoff)
+                return
+            self.session = replacement
+            self.available = True
+            self.restarts += 1
+            self.failed_restarts = 0
+            self.last_recovery_seconds = time.monotonic() - detected_at
+            logger.info(
+                "Session %s restarted (%s); recovered in %.1fs.",
+                replacement.slot,
+                replacement.login_mode,
+                self.last_recovery_seconds,
+            )
+
+    def _schedule_relogin(self) -> None:
+        if self.relogin_task is None or self.relogin_task.done():
+            self.relogin_task = asyncio.create_task(self._relogin())
+
+    async def _relogin(self) -> None:
+        try:
+            await self.refresh_session()
+        except Exception:
+            self.available = False
+            logger.exception("Failed to log in again; API paused until the next refresh.")
+
+    async def scrape_profile(self, linkedin_url: str, sections: Optional[Sequence[str]] = None) -> str:
+        retried = False
+        while True:
+            session = self.session
+            if session is None or not self.is_available:
+                raise SessionUnavailableError("Anmeldung läuft – bitte kurz warten.")
+            try:
+                return await self._scrape_on(session, linkedin_url, sections)
+            except PoolClosedError:
+                # The session was swapped out while this request waited for a tab; use its replacement.
+                if self.session is session:
+                    raise
+            except SessionUnavailableError:
+                raise
+            except Exception:
+                if retried:
+                    raise
+                failure = await self._browser_failure(session)
+                if failure is None:
+                    raise
+                recovery = self._request_recovery(session, failure)
+                if recovery is None:
+                    raise
+                # Shielded, so a client that goes away does not cancel the restart for everyone else.
+                await asyncio.shield(recovery)
+                retried = True
+                self.retried_scrapes += 1
+
+    async def _scrape_on(self, session: BrowserSession, linkedin_url: str, sections: Optional[Sequence[str]]) -> str:
+        async with session.pool.checkout(timeout=self.checkout_timeout) as pooled:
+            person = Person(
+                linkedin_url,
+                driver=pooled.tab,
+                scrape=False,
+                close_on_complete=False,
+                sections=sections,
+                parallel_details=self.parallel_details,
+                auth_state=session.auth,
+                pacing=self.pacing,
+            )
+            try:
+                # A hung CDP call would otherwise hold the tab forever.
+                await asyncio.wait_for(person.scrape_async(close_on_complete=False), timeout=self.scrape_timeout)
+            finally:
+                self._record_pauses(person.pacing)
+                self.resources_saved.add(person.resources_saved)
+            if session.auth.signed_in is False:
+                if self.session is session:
+                    logger.warning(
+                        "LinkedIn session was signed out (%s); logging in again.", session.auth.last_logged_out_url
+                    )
+                    self.available = False
+                    self._schedule_relogin()
+                raise SessionUnavailableError("Anmeldung läuft – bitte kurz warten.")
+            return str(person)
+
+    def _record_pauses(self, tracker: PacingTracker) -> None:
+        self.paced_scrapes += 1
+        self.mouse_events += tracker.mouse_events
+        for name, seconds in tracker.seconds.items():
+            self.pause_seconds[name] = self.pause_seconds.get(name, 0.0) + seconds
+
+    async def snapshot(self) -> dict:
+        session = self.session
+        retiring = self.retiring
+        return {
+            "tab_pool": await session.pool.snapshot() if session else None,
+            "auth": session.auth.snapshot() if session else None,
+            "session": {
+                **(session.snapshot() if session else {}),
+                "swaps": self.swaps,
+                "draining": await retiring.pool.snapshot() if retiring else None,
+            },
+            "memory": {
+                "browser_rss_bytes": session.rss_bytes if session else None,
+                "browser_recycles": self.browser_recycles,
+                "limits": self.recycle.snapshot(),
+            },
+            "watchdog": {
+                "restarts": self.restarts,
+                "failed_restarts": self.failed_restarts,
+                "retried_scrapes": self.retried_scrapes,
+                "last_failure": self.last_failure,
+                "last_recovery_seconds": (
+                    round(self.last_recovery_seconds, 3) if self.last_recovery_seconds is not None else None
+                ),
+            },
+            "resources_saved": (
+                self.resources_saved.snapshot() if self.resource_policy or self.asset_cache else None
+            ),
+            "asset_cache": await asyncio.to_thread(self.asset_cache.snapshot) if self.asset_cache else None,
+            "pacing": {
+                "scrapes": self.paced_scrapes,
+                "budget": self.pacing.budget,
+                "mouse_events": self.mouse_events,
+                "seconds_by_pause": {name: round(seconds, 3) for name, seconds in self.pause_seconds.items()},
+            },
+        }
+
+    async def stop(self) -> None:
+        self.stop_event.set()
+        tasks = (
+            self.refresh_task,
+            self.relogin_task,
+            self.watchdog_task,
+            self.recovery_task,
+            self.recycle_task,
+            self.retire_task,
+        )
+        for task in tasks:
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        async with self.lock:
+            self.available = False
+            if self.session:
+                await self.session.pool.close()
+                await self._close_session(self.session)
+                self.session = None
+        if self.asset_cache:
+            await asyncio.to_thread(self.asset_cache.close)
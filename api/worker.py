@@ -0,0 +1,73 @@
+"""Entry point for a browser worker process started by the API's WorkerDispatcher."""
+
+import asyncio
+import logging
+from typing import Any, List, Optional, Set
+
+from .session import PoolExhaustedError, SessionManager, SessionUnavailableError
+
+logger = logging.getLogger("linkedin_scraper.api")
+
+STATE_INTERVAL_SECONDS = 2
+
+
+def run_worker(worker_id: int, settings: dict, inbox: Any, outbox: Any) -> None:
+    """Run one SessionManager on its own event loop until the dispatcher sends ``None``."""
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_serve(worker_id, settings, inbox, outbox))
+
+
+async def _serve(worker_id: int, settings: dict, inbox: Any, outbox: Any) -> None:
+    manager = SessionManager(**settings)
+    outbox.put(("state", worker_id, False, {}))
+    # A failed login ends the process; the dispatcher restarts it after a backoff.
+    await manager.start()
+    state_task = asyncio.create_task(_report_state(worker_id, manager, outbox))
+    loop = asyncio.get_running_loop()
+    jobs: Set[asyncio.Task] = set()
+    try:
+        while True:
+            message: Optional[tuple] = await loop.run_in_executor(None, inbox.get)
+            if message is None:
+                break
+            job_id, linkedin_url, sections = message
+            task = asyncio.create_task(_run_job(worker_id, manager, outbox, job_id, linkedin_url, sections))
+            jobs.add(task)
+            task.add_done_callback(jobs.discard)
+    finally:
+        state_task.cancel()
+        outbox.put(("state", worker_id, False, {}))
+        await manager.stop()
+        if jobs:
+            await asyncio.gather(*jobs, return_exceptions=True)
+
+
+async def _report_state(worker_id: int, manager: SessionManager, outbox: Any) -> None:
+    while True:
+        try:
+            snapshot = await manager.snapshot()
+        except Exception:
+            snapshot = {}
+        outbox.put(("state", worker_id, manager.is_available, snapshot))
+        await asyncio.sleep(STATE_INTERVAL_SECONDS)
+
+
+async def _run_job(
+    worker_id: int,
+    manager: SessionManager,
+    outbox: Any,
+    job_id: str,
+    linkedin_url: str,
+    sections: Optional[List[str]],
+) -> None:
+    try:
+        output = await manager.scrape_profile(linkedin_url, sections=sections)
+    except PoolExhaustedError as exc:
+        outbox.put(("result", worker_id, job_id, "pool_exhausted", str(exc)))
+    except SessionUnavailableError as exc:
+        outbox.put(("result", worker_id, job_id, "unavailable", str(exc)))
+    except Exception as exc:
+        logger.exception("Worker %s failed to scrape %s.", worker_id, linkedin_url)
+        outbox.put(("result", worker_id, job_id, "error", repr(exc)))
+    else:
+        outbox.put(("result", worker_id, job_id, None, output))
@@ -5,14 +5,21 @@ import random
 import time
 import math
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 import json
+import uuid
+import weakref
+from urllib.parse import urlsplit
 
 import zendriver as zd
 from zendriver import cdp
 
 from . import constants as c
 from .by import By
+from . import network, runner
+from .assets import AssetCache
+from .network import ResourcePolicy, tab_key
+from .pacing import PacingPolicy, PacingTracker
 
 COOKIE_ENV_KEY = "LINKEDIN_LI_AT"
 EMAIL_ENV_KEY = "LINKEDIN_USER"
@@ -33,6 +40,216 @@ DEFAULT_BROWSER_ARGS = [
     "--disable-extensions",
     "--disable-blink-features=AutomationControlled",
 ]
+# For packing many workers onto one host: fewer renderer processes, no background
+# traffic or updates, small caches. Stacked on top of DEFAULT_BROWSER_ARGS.
+LEAN_BROWSER_ARGS = [
+    "--renderer-process-limit=2",
+    "--disable-site-isolation-trials",
+    "--disable-features=Translate,OptimizationHints,MediaRouter,BackForwardCache,AutofillServerCommunication",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-domain-reliability",
+    "--disable-client-side-phishing-detection",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-breakpad",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--disk-cache-size=33554432",
+    "--js-flags=--max-old-space-size=512",
+]
+LAUNCH_PROFILES = {
+    "default": {"args": [], "window_size": (1200, 1920, 800, 1080)},
+    "lean": {"args": LEAN_BROWSER_ARGS, "window_size": (1280, 1366, 720, 800)},
+}
+# Pause before re-installing an element watcher that was lost, e.g. to a navigation.
+WAIT_RETRY_INTERVAL = 0.25
+
+# Resolves with the index of the first locator that matches under ``root``, -1 when
+# ``timeoutMs`` runs out, or -2 when cancelled through window.__linkedinScraperWaits.
+_WAIT_FOR_LOCATORS_JS = """
+(root, locators, timeoutMs, token) => new Promise((resolve) => {
+    const scope = root || document;
+    // XPaths can leave the scope ("//x", "(//x)[1]", ".."); only nodes inside it count.
+    const inScope = (xpath) => {
+        const result = document.evaluate(xpath, scope, null, XPathResult.ORDERED_NODE_ITERATOR_TYPE, null);
+        for (let node = result.iterateNext(); node; node = result.iterateNext()) {
+            if (node.nodeType === Node.ELEMENT_NODE && scope.contains(node)) return true;
+        }
+        return false;
+    };
+    const match = () => {
+        for (let i = 0; i < locators.length; i++) {
+            const { css, xpath } = locators[i];
+            try {
+                if (css && scope.querySelector(css)) return i;
+                if (xpath && inScope(xpath)) return i;
+            } catch (e) {}
+        }
+        return -1;
+    };
+    const waits = (window.__linkedinScraperWaits = window.__linkedinScraperWaits || {});
+    let observer = null;
+    let timer = null;
+    const finish = (index) => {
+        if (observer) observer.disconnect();
+        clearTimeout(timer);
+        delete waits[token];
+        resolve(index);
+    };
+    const found = match();
+    if (found !== -1) {
+        finish(found);
+        return;
+    }
+    observer = new MutationObserver(() => {
+        const index = match();
+        if (index !== -1) finish(index);
+    });
+    observer.observe(scope === document ? document.documentElement : scope, {
+        childList: true,
+        subtree: true,
+        attributes: true,
+    });
+    timer = setTimeout(() => finish(-1), timeoutMs);
+    waits[token] = () => finish(-2);
+})
+"""
+
+
+# Returns the match count of every locator under ``root`` followed by the matched
+# nodes in locator order, without touching the page. XPath results are filtered to
+# ``root`` and its descendants, whatever the expression's form.
+_MATCH_NODES_JS = """
+function (root, locators) {
+    const scope = root || document;
+    const counts = [];
+    const matches = [];
+    for (const { css, xpath } of locators) {
+        let nodes = [];
+        try {
+            if (css) {
+                nodes = Array.from(scope.querySelectorAll(css));
+            } else if (xpath) {
+                const result = document.evaluate(
+                    xpath, scope, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+                );
+                for (let i = 0; i < result.snapshotLength; i++) nodes.push(result.snapshotItem(i));
+                nodes = nodes.filter(node => scope.contains(node));
+            }
+        } catch (e) {}
+        nodes = nodes.filter(node => node.nodeType === Node.ELEMENT_NODE);
+        counts.push(nodes.length);
+        matches.push(...nodes);
+    }
+    return counts.concat(matches);
+}
+"""
+_MATCH_OBJECT_GROUP = "linkedin-scraper-match"
+
+
+COOKIE_REJECT_LABELS = [
+    "reject",
+    "reject all",
+    "decline",
+    "decline all",
+    "refuse",
+    "ablehnen",
+    "alle ablehnen",
+    "nicht zustimmen",
+    "keine zustimmung",
+    "nur notwendige",
+    "nur erforderliche",
+    "nur notwendige cookies",
+    "essential only",
+    "only essential",
+    "necessary only",
+    "strictly necessary",
+    "reject non-essential",
+]
+COOKIE_MANAGE_LABELS = [
+    "manage preferences",
+    "manage settings",
+    "manage choices",
+    "präferenzen verwalten",
+    "einstellungen verwalten",
+    "auswahl verwalten",
+]
+COOKIE_BANNER_CONTAINERS = ", ".join(
+    [
+        "#artdeco-global-alert-container",
+        ".artdeco-global-alert",
+        "#onetrust-banner-sdk",
+        "#onetrust-pc-sdk",
+        "[id*='cookie' i]",
+        "[class*='cookie' i]",
+        "[id*='consent' i]",
+        "[class*='consent' i]",
+        "[aria-label*='cookie' i]",
+    ]
+)
+
+# Looks for a consent banner once the page has loaded and clicks the best button in it.
+# Returns "none" (no banner), "dismissed", "manage" (opened the preferences) or
+# "pending" (banner without a usable button yet).
+_COOKIE_BANNER_JS = """
+(async (rejectLabels, manageLabels, containerSelector, timeoutMs) => {
+    if (document.readyState !== 'complete') {
+        await new Promise((resolve) => {
+            const timer = setTimeout(resolve, timeoutMs);
+            window.addEventListener('load', () => { clearTimeout(timer); resolve(); }, { once: true });
+        });
+    }
+    const visible = (el) => {
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0;
+    };
+    const texts = (el) => [el.innerText || el.textContent || '', el.getAttribute('aria-label') || '']
+        .map(text => text.replace(/\\s+/g, ' ').trim().toLowerCase())
+        .filter(Boolean);
+    const containers = Array.from(document.querySelectorAll(containerSelector)).filter(visible);
+    if (!containers.length) return 'none';
+    const buttons = containers
+        .flatMap(container => Array.from(container.querySelectorAll('button, [role="button"], a')))
+        .filter(visible);
+    const find = (labels) => {
+        for (const exact of [true, false]) {
+            for (const button of buttons) {
+                const candidates = texts(button);
+                if (labels.some(label => candidates.some(text => exact ? text === label : text.includes(label)))) {
+                    return button;
+                }
+            }
+        }
+        return null;
+    };
+    const reject = find(rejectLabels);
+    if (reject) {
+        reject.click();
+        return 'dismissed';
+    }
+    const manage = find(manageLabels);
+    if (manage) {
+        manage.click();
+        return 'manage';
+    }
+    const close = containers
+        .map(container => container.querySelector(
+            "#artdeco-global-alert-container__action-dismiss, [data-test-modal-close-btn],"
+            + " button[aria-label*='dismiss' i], button[aria-label*='close' i], button[aria-label*='schließen' i]"
+        ))
+        .find(Boolean);
+    if (close) {
+        close.click();
+        return 'dismissed';
+    }
+    return 'pending';
+})
+"""
+# Browsers whose consent banner was already answered; their later page loads skip the check.
+_consent_handled: "weakref.WeakSet[zd.Browser]" = weakref.WeakSet()
 
 
 def _random_window_size(
@@ -56,7 +273,22 @@ async def start_browser(config: Optional[zd.Config] = None, **kwargs) -> zd.Brow
     """Thin wrapper around zendriver.start with sensible defaults."""
     if config is None:
         config = build_browser_config(**kwargs)
-    return await zd.start(config)
+    browser = await zd.start(config)
+    runner.track(browser)
+    resource_policy = getattr(config, "resource_policy", None)
+    asset_cache = getattr(config, "asset_cache", None)
+    if resource_policy is not None or asset_cache is not None:
+        await network.install(browser, resource_policy, asset_cache)
+    return browser
+
+
+async def open_tab(browser: zd.Browser, url: str = "about:blank") -> zd.Tab:
+    """Open a new tab that follows the browser's request interception from its first request."""
+    tab = await browser.get("about:blank", new_tab=True)
+    await network.attach(tab)
+    if url != "about:blank":
+        tab = await tab.get(url)
+    return tab
 
 
 def build_browser_config(
@@ -65,41 +297,79 @@ def build_browser_config(
     browser_executable_path: Optional[str] = None,
     browser_args: Optional[Sequence[str]] = None,
     lang: Optional[str] = None,
+    resource_policy: Optional[ResourcePolicy] = None,
+    asset_cache: Optional[AssetCache] = None,
+    launch_profile: str = "default",
 ) -> zd.Config:
+    """Build a zendriver config; ``launch_profile`` picks a set of ``LAUNCH_PROFILES`` flags."""
+    if launch_profile not in LAUNCH_PROFILES:
+        raise ValueError(f"Unknown launch profile {launch_profile!r}; expected one of {', '.join(LAUNCH_PROFILES)}.")
+    profile = LAUNCH_PROFILES[launch_profile]
+    args = list(browser_args or [])
+    for arg in (*DEFAULT_BROWSER_ARGS, *profile["args"]):
+        if arg not in args:
+            args.append(arg)
+    if not any(arg.startswith("--window-size") for arg in args):
+        width, height = _random_window_size(*profile["window_size"])
+        args.append(f"--window-size={width},{height}")
+    # zendriver adds --user-agent itself from Config.user_agent.
+    user_agent = next((arg.split("=", 1)[1] for arg in args if arg.startswith("--user-agent=")), None) or None
+    args = [arg for arg in args if not arg.startswith("--user-agent=")]
+    if user_agent is None:
+        user_agent = HEADLESS_USER_AGENT if headless else DEFAULT_USER_AGENT
+    # Config.browser_args only returns a copy, so the complete list goes in here.
     config = zd.Config(
         user_data_dir=user_data_dir,
         headless=headless,
         browser_executable_path=browser_executable_path,
-        browser_args=list(browser_args) if browser_args else None,
+        browser_args=_merge_feature_switches(args),
         lang=lang,
+        user_agent=user_agent,
     )
-    if config.browser_args is None:
-        config.browser_args = []
-    for arg in DEFAULT_BROWSER_ARGS:
-        if arg not in config.browser_args:
-            config.browser_args.append(arg)
-    if not any(arg.startswith("--window-size") for arg in config.browser_args):
-        width, height = _random_window_size()
-        config.browser_args.append(f"--window-size={width},{height}")
-    user_agent = config.user_agent
-    if user_agent is None:
-        existing_ua_arg = next((arg for arg in config.browser_args if arg.startswith("--user-agent=")), None)
-        if existing_ua_arg:
-            user_agent = existing_ua_arg.split("=", 1)[1] or None
-    if user_agent is None:
-        user_agent = HEADLESS_USER_AGENT if headless else DEFAULT_USER_AGENT
-    config.user_agent = user_agent
-    if not any(arg.startswith("--user-agent=") for arg in config.browser_args):
-        config.browser_args.append(f"--user-agent={user_agent}")
+    # zd.Config has no fields for these; start_browser() picks them up from here.
+    config.resource_policy = resource_policy
+    config.asset_cache = asset_cache
+    config.launch_profile = launch_profile
     return config
 
 
+def _merge_feature_switches(args: Sequence[str]) -> List[str]:
+    """Fold repeated --disable-features/--enable-features into one; Chrome only reads the last one."""
+    merged: List[str] = []
+    features: Dict[str, List[str]] = {}
+    for arg in args:
+        switch, _, value = arg.partition("=")
+        if switch in ("--disable-features", "--enable-features"):
+            if switch not in features:
+                features[switch] = []
+                merged.append(switch)
+            features[switch].extend(name for name in value.split(",") if name and name not in features[switch])
+        else:
+            merged.append(arg)
+    return [f"{arg}={','.join(features[arg])}" if arg in features else arg for arg in merged]
+
+
 # Backwards-compat alias for callers expecting the old Selenium helper name.
 def build_chrome_options(headless: bool = False) -> zd.Config:
     return build_browser_config(headless=headless)
 
 
+# Last known viewport per tab, dropped when the tab's frame is resized or the tab
+# is garbage collected (which also frees an ``id(tab)`` key for reuse).
+_VIEWPORT_CACHE_SIZE = 256
+_viewports: Dict[Any, Tuple[int, int]] = {}
+_viewport_watched: Dict[Any, weakref.finalize] = {}
+
+
+def _forget_viewport(key: Any) -> None:
+    _viewports.pop(key, None)
+    _viewport_watched.pop(key, None)
+
+
 async def _viewport_size(tab: zd.Tab) -> tuple[int, int]:
+    key = tab_key(tab)
+    if key in _viewports:
+        return _viewports[key]
     result = await tab.evaluate(
         "[Math.max(document.documentElement.clientWidth, window.innerWidth || 0),"
         " Math.max(document.documentElement.clientHeight, window.innerHeight || 0)]"
@@ -107,107 +377,172 @@ async def _viewport_size(tab: zd.Tab) -> tuple[int, int]:
     try:
         width = int(result[0] or 0)
         height = int(result[1] or 0)
-        return width, height
     except Exception:
         return 0, 0
+    if width > 0 and height > 0:
+        if key not in _viewport_watched:
+            _viewport_watched[key] = weakref.finalize(tab, _forget_viewport, key)
+            tab.add_handler(cdp.page.FrameResized, lambda _event: _viewports.pop(key, None))
+        if len(_viewports) >= _VIEWPORT_CACHE_SIZE:
+            _viewports.pop(next(iter(_viewports)))
+        _viewports[key] = (width, height)
+    return width, height
 
 
-async def _random_mouse_movements(tab: Optional[zd.Tab], move_count: int = 0) -> None:
-    """Jitter the mouse around the page using curved (Bezier) mouse paths."""
-    if tab is None:
-        return
+def _bezier_points(
+    sx: int, sy: int, ex: int, ey: int, width: int, height: int, segments: int = 12
+) -> list[tuple[int, int]]:
+    """Generate points along a cubic Bezier curve clamped to the viewport."""
+    if segments <= 0:
+        return []
+    dx = ex - sx
+    dy = ey - sy
+    distance = math.hypot(dx, dy) or 1.0
+    curve_mag = distance * random.uniform(0.1, 0.35)
+    norm_x = dx / distance
+    norm_y = dy / distance
+    orth_x = -norm_y
+    orth_y = norm_x
+    cp1 = (
+        sx + dx * 0.3 + orth_x * curve_mag * random.uniform(0.5, 1.2),
+        sy + dy * 0.3 + orth_y * curve_mag * random.uniform(0.5, 1.2),
+    )
+    cp2 = (
+        sx + dx * 0.7 - orth_x * curve_mag * random.uniform(0.5, 1.2),
+        sy + dy * 0.7 - orth_y * curve_mag * random.uniform(0.5, 1.2),
+    )
+    points: list[tuple[int, int]] = []
+    for i in range(1, segments + 1):
+        t = i / segments
+        inv = 1 - t
+        x = inv**3 * sx + 3 * inv**2 * t * cp1[0] + 3 * inv * t**2 * cp2[0] + t**3 * ex
+        y = inv**3 * sy + 3 * inv**2 * t * cp1[1] + 3 * inv * t**2 * cp2[1] + t**3 * ey
+        clamped_x = max(1, min(int(round(x)), max(width - 1, 1)))
+        clamped_y = max(1, min(int(round(y)), max(height - 1, 1)))
+        points.append((clamped_x, clamped_y))
+    return points
+
+
+async def _random_mouse_movements(
+    tab: Optional[zd.Tab],
+    move_count: int = 0,
+    max_events: Optional[int] = None,
+    max_seconds: Optional[float] = None,
+) -> int:
+    """Jitter the mouse around the page using curved (Bezier) mouse paths.
+
+    The whole path is computed up front and its mouse events are sent pipelined,
+    so one jitter costs about one CDP round trip. The time a person would take
+    to move along the path is then spent in a single sleep, cut short after
+    ``max_seconds``. Returns the number of mouse events sent, at most ``max_events``.
+    """
+    if tab is None or (max_events is not None and max_events <= 0):
+        return 0
 
     if move_count <= 0:
         move_count = random.randint(2, 5)
 
     width, height = await _viewport_size(tab)
     if width <= 0 or height <= 0:
-        return
+        return 0
 
-    start_x = random.randint(1, max(width - 1, 1))
-    start_y = random.randint(1, max(height - 1, 1))
-    await tab.mouse_move(start_x, start_y, steps=3)
-
-    def _bezier_points(sx: int, sy: int, ex: int, ey: int, segments: int = 12) -> list[tuple[int, int]]:
-        """Generate points along a cubic Bezier curve clamped to the viewport."""
-        if segments <= 0:
-            return []
-        dx = ex - sx
-        dy = ey - sy
-        distance = math.hypot(dx, dy) or 1.0
-        curve_mag = distance * random.uniform(0.1, 0.35)
-        norm_x = dx / distance
-        norm_y = dy / distance
-        orth_x = -norm_y
-        orth_y = norm_x
-        cp1 = (
-            sx + dx * 0.3 + orth_x * curve_mag * random.uniform(0.5, 1.2),
-            sy + dy * 0.3 + orth_y * curve_mag * random.uniform(0.5, 1.2),
-        )
-        cp2 = (
-            sx + dx * 0.7 - orth_x * curve_mag * random.uniform(0.5, 1.2),
-            sy + dy * 0.7 - orth_y * curve_mag * random.uniform(0.5, 1.2),
-        )
-        points: list[tuple[int, int]] = []
-        for i in range(1, segments + 1):
-            t = i / segments
-            inv = 1 - t
-            x = inv**3 * sx + 3 * inv**2 * t * cp1[0] + 3 * inv * t**2 * cp2[0] + t**3 * ex
-            y = inv**3 * sy + 3 * inv**2 * t * cp1[1] + 3 * inv * t**2 * cp2[1] + t**3 * ey
-            clamped_x = max(1, min(int(round(x)), max(width - 1, 1)))
-            clamped_y = max(1, min(int(round(y)), max(height - 1, 1)))
-            points.append((clamped_x, clamped_y))
-        return points
-
-    current_x, current_y = start_x, start_y
+    current_x = random.randint(1, max(width - 1, 1))
+    current_y = random.randint(1, max(height - 1, 1))
+    path = [(current_x, current_y)]
+    duration = 0.0
     for _ in range(move_count):
         end_x = random.randint(1, max(width - 1, 1))
         end_y = random.randint(1, max(height - 1, 1))
-        segments = random.randint(8, 16)
-        path = _bezier_points(current_x, current_y, end_x, end_y, segments=segments)
-        for x, y in path:
-            try:
-                await tab.mouse_move(x, y, steps=1)
-            except Exception:
-                break
-            await tab.sleep(random.uniform(0.01, 0.05))
+        segment = _bezier_points(current_x, current_y, end_x, end_y, width, height, random.randint(8, 16))
+        path.extend(segment)
+        duration += sum(random.uniform(0.01, 0.05) for _ in segment) + random.uniform(0.05, 0.3)
         current_x, current_y = end_x, end_y
-        await tab.sleep(random.uniform(0.05, 0.3))
+    if max_events is not None:
+        path = path[:max_events]
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    try:
+        await asyncio.gather(
+            *(tab.send(cdp.input_.dispatch_mouse_event(type_="mouseMoved", x=x, y=y)) for x, y in path)
+        )
+    except Exception:
+        pass
+    if max_seconds is not None:
+        duration = min(duration, max_seconds)
+    await tab.sleep(max(duration - (loop.time() - started), 0))
+    return len(path)
 
 
 async def reject_cookies(
-    tab: Optional[zd.Tab], timeout: float = 12, retries: int = 2, retry_delay: float = 1.5
+    tab: Optional[zd.Tab], timeout: float = 12, retries: int = 2, *, pacing: Optional[PacingTracker] = None
 ) -> bool:
-    """Wrapper that retries cookie rejection a few times."""
+    """Reject the cookie banner if one is shown, retrying while it is still rendering.
+
+    Returns True once consent has been handled for the tab's browser, and False
+    right away when the page has no banner. Waits are taken at the ``cookies.poll``
+    and ``cookies.retry`` pause points of ``pacing``.
+    """
     if tab is None:
         return False
+    browser = getattr(tab, "browser", None)
+    if browser is not None and browser in _consent_handled:
+        return True
 
+    pauses = pacing or PacingPolicy().tracker()
     for attempt in range(retries + 1):
-        if await _dismiss_cookie_banner(tab, timeout=timeout):
+        outcome = await _dismiss_cookie_banner(tab, timeout=timeout, pauses=pauses)
+        if outcome == "dismissed":
+            if browser is not None:
+                _consent_handled.add(browser)
             return True
+        if outcome == "none":
+            return False
         if attempt < retries:
-            await tab.sleep(retry_delay)
+            await pauses.pause("cookies.retry")
     return False
 
 
 async def human_delay(
-    tab: Optional[zd.Tab] = None, min_seconds: float = 5, max_seconds: float = 20
-) -> None:
-    """Insert a long, randomized pause and optional mouse jitter to look human."""
+    tab: Optional[zd.Tab] = None,
+    min_seconds: float = 5,
+    max_seconds: float = 20,
+    *,
+    max_mouse_events: Optional[int] = None,
+) -> int:
+    """Insert a long, randomized pause and optional mouse jitter to look human.
+
+    Mouse jitter counts towards the pause, and the pause ends once its randomly
+    chosen length has passed. Returns the number of mouse events sent.
+    """
     if max_seconds < min_seconds:
         max_seconds = min_seconds
 
+    loop = asyncio.get_running_loop()
     total_sleep = random.uniform(min_seconds, max_seconds)
+    deadline = loop.time() + total_sleep
     chunks = random.randint(1, 3)
-    for _ in range(chunks):
+    dispatched = 0
+    for chunk in range(chunks):
+        started = loop.time()
+        if started >= deadline:
+            break
         if tab:
-            await _random_mouse_movements(tab, move_count=random.randint(1, 3))
+            limit = None if max_mouse_events is None else max_mouse_events - dispatched
+            dispatched += await _random_mouse_movements(
+                tab, move_count=random.randint(1, 3), max_events=limit, max_seconds=deadline - started
+            )
         segment = max(0.05, total_sleep / chunks * random.uniform(0.6, 1.4))
-        await asyncio.sleep(segment)
+        # The chunks vary in length; the last one takes up whatever is left until the deadline.
+        until = deadline if chunk == chunks - 1 else min(started + segment, deadline)
+        await asyncio.sleep(max(until - loop.time(), 0))
+    return dispatched
 
 
-async def human_like_scroll(tab: zd.Tab, target_ratio: float = 1.0) -> None:
-    """Scroll in a non-linear, human style with small pauses."""
+async def human_like_scroll(
+    tab: zd.Tab, target_ratio: float = 1.0, *, pacing: Optional[PacingTracker] = None
+) -> None:
+    """Scroll in a non-linear, human style, then pause at ``pacing``'s ``scroll.settle`` point."""
     if tab is None:
         return
     ratio = max(0.0, min(1.0, float(target_ratio)))
@@ -215,7 +550,7 @@ async def human_like_scroll(tab: zd.Tab, target_ratio: float = 1.0) -> None:
         await tab.evaluate(f"window.scrollTo(0, document.body.scrollHeight*{ratio});")
     except Exception:
         pass
-    await tab.sleep(random.uniform(0.15, 0.5))
+    await (pacing or PacingPolicy().tracker()).pause("scroll.settle")
 
 
 async def page_has_loaded(tab: zd.Tab) -> bool:
@@ -226,131 +561,29 @@ async def page_has_loaded(tab: zd.Tab) -> bool:
         return False
 
 
-async def _click_first_matching(tab: zd.Tab, selectors: Iterable[str], wait_time: float) -> bool:
-    loop = asyncio.get_event_loop()
-    deadline = loop.time() + wait_time
-    selectors = list(selectors)
-    while loop.time() < deadline:
-        for selector in selectors:
-            try:
-                elems = await tab.xpath(selector, timeout=0)
-            except Exception:
-                elems = []
-            for elem in elems:
-                try:
-                    await elem.click()
-                    return True
-                except Exception:
-                    continue
-        await tab.sleep(0.2)
-    return False
-
-
-async def _click_by_text_labels(tab: zd.Tab, labels: Sequence[str], timeout: float) -> bool:
-    loop = asyncio.get_event_loop()
+async def _dismiss_cookie_banner(tab: zd.Tab, timeout: float, pauses: PacingTracker) -> str:
+    loop = asyncio.get_running_loop()
     deadline = loop.time() + timeout
-    labels = [lbl.lower() for lbl in labels]
-    while loop.time() < deadline:
-        for label in labels:
-            try:
-                btn = await tab.find(label, best_match=True, timeout=1)
-                if btn:
-                    await btn.click()
-                    return True
-            except Exception:
-                continue
-        await tab.sleep(0.25)
-    return False
-
-
-def _selectors_for_labels(labels: Sequence[str]) -> list[str]:
-    normalized_text = "translate(normalize-space(.), 'ABCDEFGHIJKLMNOPQRSTUVWXYZÄÖÜß', 'abcdefghijklmnopqrstuvwxyzäöüß')"
-    normalized_aria = "translate(@aria-label, 'ABCDEFGHIJKLMNOPQRSTUVWXYZÄÖÜß', 'abcdefghijklmnopqrstuvwxyzäöüß')"
-    selectors: list[str] = []
-    for label in labels:
-        selectors.extend(
-            [
-                f"//button[contains({normalized_text}, '{label}')]",
-                f"//span[contains({normalized_text}, '{label}')]/ancestor::button[1]",
-                f"//button[contains({normalized_aria}, '{label}')]",
-            ]
-        )
-    return selectors
-
-
-async def _dismiss_cookie_banner(tab: zd.Tab, timeout: float = 12) -> bool:
-    reject_labels = [
-        "reject",
-        "reject all",
-        "decline",
-        "decline all",
-        "refuse",
-        "ablehnen",
-        "alle ablehnen",
-        "nicht zustimmen",
-        "keine zustimmung",
-        "nur notwendige",
-        "nur erforderliche",
-        "nur notwendige cookies",
-        "essential only",
-        "only essential",
-        "necessary only",
-        "strictly necessary",
-        "reject non-essential",
-    ]
-    reject_labels = list(dict.fromkeys(reject_labels))
-    reject_selectors = _selectors_for_labels(reject_labels)
-
-    manage_labels = [
-        "manage preferences",
-        "manage settings",
-        "manage choices",
-        "präferenzen verwalten",
-        "einstellungen verwalten",
-        "auswahl verwalten",
-    ]
-    manage_selectors = _selectors_for_labels(manage_labels)
-
-    dismiss_selectors = [
-        "//button[@id='artdeco-global-alert-container__action-dismiss']",
-        "//button[contains(@aria-label, 'dismiss') or contains(@aria-label, 'schließen') or contains(@aria-label, 'close')]",
-        "//button[contains(@data-test-modal-close-btn, '')]",
-    ]
-
-    if await _click_by_text_labels(tab, reject_labels, timeout):
-        return True
-
-    if await _click_first_matching(tab, reject_selectors, timeout):
-        return True
-
-    if await _click_first_matching(tab, dismiss_selectors, 2):
-        return True
-
-    if await _click_first_matching(tab, manage_selectors, 3):
-        if await _click_first_matching(tab, reject_selectors, 6):
-            return True
-
-    try:
-        labels_json = json.dumps(reject_labels)
-        script = """
-        const labels = {labels};
-        const nodes = Array.from(document.querySelectorAll('button, [role="button"], a'));
-        for (const node of nodes) {{
-            const text = (node.innerText || node.textContent || '').toLowerCase();
-            if (labels.some(lbl => text.includes(lbl))) {{
-                node.click();
-                return true;
-            }}
-        }}
-        return false;
-        """.format(labels=labels_json)
-        js_clicked = await tab.evaluate(script, await_promise=True)
-        if js_clicked:
-            return True
-    except Exception:
-        pass
-
-    return False
+    arguments = ", ".join(
+        [
+            json.dumps(COOKIE_REJECT_LABELS),
+            json.dumps(COOKIE_MANAGE_LABELS),
+            json.dumps(COOKIE_BANNER_CONTAINERS),
+            str(int(timeout * 1000)),
+        ]
+    )
+    outcome = "none"
+    while True:
+        try:
+            outcome = await tab.evaluate(
+                f"({_COOKIE_BANNER_JS})({arguments})", await_promise=True, return_by_value=True
+            )
+        except Exception:
+            outcome = "pending"
+        if outcome not in ("manage", "pending") or loop.time() >= deadline:
+            return outcome if isinstance(outcome, str) else "pending"
+        # The preferences dialog or the banner's buttons are still rendering.
+        await pauses.pause("cookies.poll")
 
 
 def _env_file_path(path_hint: Optional[str] = None) -> Path:
@@ -450,18 +683,82 @@ async def _read_li_at_from_driver(tab: zd.Tab) -> Optional[str]:
     return None
 
 
-async def _is_logged_in(tab: zd.Tab, timeout: float = 10) -> bool:
-    try:
-        await wait_for_element(tab, By.CLASS_NAME, c.VERIFY_LOGIN_ID, timeout=timeout)
-        return True
-    except asyncio.TimeoutError:
-        pass
+async def is_logged_in(tab: zd.Tab, timeout: float = 10, *, until_signed_in: bool = False) -> bool:
+    """Return whether ``tab`` shows a signed-in LinkedIn page.
+
+    Both signed-in markers and the logged-out markers are watched at once, so
+    the answer comes as soon as any of them renders. With ``until_signed_in``
+    only the signed-in markers count, for a page that is still leaving /login.
+    """
+    locators = [
+        (By.CLASS_NAME, c.VERIFY_LOGIN_ID),
+        (By.CSS_SELECTOR, c.SEARCH_INPUT_SELECTOR),
+    ]
+    if not until_signed_in:
+        locators.append((By.CSS_SELECTOR, c.LOGGED_OUT_SELECTOR))
     try:
-        await wait_for_element(tab, By.CSS_SELECTOR, "input[placeholder*='Search']", timeout=timeout)
-        return True
+        index, _ = await wait_for_any(tab, locators, timeout=timeout)
     except asyncio.TimeoutError:
-        pass
-    return False
+        return False
+    return index < 2
+
+
+class AuthState:
+    """Signed-in state of one browser, kept current from its tabs' navigations.
+
+    Once a probe has confirmed the session, ``check`` only looks for the li_at
+    cookie. The DOM probe runs again when a watched tab lands on a login or
+    authwall page, or when the cookie is gone.
+    """
+
+    LOGGED_OUT_PATHS = ("/login", "/authwall", "/checkpoint", "/uas/login", "/signup")
+
+    def __init__(self) -> None:
+        self.signed_in: Optional[bool] = None
+        self.probes = 0
+        self.fast_checks = 0
+        self.last_logged_out_url: Optional[str] = None
+        self._watched: set = set()
+
+    def watch(self, tab: zd.Tab) -> None:
+        """Follow main-frame navigations of ``tab``; calling it again is a no-op."""
+        key = tab_key(tab)
+        if key in self._watched:
+            return
+        self._watched.add(key)
+        tab.add_handler(cdp.page.FrameNavigated, self._on_frame_navigated)
+
+    def forget(self, tab: zd.Tab) -> None:
+        """Stop tracking ``tab`` once it is closed."""
+        self._watched.discard(tab_key(tab))
+
+    def _on_frame_navigated(self, event: cdp.page.FrameNavigated) -> None:
+        frame = event.frame
+        if frame.parent_id:
+            return
+        parts = urlsplit(frame.url)
+        host = (parts.hostname or "").lower()
+        if not host.endswith("linkedin.com"):
+            return
+        if parts.path.startswith(self.LOGGED_OUT_PATHS):
+            self.signed_in = False
+            self.last_logged_out_url = frame.url
+
+    async def check(self, tab: zd.Tab, timeout: float = 10) -> bool:
+        if self.signed_in and await _read_li_at_from_driver(tab):
+            self.fast_checks += 1
+            return True
+        self.probes += 1
+        self.signed_in = await is_logged_in(tab, timeout=timeout)
+        return self.signed_in
+
+    def snapshot(self) -> dict:
+        return {
+            "signed_in": self.signed_in,
+            "probes": self.probes,
+            "fast_checks": self.fast_checks,
+            "last_logged_out_url": self.last_logged_out_url,
+        }
 
 
 async def login(
@@ -473,14 +770,16 @@ async def login(
     cookie_path: Optional[str] = None,
     env_path: Optional[str] = None,
     restart_on_cookie_failure: bool = True,
+    pacing: Optional[PacingPolicy] = None,
 ) -> zd.Tab:
     browser = tab.browser
+    pauses = (pacing or PacingPolicy()).tracker()
     env_file = _env_file_path(env_path or cookie_path)
     email = email or os.getenv(EMAIL_ENV_KEY)
     password = password or os.getenv(PASSWORD_ENV_KEY)
     cookie = cookie or os.getenv(COOKIE_ENV_KEY)
     if cookie and browser:
-        if await _login_with_cookie(browser, tab, cookie, timeout=timeout):
+        if await _login_with_cookie(browser, tab, cookie, timeout=timeout, pauses=pauses):
             _persist_cookie_value(cookie, env_file)
             return tab
         # Failed cookie login: clear stored cookie and browser state so we can fall back safely.
@@ -488,10 +787,12 @@ async def login(
         await _clear_li_at_cookie(browser)
         if restart_on_cookie_failure:
             return await _restart_browser_with_credentials(
-                tab, email=email, password=password, timeout=timeout, env_file=env_file
+                tab, email=email, password=password, timeout=timeout, env_file=env_file, pauses=pauses
             )
 
-    return await _login_with_credentials(tab, email=email, password=password, timeout=timeout, env_file=env_file)
+    return await _login_with_credentials(
+        tab, email=email, password=password, timeout=timeout, env_file=env_file, pauses=pauses
+    )
 
 
 async def _login_with_credentials(
@@ -500,29 +801,31 @@ async def _login_with_credentials(
     password: Optional[str],
     timeout: float,
     env_file: Path,
+    pauses: PacingTracker,
 ) -> zd.Tab:
     if not email or not password:
         email, password = __prompt_email_password()
 
     await tab.get("https://www.linkedin.com/login")
-    await reject_cookies(tab, timeout=timeout, retries=2, retry_delay=1)
-    await human_delay(tab)
+    await reject_cookies(tab, timeout=timeout, retries=2, pacing=pauses)
+    await pauses.pause("login.step", tab)
     element = await wait_for_element(tab, By.ID, "username", timeout=10)
-    await human_delay(tab)
+    await pauses.pause("login.step", tab)
 
     email_elem = element
     await email_elem.send_keys(email)
-    await human_delay(tab)
+    await pauses.pause("login.step", tab)
 
     password_elem = await wait_for_element(tab, By.ID, "password", timeout=10)
     await password_elem.send_keys(password)
     await password_elem.send_keys("\r\n")
-    await human_delay(tab)
+    await pauses.pause("login.step", tab)
 
-    await reject_cookies(tab, timeout=timeout, retries=2, retry_delay=1)
-    await human_delay(tab)
+    await reject_cookies(tab, timeout=timeout, retries=2, pacing=pauses)
+    await pauses.pause("login.step", tab)
 
-    if await _is_logged_in(tab, timeout=timeout):
+    # The tab may still show the login form, whose #username is a logged-out marker.
+    if await is_logged_in(tab, timeout=timeout, until_signed_in=True):
         new_cookie = await _read_li_at_from_driver(tab)
         if new_cookie:
             _persist_cookie_value(new_cookie, env_file)
@@ -535,6 +838,7 @@ async def _restart_browser_with_credentials(
     password: Optional[str],
     timeout: float,
     env_file: Path,
+    pauses: PacingTracker,
 ) -> zd.Tab:
     old_browser = tab.browser
     config = getattr(old_browser, "config", None) if old_browser else None
@@ -542,6 +846,9 @@ async def _restart_browser_with_credentials(
     browser_executable_path = getattr(config, "browser_executable_path", None) if config else None
     browser_args = getattr(config, "browser_args", None) if config else None
     lang = getattr(config, "lang", None) if config else None
+    resource_policy = getattr(config, "resource_policy", None) if config else None
+    asset_cache = getattr(config, "asset_cache", None) if config else None
+    launch_profile = getattr(config, "launch_profile", "default") if config else "default"
 
     try:
         if old_browser:
@@ -555,18 +862,23 @@ async def _restart_browser_with_credentials(
         browser_executable_path=browser_executable_path,
         browser_args=browser_args,
         lang=lang,
+        resource_policy=resource_policy,
+        asset_cache=asset_cache,
+        launch_profile=launch_profile,
     )
     new_browser = await start_browser(new_config)
     new_tab = await new_browser.get("https://www.linkedin.com/")
-    return await _login_with_credentials(new_tab, email=email, password=password, timeout=timeout, env_file=env_file)
+    return await _login_with_credentials(
+        new_tab, email=email, password=password, timeout=timeout, env_file=env_file, pauses=pauses
+    )
 
 
 async def _login_with_cookie(
-    browser: zd.Browser, tab: zd.Tab, cookie: str, timeout: float = 10
+    browser: zd.Browser, tab: zd.Tab, cookie: str, timeout: float = 10, *, pauses: PacingTracker
 ) -> bool:
     try:
         await tab.get("https://www.linkedin.com/")
-        await human_delay(tab)
+        await pauses.pause("login.step", tab)
         await browser.cookies.set_all(
             [
                 cdp.network.CookieParam(
@@ -578,24 +890,20 @@ async def _login_with_cookie(
             ]
         )
         await tab.get("https://www.linkedin.com/feed/")
-        await human_delay(tab)
-        await reject_cookies(tab, timeout=timeout, retries=2, retry_delay=1)
-        return await _is_logged_in(tab, timeout=timeout)
+        await pauses.pause("login.step", tab)
+        await reject_cookies(tab, timeout=timeout, retries=2, pacing=pauses)
+        return await is_logged_in(tab, timeout=timeout)
     except Exception:
         return False
 
 
 async def find_element(target: zd.Tab | zd.Element, by: str, value: str):
     if by == By.XPATH:
-        return await _find_by_xpath(target, value)
+        results = await find_elements(target, by, value)
+        return results[0] if results else None
     selector = _css_selector(by, value)
     if selector is None:
         return None
-    if isinstance(target, zd.Tab):
-        try:
-            return await target.query_selector(selector)
-        except Exception:
-            return None
     try:
         return await target.query_selector(selector)
     except Exception:
@@ -604,16 +912,10 @@ async def find_element(target: zd.Tab | zd.Element, by: str, value: str):
 
 async def find_elements(target: zd.Tab | zd.Element, by: str, value: str) -> List[zd.Element]:
     if by == By.XPATH:
-        return await _find_all_by_xpath(target, value)
+        return (await find_elements_batch(target, [(by, value)]))[0]
     selector = _css_selector(by, value)
     if selector is None:
         return []
-    if isinstance(target, zd.Tab):
-        try:
-            items = await target.query_selector_all(selector)
-            return items if isinstance(items, list) else []
-        except Exception:
-            return []
     try:
         items = await target.query_selector_all(selector)
         return items if isinstance(items, list) else []
@@ -621,20 +923,90 @@ async def find_elements(target: zd.Tab | zd.Element, by: str, value: str) -> Lis
         return []
 
 
+async def find_element_batch(
+    target: zd.Tab | zd.Element, locators: Sequence[Tuple[str, str]]
+) -> List[Optional[zd.Element]]:
+    """Like ``find_element`` for several ``(by, value)`` locators at once."""
+    return [matches[0] if matches else None for matches in await find_elements_batch(target, locators)]
+
+
+async def find_elements_batch(
+    target: zd.Tab | zd.Element, locators: Sequence[Tuple[str, str]]
+) -> List[List[zd.Element]]:
+    """Like ``find_elements`` for several ``(by, value)`` locators at once.
+
+    The page evaluates every locator relative to ``target`` in one call and hands
+    back the matched nodes as a single array, so the page is never modified. The
+    matches are then described concurrently, which costs one more round trip
+    however many there are. Their subtrees are included, so ``text`` works
+    right away; call ``update()`` before using ``parent``.
+    """
+    results: List[List[zd.Element]] = [[] for _ in locators]
+    tab = target if isinstance(target, zd.Tab) else getattr(target, "tab", None)
+    if tab is None or not locators:
+        return results
+    specs = [_locator_spec(by, value) for by, value in locators]
+    try:
+        if isinstance(target, zd.Tab):
+            root, _ = await tab.send(cdp.runtime.evaluate("document", object_group=_MATCH_OBJECT_GROUP))
+        else:
+            root = await tab.send(
+                cdp.dom.resolve_node(backend_node_id=target.backend_node_id, object_group=_MATCH_OBJECT_GROUP)
+            )
+        matched, _ = await tab.send(
+            cdp.runtime.call_function_on(
+                _MATCH_NODES_JS,
+                object_id=root.object_id,
+                arguments=[cdp.runtime.CallArgument(object_id=root.object_id), cdp.runtime.CallArgument(value=specs)],
+                object_group=_MATCH_OBJECT_GROUP,
+            )
+        )
+        if matched.object_id is None:
+            return results
+        properties, *_ = await tab.send(cdp.runtime.get_properties(matched.object_id, own_properties=True))
+        items = {int(prop.name): prop.value for prop in properties if prop.name.isdigit() and prop.value is not None}
+        counts = [int(items[index].value or 0) for index in range(len(locators))]
+        if not any(counts):
+            return results
+        owners: List[int] = []
+        objects: List[cdp.runtime.RemoteObjectId] = []
+        position = len(locators)
+        for index, count in enumerate(counts):
+            for offset in range(position, position + count):
+                item = items.get(offset)
+                if item is not None and item.object_id is not None:
+                    owners.append(index)
+                    objects.append(item.object_id)
+            position += count
+        nodes = await asyncio.gather(
+            *(tab.send(cdp.dom.describe_node(object_id=object_id, depth=-1)) for object_id in objects),
+            return_exceptions=True,
+        )
+        for index, node in zip(owners, nodes):
+            # A node removed since the lookup cannot be described; leave it out.
+            if isinstance(node, cdp.dom.Node):
+                results[index].append(zd.Element(node, tab))
+    except Exception:
+        pass
+    finally:
+        try:
+            await tab.send(cdp.runtime.release_object_group(_MATCH_OBJECT_GROUP))
+        except Exception:
+            pass
+    return results
+
+
 async def wait_for_element(
     target: zd.Tab | zd.Element,
     by: str = By.CLASS_NAME,
     name: str = "pv-top-card",
     timeout: float = 10,
 ) -> zd.Element:
-    loop = asyncio.get_event_loop()
-    deadline = loop.time() + timeout
-    while loop.time() < deadline:
-        elem = await find_element(target, by, name)
-        if elem:
-            return elem
-        await asyncio.sleep(0.25)
-    raise asyncio.TimeoutError(f"Timeout waiting for element by {by}={name}")
+    try:
+        _, elem = await wait_for_any(target, [(by, name)], timeout=timeout)
+    except asyncio.TimeoutError:
+        raise asyncio.TimeoutError(f"Timeout waiting for element by {by}={name}") from None
+    return elem
 
 
 async def wait_for_all_elements(
@@ -643,84 +1015,107 @@ async def wait_for_all_elements(
     name: str = "pv-top-card",
     timeout: float = 10,
 ) -> List[zd.Element]:
-    loop = asyncio.get_event_loop()
-    deadline = loop.time() + timeout
-    while loop.time() < deadline:
-        elems = await find_elements(target, by, name)
-        if elems:
-            return elems
-        await asyncio.sleep(0.25)
-    raise asyncio.TimeoutError(f"Timeout waiting for elements by {by}={name}")
+    async def fetch(by: str, value: str) -> Optional[List[zd.Element]]:
+        return await find_elements(target, by, value) or None
 
+    try:
+        _, elems = await _wait_until_found(target, [(by, name)], timeout, fetch)
+    except asyncio.TimeoutError:
+        raise asyncio.TimeoutError(f"Timeout waiting for elements by {by}={name}") from None
+    return elems
 
-def _css_selector(by: str, value: str) -> Optional[str]:
-    if by == By.CSS_SELECTOR:
-        return value
-    if by == By.CLASS_NAME:
-        return f".{value}"
-    if by == By.ID:
-        return f"#{value}"
-    if by == By.TAG_NAME:
-        return value
-    if by == By.NAME:
-        return f"[name='{value}']"
-    return None
 
+async def wait_for_any(
+    target: zd.Tab | zd.Element,
+    locators: Sequence[Tuple[str, str]],
+    timeout: float = 10,
+) -> Tuple[int, zd.Element]:
+    """Wait until any of ``(by, value)`` locators matches; return its index and element.
 
-async def _find_by_xpath(target: zd.Tab | zd.Element, xpath: str):
-    results = await _find_all_by_xpath(target, xpath)
-    return results[0] if results else None
+    The page watches for the locators with a MutationObserver, so this costs one
+    awaited CDP call instead of a query every 250 ms and returns as soon as the
+    DOM changes. Cancelling the awaiting task also removes the in-page watcher.
+    """
 
+    async def fetch(by: str, value: str) -> Optional[zd.Element]:
+        return await find_element(target, by, value)
 
-async def _find_all_by_xpath(target: zd.Tab | zd.Element, xpath: str) -> List[zd.Element]:
-    if isinstance(target, zd.Tab):
-        try:
-            return await target.xpath(xpath, timeout=1.5)
-        except Exception:
-            return []
+    return await _wait_until_found(target, locators, timeout, fetch)
 
-    if xpath in ("*", "./*"):
-        try:
-            await target.update()
-            return target.children
-        except Exception:
-            return []
 
-    if xpath == "..":
+async def _wait_until_found(
+    target: zd.Tab | zd.Element,
+    locators: Sequence[Tuple[str, str]],
+    timeout: float,
+    fetch: Callable[[str, str], Awaitable[Any]],
+) -> Tuple[int, Any]:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    specs = [_locator_spec(by, value) for by, value in locators]
+    while True:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            raise asyncio.TimeoutError(f"Timeout waiting for {list(locators)}")
         try:
-            await target.update()
-            return [target.parent] if target.parent else []
+            index = await _watch_locators(target, specs, remaining)
+        except asyncio.CancelledError:
+            raise
         except Exception:
-            return []
+            index = None
+        if isinstance(index, int) and index >= 0:
+            # The node can disappear again before it is fetched; keep waiting if so.
+            found = await fetch(*locators[index])
+            if found:
+                return index, found
+        elif index == -1:
+            continue
+        await asyncio.sleep(min(WAIT_RETRY_INTERVAL, max(deadline - loop.time(), 0)))
+
+
+def _locator_spec(by: str, value: str) -> dict:
+    if by == By.XPATH:
+        return {"css": None, "xpath": value}
+    return {"css": _css_selector(by, value), "xpath": None}
 
-    parent_tab = getattr(target, "tab", None)
-    if parent_tab:
-        try:
-            candidates = await parent_tab.xpath(xpath, timeout=1.5)
-        except Exception:
-            candidates = []
-        filtered: List[zd.Element] = []
-        for cand in candidates:
-            try:
-                if await _is_descendant(cand, target):
-                    filtered.append(cand)
-            except Exception:
-                continue
-        return filtered
-    return []
+
+async def _watch_locators(target: zd.Tab | zd.Element, specs: List[dict], timeout: float) -> Any:
+    token = uuid.uuid4().hex
+    arguments = f"{json.dumps(specs)}, {int(timeout * 1000)}, {json.dumps(token)}"
+    if isinstance(target, zd.Tab):
+        tab = target
+        pending = tab.evaluate(
+            f"({_WAIT_FOR_LOCATORS_JS})(document, {arguments})", await_promise=True, return_by_value=True
+        )
+    else:
+        tab = getattr(target, "tab", None)
+        # Runtime.callFunctionOn passes the element itself as the first argument.
+        pending = target.apply(
+            f"(root) => ({_WAIT_FOR_LOCATORS_JS})(root, {arguments})", await_promise=True
+        )
+    try:
+        return await pending
+    except asyncio.CancelledError:
+        if tab is not None:
+            asyncio.ensure_future(_cancel_watch(tab, token))
+        raise
 
 
-async def _is_descendant(node: zd.Element, ancestor: zd.Element) -> bool:
+async def _cancel_watch(tab: zd.Tab, token: str) -> None:
     try:
-        await node.update()
-        await ancestor.update()
+        await tab.evaluate(f"window.__linkedinScraperWaits?.[{json.dumps(token)}]?.()")
     except Exception:
-        return False
-    current: Optional[zd.Element] = node
-    hops = 0
-    while current and hops < 15:
-        if current.backend_node_id == ancestor.backend_node_id:
-            return True
-        current = current.parent
-        hops += 1
-    return False
+        pass
+
+
+def _css_selector(by: str, value: str) -> Optional[str]:
+    if by == By.CSS_SELECTOR:
+        return value
+    if by == By.CLASS_NAME:
+        return f".{value}"
+    if by == By.ID:
+        return f"#{value}"
+    if by == By.TAG_NAME:
+        return value
+    if by == By.NAME:
+        return f"[name='{value}']"
+    return None
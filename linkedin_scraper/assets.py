@@ -0,0 +1,246 @@
+"""On-disk cache for static assets (scripts, stylesheets), shared by every browser on the host."""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_RESOURCE_TYPES = ("Script", "Stylesheet")
+# The body is stored decoded, so these no longer describe what is served from the cache.
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive"}
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS assets (
+    url TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    expires_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS assets_by_last_used ON assets (last_used);
+CREATE INDEX IF NOT EXISTS assets_by_digest ON assets (digest);
+"""
+
+Headers = List[Tuple[str, str]]
+
+
+@dataclass
+class CachedAsset:
+    url: str
+    digest: str
+    headers: Headers
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires_at: float
+
+    @property
+    def fresh(self) -> bool:
+        return self.expires_at > time.time()
+
+    def conditional_headers(self) -> Headers:
+        headers = []
+        if self.etag:
+            headers.append(("If-None-Match", self.etag))
+        if self.last_modified:
+            headers.append(("If-Modified-Since", self.last_modified))
+        return headers
+
+
+class AssetCache:
+    """Content-addressed asset bodies under ``root/blobs`` with a SQLite index.
+
+    Several processes may open the same ``root``: the index runs in WAL mode
+    and bodies are written atomically under their SHA-256, so workers share
+    what any of them downloaded. The least recently used entries are evicted
+    once the bodies exceed ``max_bytes``. Methods block; run them in a thread.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        resource_types: Tuple[str, ...] = DEFAULT_RESOURCE_TYPES,
+    ) -> None:
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.resource_types = resource_types
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.stored_bytes = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def open(self) -> None:
+        (self.root / "blobs").mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.root / "index.sqlite3"), check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.executescript(_SCHEMA)
+        self._conn = conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+    def lookup(self, url: str) -> Optional[CachedAsset]:
+        with self._lock:
+            if not self._conn:
+                return None
+            row = self._conn.execute(
+                "SELECT digest, headers, etag, last_modified, expires_at FROM assets WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None or not self._blob_path(row[0]).exists():
+            return None
+        return CachedAsset(
+            url=url,
+            digest=row[0],
+            headers=[tuple(item) for item in json.loads(row[1])],
+            etag=row[2],
+            last_modified=row[3],
+            expires_at=row[4],
+        )
+
+    def read(self, asset: CachedAsset) -> Optional[bytes]:
+        try:
+            body = self._blob_path(asset.digest).read_bytes()
+        except OSError:
+            return None
+        with self._lock:
+            if self._conn:
+                self._conn.execute("UPDATE assets SET last_used = ? WHERE url = ?", (time.time(), asset.url))
+        return body
+
+    def refresh(self, asset: CachedAsset, headers: Headers) -> None:
+        """Record a 304 answer: the stored body is still current for ``headers``' lifetime."""
+        expires_at = _expires_at(headers)
+        if expires_at is None:
+            return
+        with self._lock:
+            if self._conn:
+                self._conn.execute(
+                    "UPDATE assets SET expires_at = ?, last_used = ? WHERE url = ?",
+                    (expires_at, time.time(), asset.url),
+                )
+
+    def discard(self, asset: CachedAsset) -> None:
+        """Drop the entry for ``asset``, and its body unless another URL shares it."""
+        with self._lock:
+            if not self._conn:
+                return
+            self._conn.execute("DELETE FROM assets WHERE url = ?", (asset.url,))
+            if self._conn.execute("SELECT 1 FROM assets WHERE digest = ? LIMIT 1", (asset.digest,)).fetchone():
+                return
+        try:
+            self._blob_path(asset.digest).unlink()
+        except OSError:
+            pass
+
+    def store(self, url: str, body: bytes, headers: Headers) -> bool:
+        expires_at = _expires_at(headers)
+        if expires_at is None or len(body) > self.max_bytes:
+            return False
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._blob_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            handle, temp_path = tempfile.mkstemp(dir=path.parent)
+            with os.fdopen(handle, "wb") as temp_file:
+                temp_file.write(body)
+            os.replace(temp_path, path)
+        kept = [(name, value) for name, value in headers if name.lower() not in _DROPPED_HEADERS]
+        now = time.time()
+        with self._lock:
+            if not self._conn:
+                return False
+            self._conn.execute(
+                "INSERT OR REPLACE INTO assets"
+                " (url, digest, size, headers, etag, last_modified, expires_at, last_used)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    digest,
+                    len(body),
+                    json.dumps(kept),
+                    _header(headers, "etag"),
+                    _header(headers, "last-modified"),
+                    expires_at,
+                    now,
+                ),
+            )
+            self.stored_bytes += len(body)
+            self._evict()
+        return True
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            row = (0, 0)
+            if self._conn:
+                row = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM assets").fetchone()
+        return {
+            "entries": row[0],
+            "bytes": row[1],
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "stored_bytes": self.stored_bytes,
+        }
+
+    def _evict(self) -> None:
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM (SELECT MAX(size) AS size FROM assets GROUP BY digest)"
+        ).fetchone()[0]
+        while total > self.max_bytes:
+            row = self._conn.execute("SELECT url, digest, size FROM assets ORDER BY last_used LIMIT 1").fetchone()
+            if row is None:
+                break
+            self._conn.execute("DELETE FROM assets WHERE url = ?", (row[0],))
+            still_used = self._conn.execute("SELECT 1 FROM assets WHERE digest = ? LIMIT 1", (row[1],)).fetchone()
+            if not still_used:
+                total -= row[2]
+                try:
+                    self._blob_path(row[1]).unlink()
+                except OSError:
+                    pass
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.root / "blobs" / digest[:2] / digest
+
+
+def _header(headers: Headers, name: str) -> Optional[str]:
+    for key, value in headers:
+        if key.lower() == name:
+            return value
+    return None
+
+
+def _expires_at(headers: Headers) -> Optional[float]:
+    """When a response stops being fresh, or ``None`` if it must not be stored."""
+    cache_control = (_header(headers, "cache-control") or "").lower()
+    if "no-store" in cache_control or "private" in cache_control:
+        return None
+    if "no-cache" in cache_control:
+        return time.time()
+    match = _MAX_AGE.search(cache_control)
+    if match:
+        return time.time() + int(match.group(1))
+    if _header(headers, "etag") or _header(headers, "last-modified"):
+        # No lifetime given: keep the body, but revalidate before every use.
+        return time.time()
+    return None
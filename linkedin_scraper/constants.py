@@ -1,2 +1,5 @@
 VERIFY_LOGIN_ID = "global-nav__primary-link"
+SEARCH_INPUT_SELECTOR = "input[placeholder*='Search']"
+# Present on the login page, the guest homepage and the authwall of a logged-out session.
+LOGGED_OUT_SELECTOR = "#username, #session_key, form.join-form, a.nav__button-secondary"
 REMEMBER_PROMPT = 'remember-me-prompt__form-primary'
@@ -0,0 +1,323 @@
+"""Request interception: keep images, media, fonts and trackers out of scraping tabs
+and serve static assets from the on-disk AssetCache."""
+
+import asyncio
+import base64
+import logging
+import weakref
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import zendriver as zd
+from zendriver import cdp
+
+from .assets import AssetCache, CachedAsset, Headers
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BLOCKED_TYPES = ("Media", "Font")
+# Images are answered with a transparent pixel so pages waiting on onload/onerror carry on.
+DEFAULT_STUBBED_TYPES = ("Image",)
+DEFAULT_BLOCKED_URLS = (
+    "*://px.ads.linkedin.com/*",
+    "*://*.doubleclick.net/*",
+    "*://*.google-analytics.com/*",
+    "*://*.googletagmanager.com/*",
+    "*://*.linkedin.com/li/track*",
+    "*://*.linkedin.com/realtime/*",
+)
+# Rough transfer sizes of what a LinkedIn page loads per resource type. Blocked
+# requests never report a size, so bytes saved can only be estimated.
+DEFAULT_ESTIMATED_SIZES = {
+    "Image": 30_000,
+    "Media": 250_000,
+    "Font": 40_000,
+    "Other": 2_000,
+}
+_TRANSPARENT_GIF = base64.b64encode(
+    bytes.fromhex("47494638396101000100800000000000ffffff21f90401000000002c00000000010001000002024401003b")
+).decode()
+
+
+@dataclass
+class ResourcePolicy:
+    """Which requests a scraping tab may skip.
+
+    ``block_types`` and ``stub_types`` are CDP resource types (``Image``, ``Media``,
+    ``Font``, ``Stylesheet``, ...); ``block_urls`` are wildcard URL patterns.
+    """
+
+    block_types: Tuple[str, ...] = DEFAULT_BLOCKED_TYPES
+    stub_types: Tuple[str, ...] = DEFAULT_STUBBED_TYPES
+    block_urls: Tuple[str, ...] = DEFAULT_BLOCKED_URLS
+    estimated_sizes: Dict[str, int] = field(default_factory=lambda: dict(DEFAULT_ESTIMATED_SIZES))
+
+    def action_for(self, resource_type: str, url: str) -> Optional[str]:
+        """Return ``"stub"``, ``"block"`` or ``None`` to let the request through."""
+        if resource_type in self.stub_types:
+            return "stub"
+        if resource_type in self.block_types:
+            return "block"
+        if any(fnmatchcase(url, pattern) for pattern in self.block_urls):
+            return "block"
+        return None
+
+    def patterns(self) -> List[cdp.fetch.RequestPattern]:
+        # Only matching requests are paused; everything else never reaches Python.
+        stage = cdp.fetch.RequestStage.REQUEST
+        patterns = [
+            cdp.fetch.RequestPattern(resource_type=cdp.network.ResourceType(name), request_stage=stage)
+            for name in dict.fromkeys((*self.stub_types, *self.block_types))
+        ]
+        patterns.extend(cdp.fetch.RequestPattern(url_pattern=url, request_stage=stage) for url in self.block_urls)
+        return patterns
+
+    def estimated_size(self, resource_type: str) -> int:
+        return self.estimated_sizes.get(resource_type, self.estimated_sizes.get("Other", 0))
+
+
+@dataclass
+class ResourceStats:
+    blocked: int = 0
+    stubbed: int = 0
+    estimated_bytes_saved: int = 0
+    cache_hits: int = 0
+    cache_bytes: int = 0
+
+    def add(self, other: "ResourceStats") -> None:
+        for name, value in vars(other).items():
+            setattr(self, name, getattr(self, name) + value)
+
+    def since(self, earlier: "ResourceStats") -> "ResourceStats":
+        return ResourceStats(**{name: value - getattr(earlier, name) for name, value in vars(self).items()})
+
+    def snapshot(self) -> dict:
+        return dict(vars(self))
+
+
+class ResourceFilter:
+    """Answers the paused requests of one browser's tabs.
+
+    Requests matched by the ResourcePolicy are blocked or stubbed. With an
+    AssetCache, scripts and stylesheets are served from disk while fresh,
+    revalidated with If-None-Match/If-Modified-Since once stale, and stored
+    after a download. Both share one Fetch.enable, which a tab can only have once.
+    """
+
+    def __init__(self, policy: Optional[ResourcePolicy] = None, asset_cache: Optional[AssetCache] = None) -> None:
+        self.policy = policy
+        self.asset_cache = asset_cache
+        self.totals = ResourceStats()
+        self._stats: Dict[Any, ResourceStats] = {}
+        self._revalidating: Dict[str, CachedAsset] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    def patterns(self) -> List[cdp.fetch.RequestPattern]:
+        patterns = self.policy.patterns() if self.policy else []
+        if self.asset_cache:
+            patterns.extend(
+                cdp.fetch.RequestPattern(
+                    resource_type=cdp.network.ResourceType(name), request_stage=cdp.fetch.RequestStage.REQUEST
+                )
+                for name in self.asset_cache.resource_types
+            )
+        return patterns
+
+    async def attach(self, tab: zd.Tab) -> None:
+        key = tab_key(tab)
+        if key in self._stats:
+            return
+        self._stats[key] = ResourceStats()
+
+        def on_paused(event: cdp.fetch.RequestPaused) -> None:
+            # Answering from inside the event listener would wait on the listener itself.
+            task = asyncio.ensure_future(self._answer(tab, event))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        tab.add_handler(cdp.fetch.RequestPaused, on_paused)
+        await tab.send(cdp.fetch.enable(patterns=self.patterns()))
+
+    def stats_for(self, tab: zd.Tab) -> ResourceStats:
+        stats = self._stats.get(tab_key(tab))
+        return ResourceStats(**vars(stats)) if stats else ResourceStats()
+
+    def forget(self, tab: zd.Tab) -> None:
+        self._stats.pop(tab_key(tab), None)
+
+    async def _answer(self, tab: zd.Tab, event: cdp.fetch.RequestPaused) -> None:
+        try:
+            if event.response_status_code is not None or event.response_error_reason is not None:
+                await self._answer_response(tab, event)
+                return
+            resource_type = event.resource_type.value
+            action = self.policy.action_for(resource_type, event.request.url) if self.policy else None
+            if action == "stub":
+                await tab.send(
+                    cdp.fetch.fulfill_request(
+                        event.request_id,
+                        response_code=200,
+                        response_headers=[cdp.fetch.HeaderEntry(name="Content-Type", value="image/gif")],
+                        body=_TRANSPARENT_GIF,
+                    )
+                )
+            elif action == "block":
+                await tab.send(cdp.fetch.fail_request(event.request_id, cdp.network.ErrorReason.BLOCKED_BY_CLIENT))
+            elif self._cacheable(event):
+                await self._answer_from_cache(tab, event)
+                return
+            else:
+                await tab.send(cdp.fetch.continue_request(event.request_id))
+                return
+        except Exception:
+            self._revalidating.pop(event.request_id, None)
+            logger.warning("Could not answer paused request for %s.", event.request.url, exc_info=True)
+            # A request nobody answers stays paused, and the page waits on it until the scrape times out.
+            try:
+                await tab.send(cdp.fetch.continue_request(event.request_id))
+            except Exception:
+                pass
+            return
+        self._record(
+            tab,
+            ResourceStats(
+                blocked=int(action == "block"),
+                stubbed=int(action == "stub"),
+                estimated_bytes_saved=self.policy.estimated_size(event.resource_type.value),
+            ),
+        )
+
+    def _cacheable(self, event: cdp.fetch.RequestPaused) -> bool:
+        return (
+            self.asset_cache is not None
+            and event.resource_type.value in self.asset_cache.resource_types
+            and event.request.method == "GET"
+            and event.request.url.startswith("https://")
+        )
+
+    async def _answer_from_cache(self, tab: zd.Tab, event: cdp.fetch.RequestPaused) -> None:
+        cache = self.asset_cache
+        asset = await asyncio.to_thread(cache.lookup, event.request.url)
+        if asset is not None and asset.fresh:
+            body = await asyncio.to_thread(cache.read, asset)
+            if body is not None:
+                cache.hits += 1
+                await self._fulfill_from_cache(tab, event.request_id, asset, body)
+                return
+            # The body is gone; a revalidation could not be answered either.
+            await asyncio.to_thread(cache.discard, asset)
+            asset = None
+        if asset is None:
+            cache.misses += 1
+            await tab.send(cdp.fetch.continue_request(event.request_id, intercept_response=True))
+            return
+        self._revalidating[event.request_id] = asset
+        headers = [
+            (name, value)
+            for name, value in dict(event.request.headers).items()
+            if name.lower() not in ("if-none-match", "if-modified-since")
+        ]
+        headers.extend(asset.conditional_headers())
+        await tab.send(
+            cdp.fetch.continue_request(
+                event.request_id,
+                headers=[cdp.fetch.HeaderEntry(name=name, value=value) for name, value in headers],
+                intercept_response=True,
+            )
+        )
+
+    async def _answer_response(self, tab: zd.Tab, event: cdp.fetch.RequestPaused) -> None:
+        cache = self.asset_cache
+        asset = self._revalidating.pop(event.request_id, None)
+        headers: Headers = [(entry.name, entry.value) for entry in event.response_headers or []]
+        if cache is not None and asset is not None and event.response_status_code == 304:
+            body = await asyncio.to_thread(cache.read, asset)
+            if body is not None:
+                cache.revalidated += 1
+                await asyncio.to_thread(cache.refresh, asset, headers)
+                await self._fulfill_from_cache(tab, event.request_id, asset, body)
+                return
+            # The body went missing while the request was out, and the empty 304 is of
+            # no use to the page. Drop the entry and redirect the page to the same URL:
+            # the new request finds no entry and is sent without conditional headers.
+            await asyncio.to_thread(cache.discard, asset)
+            await tab.send(
+                cdp.fetch.fulfill_request(
+                    event.request_id,
+                    response_code=307,
+                    response_headers=[
+                        cdp.fetch.HeaderEntry(name="Location", value=event.request.url),
+                        cdp.fetch.HeaderEntry(name="Cache-Control", value="no-store"),
+                    ],
+                )
+            )
+            return
+        if cache is not None and event.response_status_code == 200:
+            try:
+                body, encoded = await tab.send(cdp.fetch.get_response_body(event.request_id))
+                raw = base64.b64decode(body) if encoded else body.encode()
+                await asyncio.to_thread(cache.store, event.request.url, raw, headers)
+            except Exception:
+                pass
+        await tab.send(cdp.fetch.continue_request(event.request_id))
+
+    async def _fulfill_from_cache(
+        self, tab: zd.Tab, request_id: cdp.fetch.RequestId, asset: CachedAsset, body: bytes
+    ) -> None:
+        await tab.send(
+            cdp.fetch.fulfill_request(
+                request_id,
+                response_code=200,
+                response_headers=[cdp.fetch.HeaderEntry(name=name, value=value) for name, value in asset.headers],
+                body=base64.b64encode(body).decode(),
+            )
+        )
+        self._record(tab, ResourceStats(cache_hits=1, cache_bytes=len(body)))
+
+    def _record(self, tab: zd.Tab, saved: ResourceStats) -> None:
+        self.totals.add(saved)
+        stats = self._stats.get(tab_key(tab))
+        if stats is not None:
+            stats.add(saved)
+
+
+_filters: "weakref.WeakKeyDictionary[zd.Browser, ResourceFilter]" = weakref.WeakKeyDictionary()
+
+
+def tab_key(tab: zd.Tab) -> Any:
+    """Stable identity of a tab (zendriver tabs are not hashable)."""
+    return getattr(getattr(tab, "target", None), "target_id", None) or id(tab)
+
+
+async def install(
+    browser: zd.Browser, policy: Optional[ResourcePolicy] = None, asset_cache: Optional[AssetCache] = None
+) -> ResourceFilter:
+    """Intercept the requests of every open tab of ``browser``; see ``attach`` for new ones."""
+    resource_filter = ResourceFilter(policy, asset_cache)
+    _filters[browser] = resource_filter
+    for tab in list(getattr(browser, "tabs", None) or []):
+        await resource_filter.attach(tab)
+    return resource_filter
+
+
+def filter_for(browser: Optional[zd.Browser]) -> Optional[ResourceFilter]:
+    return _filters.get(browser) if browser is not None else None
+
+
+async def attach(tab: zd.Tab) -> None:
+    """Apply the interception installed on the tab's browser to ``tab``, if any."""
+    resource_filter = filter_for(getattr(tab, "browser", None))
+    if resource_filter is not None:
+        await resource_filter.attach(tab)
+
+
+def stats_for(tab: zd.Tab) -> ResourceStats:
+    resource_filter = filter_for(getattr(tab, "browser", None))
+    return resource_filter.stats_for(tab) if resource_filter else ResourceStats()
+
+
+def forget(tab: zd.Tab) -> None:
+    resource_filter = filter_for(getattr(tab, "browser", None))
+    if resource_filter is not None:
+        resource_filter.forget(tab)
@@ -5,8 +5,7 @@ from typing import Optional
 
 import zendriver as zd
 
-from . import actions
-from . import constants as c
+from . import actions, runner
 from .by import By
 
 
@@ -85,17 +84,22 @@ class Scraper:
             return False
 
     def _run(self, coro):
-        if self.loop and self.loop.is_running():
-            # Execute on existing loop; block until done.
-            return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+        # Scrapers share one loop on a background thread, so this may be called from any thread.
         if not self.loop:
-            self.loop = asyncio.new_event_loop()
+            self.loop = runner.get_loop()
+        if self.loop.is_running():
+            return runner.run(coro, self.loop)
         return self.loop.run_until_complete(coro)
 
     def human_pause(self, min_seconds=None, max_seconds=None):
         """Pause with random mouse jitter to mimic slower human interactions."""
         min_seconds = min_seconds or self.HUMAN_DELAY_MIN
         max_seconds = max_seconds or self.HUMAN_DELAY_MAX
+        pacing = getattr(self, "pacing", None)
+        if pacing is not None:
+            # Scrapers with a PacingPolicy account for these pauses like any other.
+            self._run(pacing.pause("scraper.pause", self.driver, default=(min_seconds, max_seconds)))
+            return
         self._run(actions.human_delay(self.driver, min_seconds=min_seconds, max_seconds=max_seconds))
 
     def wait(self, duration):
@@ -134,31 +138,16 @@ class Scraper:
 
     def is_signed_in(self):
         try:
-            self._run(
-                actions.wait_for_element(
-                    self.driver, by=By.CLASS_NAME, name=c.VERIFY_LOGIN_ID, timeout=self.WAIT_FOR_ELEMENT_TIMEOUT
-                )
-            )
-            return True
+            return self._run(actions.is_logged_in(self.driver, timeout=self.WAIT_FOR_ELEMENT_TIMEOUT))
         except Exception:
-            pass
-        try:
-            self._run(
-                actions.wait_for_element(
-                    self.driver, by=By.CSS_SELECTOR, name="input[placeholder*='Search']", timeout=self.WAIT_FOR_ELEMENT_TIMEOUT
-                )
-            )
-            return True
-        except Exception:
-            pass
-        return False
+            return False
 
     def scroll_to_half(self):
-        self._run(actions.human_like_scroll(self.driver, target_ratio=0.5))
+        self._run(actions.human_like_scroll(self.driver, target_ratio=0.5, pacing=getattr(self, "pacing", None)))
         self.human_pause()
 
     def scroll_to_bottom(self):
-        self._run(actions.human_like_scroll(self.driver, target_ratio=1.0))
+        self._run(actions.human_like_scroll(self.driver, target_ratio=1.0, pacing=getattr(self, "pacing", None)))
         self.human_pause()
 
     def scroll_class_name_element_to_page_percent(self, class_name:str, page_percent:float):
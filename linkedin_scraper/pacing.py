@@ -0,0 +1,112 @@
+"""Pacing between browser actions: named pause points with tunable ranges."""
+
+import random
+import time
+from typing import Dict, Mapping, Optional, Tuple
+
+import zendriver as zd
+
+PauseRange = Tuple[float, float]
+
+DEFAULT_PAUSES: Dict[str, PauseRange] = {
+    "login.step": (5, 20),
+    "profile.settle": (2, 4),
+    "profile.scroll": (1, 2.5),
+    "details.load": (1, 2.5),
+    "details.next": (1, 2.5),
+    "contact_info.load": (1, 3),
+    "contacts.load": (1, 2.5),
+    "scroll.settle": (0.15, 0.5),
+    "cookies.poll": (0.5, 0.5),
+    "cookies.retry": (1, 2),
+}
+
+
+class PacingPolicy:
+    """How long to pause at each named point of a login or scrape.
+
+    ``pauses`` overrides ranges from ``DEFAULT_PAUSES``, ``scale`` multiplies every
+    pause and ``budget`` caps the total seconds one scrape may spend pausing.
+    ``max_mouse_events`` caps the mouse-jitter events one scrape may send.
+    """
+
+    def __init__(
+        self,
+        pauses: Optional[Mapping[str, PauseRange]] = None,
+        *,
+        scale: float = 1.0,
+        budget: Optional[float] = None,
+        mouse_jitter: bool = True,
+        max_mouse_events: Optional[int] = 150,
+    ) -> None:
+        self.pauses = {**DEFAULT_PAUSES, **(pauses or {})}
+        self.scale = max(0.0, scale)
+        self.budget = budget
+        self.mouse_jitter = mouse_jitter
+        self.max_mouse_events = max_mouse_events
+
+    @classmethod
+    def zero(cls) -> "PacingPolicy":
+        """No pauses and no mouse movement, for offline fixtures and benchmarks."""
+        return cls(scale=0.0, budget=0.0, mouse_jitter=False)
+
+    def range_for(self, name: str, default: Optional[PauseRange] = None) -> PauseRange:
+        if name in self.pauses:
+            return self.pauses[name]
+        if default is None:
+            raise KeyError(f"Unknown pause point: {name}")
+        return default
+
+    def tracker(self) -> "PacingTracker":
+        return PacingTracker(self)
+
+
+class PacingTracker:
+    """Takes the pauses of one scrape or login and records the time spent at each point."""
+
+    def __init__(self, policy: PacingPolicy) -> None:
+        self.policy = policy
+        self.seconds: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+        self.mouse_events = 0
+
+    @property
+    def total(self) -> float:
+        return sum(self.seconds.values())
+
+    @property
+    def remaining(self) -> Optional[float]:
+        if self.policy.budget is None:
+            return None
+        return max(self.policy.budget - self.total, 0.0)
+
+    async def pause(self, name: str, tab: Optional[zd.Tab] = None, default: Optional[PauseRange] = None) -> None:
+        # actions imports this module, so it is only imported once a pause is taken.
+        from .actions import human_delay
+
+        low, high = self.policy.range_for(name, default)
+        duration = random.uniform(low, max(low, high)) * self.policy.scale
+        if self.remaining is not None:
+            duration = min(duration, self.remaining)
+        started = time.monotonic()
+        if duration > 0:
+            limit = self.policy.max_mouse_events
+            self.mouse_events += await human_delay(
+                tab if self.policy.mouse_jitter else None,
+                duration,
+                duration,
+                max_mouse_events=None if limit is None else max(limit - self.mouse_events, 0),
+            )
+        self.seconds[name] = self.seconds.get(name, 0.0) + time.monotonic() - started
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    def snapshot(self) -> dict:
+        return {
+            "total_seconds": round(self.total, 3),
+            "budget": self.policy.budget,
+            "mouse_events": self.mouse_events,
+            "pauses": {
+                name: {"count": self.counts[name], "seconds": round(seconds, 3)}
+                for name, seconds in self.seconds.items()
+            },
+        }
@@ -1,18 +1,91 @@
 import asyncio
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional
 
 import zendriver as zd
 
-from . import actions
-from . import constants as c
+from . import actions, network, runner
 from .by import By
+from .pacing import PacingPolicy, PacingTracker
 from .objects import Accomplishment, Contact, ContactInfoItem, Education, Experience, Interest, Scraper
 
+# Collectors that Person.scrape can run; "top_card" covers name, location and open-to-work.
+SECTIONS = (
+    "top_card",
+    "about",
+    "experiences",
+    "educations",
+    "interests",
+    "accomplishments",
+    "contact_info",
+    "contacts",
+)
+
+
+# Bump when PROFILE_PAGE_SCRIPT's result changes shape; new optional keys need no bump.
+PROFILE_PAGE_SCHEMA_VERSION = 1
+
+PROFILE_PAGE_SCRIPT = """
+(() => {
+    const text = (el) => (el?.innerText || '').trim();
+    const root = document.querySelector('main .mt2.relative') || document.querySelector('main');
+
+    const badge = document.querySelector('.pv-top-card-profile-picture img');
+
+    let about = null;
+    const aboutAnchor = document.getElementById('about');
+    if (aboutAnchor) {
+        const container = aboutAnchor.closest('section') || aboutAnchor.parentElement;
+        const target = container?.querySelector('.display-flex') || container;
+        about = text(target) || null;
+    }
+
+    const interestsRoot = document.querySelector('.pv-profile-section.pv-interests-section.artdeco-container-card') ||
+                          document.querySelector('[id*=interests]');
+    const interests = Array.from(interestsRoot?.querySelectorAll('.pv-interest-entity, li.artdeco-list__item') || [])
+        .map(el => text(el.querySelector('h3') || el.querySelector('span') || el))
+        .filter(Boolean);
+
+    const accomplishments = [];
+    const accRoot = document.querySelector('.pv-profile-section.pv-accomplishments-section.artdeco-container-card');
+    accRoot?.querySelectorAll('.pv-accomplishments-block__content.break-words').forEach(block => {
+        const category = text(block.querySelector('h3'));
+        block.querySelectorAll('ul li').forEach(li => accomplishments.push({category, title: text(li)}));
+    });
+
+    return {
+        schema: %d,
+        name: root ? text(root.querySelector('h1')) : '',
+        location: root ? text(root.querySelector('.text-body-small.inline.t-black--light.break-words')) : '',
+        open_to_work: !!(badge && badge.title && badge.title.includes('#OPEN_TO_WORK')),
+        about,
+        interests,
+        accomplishments,
+    };
+})();
+""" % PROFILE_PAGE_SCHEMA_VERSION
+
+
+def resolve_sections(sections: Optional[Iterable[str]] = None) -> FrozenSet[str]:
+    """Validate a ``sections`` argument; ``None`` selects every section."""
+    if sections is None:
+        return frozenset(SECTIONS)
+    if isinstance(sections, str):
+        sections = [sections]
+    selected = frozenset(sections)
+    unknown = selected.difference(SECTIONS)
+    if unknown:
+        raise ValueError(
+            "Unknown sections: {}. Choose from: {}".format(", ".join(sorted(unknown)), ", ".join(SECTIONS))
+        )
+    return selected
+
 
 class Person(Scraper):
     __TOP_CARD = "main"
     __WAIT_FOR_ELEMENT_TIMEOUT = 5
+    __PROFILE_PAGE_SECTIONS = frozenset({"top_card", "about", "interests", "accomplishments"})
+    __DETAIL_SECTIONS = ("experiences", "educations", "contact_info")
 
     def __init__(
         self,
@@ -33,7 +106,21 @@ class Person(Scraper):
         close_on_complete: bool = True,
         time_to_wait_after_login: int = 0,
         headless: bool = False,
+        sections: Optional[Iterable[str]] = None,
+        parallel_details: bool = False,
+        auth_state: Optional[actions.AuthState] = None,
+        pacing: Optional[PacingPolicy] = None,
     ):
+        self.sections = resolve_sections(sections)
+        # Load the details/* and contact-info pages in sibling tabs at the same time.
+        self.parallel_details = parallel_details
+        # Shared with the session that logged in, so the DOM probe can be skipped.
+        self.auth_state = auth_state
+        self.pacing_policy = pacing or PacingPolicy()
+        # Time spent at each pause point of the current scrape.
+        self.pacing: PacingTracker = self.pacing_policy.tracker()
+        # Requests the browser's ResourcePolicy kept out of the current scrape.
+        self.resources_saved = network.ResourceStats()
         self.linkedin_url = linkedin_url
         self.name = name
         self.about = about or []
@@ -44,6 +131,9 @@ class Person(Scraper):
         self.also_viewed_urls: List[str] = []
         self.contacts = contacts or []
         self.contact_info = contact_info or []
+        self.open_to_work: Optional[bool] = None
+        # Every URL this Person loaded, in order; each page should appear at most once per scrape.
+        self.page_loads: List[str] = []
 
         self._external_loop: Optional[asyncio.AbstractEventLoop] = None
         try:
@@ -51,10 +141,9 @@ class Person(Scraper):
         except RuntimeError:
             self._external_loop = None
 
-        # Only create our own loop when none is running already.
+        # Without a running loop, the synchronous API drives the shared background loop.
         if self._external_loop is None:
-            self.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.loop)
+            self.loop = runner.get_loop()
         else:
             self.loop = None
 
@@ -64,6 +153,7 @@ class Person(Scraper):
         if isinstance(driver, zd.Browser):
             self.browser = driver
             if get and linkedin_url:
+                self.page_loads.append(linkedin_url)
                 if self._external_loop:
                     self._pending_nav = asyncio.create_task(self.browser.get(linkedin_url))
                     self.driver = None
@@ -77,10 +167,11 @@ class Person(Scraper):
             self.browser = driver.browser
             self._owns_browser = False
             if get and linkedin_url:
+                # Navigate the given tab itself; browser.get() would drive the browser's first tab.
                 if self._external_loop:
-                    self._pending_nav = asyncio.create_task(self.browser.get(linkedin_url))
+                    self._pending_nav = asyncio.create_task(self._navigate(linkedin_url))
                 else:
-                    self.driver = self._run(self.browser.get(linkedin_url))
+                    self.driver = self._run(self._navigate(linkedin_url))
         else:
             if self._external_loop:
                 raise RuntimeError(
@@ -91,10 +182,12 @@ class Person(Scraper):
             self.browser = self._run(actions.start_browser(config))
             self._owns_browser = True
             target_url = linkedin_url or "about:blank"
+            if get and linkedin_url:
+                self.page_loads.append(linkedin_url)
             self.driver = self._run(self.browser.get(target_url)) if get else None
 
         if self.driver and get and linkedin_url and not self._external_loop:
-            self._run(actions.reject_cookies(self.driver, timeout=15, retries=2, retry_delay=2))
+            self._run(actions.reject_cookies(self.driver, timeout=15, retries=2, pacing=self.pacing))
 
         if scrape and self.driver:
             if self._external_loop:
@@ -128,6 +221,10 @@ class Person(Scraper):
     def add_contact_info(self, contact_info):
         self.contact_info.append(contact_info)
 
+    async def _navigate(self, url: str, tab: Optional[zd.Tab] = None) -> zd.Tab:
+        self.page_loads.append(url)
+        return await (tab or self.driver).get(url)
+
     async def _ensure_navigation(self):
         if self._pending_nav:
             try:
@@ -139,28 +236,15 @@ class Person(Scraper):
 
     async def _is_signed_in_async(self) -> bool:
         try:
-            await actions.wait_for_element(
-                self.driver,
-                by=By.CLASS_NAME,
-                name=c.VERIFY_LOGIN_ID,
-                timeout=self.WAIT_FOR_ELEMENT_TIMEOUT,
-            )
-            return True
-        except Exception:
-            pass
-        try:
-            await actions.wait_for_element(
-                self.driver,
-                by=By.CSS_SELECTOR,
-                name="input[placeholder*='Search']",
-                timeout=self.WAIT_FOR_ELEMENT_TIMEOUT,
-            )
-            return True
+            if self.auth_state is not None:
+                return await self.auth_state.check(self.driver, timeout=self.WAIT_FOR_ELEMENT_TIMEOUT)
+            return await actions.is_logged_in(self.driver, timeout=self.WAIT_FOR_ELEMENT_TIMEOUT)
         except Exception:
-            pass
-        return False
+            return False
 
-    def scrape(self, close_on_complete: bool = True):
+    def scrape(self, close_on_complete: bool = True, sections: Optional[Iterable[str]] = None):
+        if sections is not None:
+            self.sections = resolve_sections(sections)
         if not self.driver:
             return
         if self._external_loop:
@@ -176,7 +260,9 @@ class Person(Scraper):
             if close_on_complete and self._owns_browser and self.browser:
                 self._run(self.browser.stop())
 
-    async def scrape_async(self, close_on_complete: bool = True):
+    async def scrape_async(self, close_on_complete: bool = True, sections: Optional[Iterable[str]] = None):
+        if sections is not None:
+            self.sections = resolve_sections(sections)
         if not self.driver and self._pending_nav:
             await self._ensure_navigation()
         if not self.driver:
@@ -195,6 +281,9 @@ class Person(Scraper):
         driver = self.driver
         if not driver:
             return
+        self.pacing = self.pacing_policy.tracker()
+        self.resources_saved = network.ResourceStats()
+        resources_before = network.stats_for(driver)
 
         await actions.wait_for_element(
             driver,
@@ -206,66 +295,91 @@ class Person(Scraper):
             await driver.bring_to_front()
         except Exception:
             pass
-        await actions.human_delay(driver, min_seconds=2, max_seconds=4)
-
-        await self._collect_name_and_location()
-        await actions.human_delay(driver, min_seconds=1, max_seconds=2.5)
-
-        self.open_to_work = await self._is_open_to_work()
-
-        await self._collect_about()
-        await driver.evaluate(
-            "window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));"
-        )
-        await actions.human_delay(driver, min_seconds=1, max_seconds=2.5)
-        await driver.evaluate(
-            "window.scrollTo(0, Math.ceil(document.body.scrollHeight/1.5));"
-        )
-        await actions.human_delay(driver, min_seconds=1, max_seconds=2.5)
-
-        await self._collect_experiences()
-        await actions.human_delay(driver, min_seconds=1, max_seconds=2.5)
+        sections = self.sections
+        # Only sections that are requested get their page loads and pauses. Everything
+        # read from the profile page itself is collected now, before navigating away.
+        if sections & self.__PROFILE_PAGE_SECTIONS:
+            await self.pacing.pause("profile.settle", driver)
+            await driver.evaluate(
+                "window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));"
+            )
+            await self.pacing.pause("profile.scroll", driver)
+            await driver.evaluate(
+                "window.scrollTo(0, Math.ceil(document.body.scrollHeight/1.5));"
+            )
+            await self.pacing.pause("profile.scroll", driver)
+            # Lower profile sections render lazily, so read the page after scrolling.
+            await self._collect_profile_page()
 
-        await self._collect_educations()
-        await actions.human_delay(driver, min_seconds=1, max_seconds=2.5)
+        details = [name for name in self.__DETAIL_SECTIONS if name in sections]
+        if self.parallel_details and len(details) > 1 and self.browser:
+            await self._collect_details_in_tabs(details)
+        else:
+            if "experiences" in sections:
+                await self._collect_experiences()
+                await self.pacing.pause("details.next", driver)
 
-        await driver.get(self.linkedin_url)
-        await actions.human_delay(driver, min_seconds=1, max_seconds=2.5)
+            if "educations" in sections:
+                await self._collect_educations()
+                await self.pacing.pause("details.next", driver)
 
-        await self._collect_interests()
-        await self._collect_accomplishments()
-        await actions.human_delay(driver, min_seconds=1, max_seconds=2.5)
-        await self._collect_contact_info()
-        await self._collect_contacts()
+            if "contact_info" in sections:
+                await self._collect_contact_info()
+        if "contacts" in sections:
+            await self._collect_contacts()
+        self.resources_saved.add(network.stats_for(driver).since(resources_before))
 
         if close_on_complete and self._owns_browser and self.browser:
             await self.browser.stop()
 
-    async def _is_open_to_work(self) -> bool:
-        try:
-            return bool(
-                await self.driver.evaluate(
-                    """
-                    const badge = document.querySelector('.pv-top-card-profile-picture img');
-                    return badge && badge.title && badge.title.includes('#OPEN_TO_WORK');
-                    """
-                )
-            )
-        except Exception:
-            return False
+    async def _collect_details_in_tabs(self, details: List[str]):
+        """Load each detail page in its own sibling tab and extract them concurrently.
 
-    async def _collect_experiences(self):
-        if not self.linkedin_url or not self.driver:
+        Every collector appends to its own list on this Person, so merging the
+        results needs no extra step. The sibling tabs report their navigations to
+        ``auth_state`` like the main tab and are closed afterwards.
+        """
+        collectors = {
+            "experiences": self._collect_experiences,
+            "educations": self._collect_educations,
+            "contact_info": self._collect_contact_info,
+        }
+
+        async def run(name: str):
+            tab = await actions.open_tab(self.browser)
+            if self.auth_state is not None:
+                self.auth_state.watch(tab)
+            try:
+                await collectors[name](tab)
+            finally:
+                self.resources_saved.add(network.stats_for(tab))
+                network.forget(tab)
+                if self.auth_state is not None:
+                    self.auth_state.forget(tab)
+                try:
+                    await tab.close()
+                except Exception:
+                    pass
+
+        results = await asyncio.gather(*(run(name) for name in details), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def _collect_experiences(self, tab: Optional[zd.Tab] = None):
+        tab = tab or self.driver
+        if not self.linkedin_url or not tab:
             return
         url = os.path.join(self.linkedin_url, "details/experience")
-        await self.driver.get(url)
-        await actions.human_delay(self.driver, min_seconds=1, max_seconds=2.5)
-        try:
-            await self.driver.bring_to_front()
-        except Exception:
-            pass
-        await actions.human_like_scroll(self.driver, target_ratio=0.5)
-        await actions.human_like_scroll(self.driver, target_ratio=1.0)
+        await self._navigate(url, tab)
+        await self.pacing.pause("details.load", tab)
+        if tab is self.driver:
+            try:
+                await tab.bring_to_front()
+            except Exception:
+                pass
+        await actions.human_like_scroll(tab, target_ratio=0.5, pacing=self.pacing)
+        await actions.human_like_scroll(tab, target_ratio=1.0, pacing=self.pacing)
 
         script = """
         (() => {
@@ -354,7 +468,7 @@ class Person(Scraper):
             return result;
         })();
         """
-        experiences: List[Dict[str, Any]] = await self.driver.evaluate(script, await_promise=True)
+        experiences: List[Dict[str, Any]] = await tab.evaluate(script, await_promise=True)
         for item in experiences or []:
             experience = Experience(
                 position_title=item.get("position_title"),
@@ -368,18 +482,20 @@ class Person(Scraper):
             )
             self.add_experience(experience)
 
-    async def _collect_educations(self):
-        if not self.linkedin_url or not self.driver:
+    async def _collect_educations(self, tab: Optional[zd.Tab] = None):
+        tab = tab or self.driver
+        if not self.linkedin_url or not tab:
             return
         url = os.path.join(self.linkedin_url, "details/education")
-        await self.driver.get(url)
-        await actions.human_delay(self.driver, min_seconds=1, max_seconds=2.5)
-        try:
-            await self.driver.bring_to_front()
-        except Exception:
-            pass
-        await actions.human_like_scroll(self.driver, target_ratio=0.5)
-        await actions.human_like_scroll(self.driver, target_ratio=1.0)
+        await self._navigate(url, tab)
+        await self.pacing.pause("details.load", tab)
+        if tab is self.driver:
+            try:
+                await tab.bring_to_front()
+            except Exception:
+                pass
+        await actions.human_like_scroll(tab, target_ratio=0.5, pacing=self.pacing)
+        await actions.human_like_scroll(tab, target_ratio=1.0, pacing=self.pacing)
 
         script = """
         (() => {
@@ -425,7 +541,7 @@ class Person(Scraper):
             return result;
         })();
         """
-        educations: List[Dict[str, Any]] = await self.driver.evaluate(script, await_promise=True)
+        educations: List[Dict[str, Any]] = await tab.evaluate(script, await_promise=True)
         for item in educations or []:
             education = Education(
                 from_date=item.get("from_date"),
@@ -437,102 +553,50 @@ class Person(Scraper):
             )
             self.add_education(education)
 
-    async def _collect_name_and_location(self):
-        if not self.driver:
-            return
-        data = await self.driver.evaluate(
-            """
-            (() => {
-                const root = document.querySelector('main .mt2.relative') || document.querySelector('main');
-                return {
-                    name: root ? (root.querySelector('h1')?.innerText || '').trim() : '',
-                    location: root ? (root.querySelector('.text-body-small.inline.t-black--light.break-words')?.innerText || '').trim() : ''
-                };
-            })();
-            """
-        )
-        if data:
-            self.name = data.get("name") or self.name
-            self.location = data.get("location") or getattr(self, "location", None)
-
-    async def _collect_about(self):
-        if not self.driver:
-            return
-        about = await self.driver.evaluate(
-            """
-            (() => {
-                const aboutSection = document.getElementById('about');
-                if (!aboutSection) return null;
-                const container = aboutSection.closest('section') || aboutSection.parentElement;
-                const target = container?.querySelector('.display-flex') || container;
-                return target?.innerText?.trim() || null;
-            })();
-            """
-        )
-        self.about = about
+    async def _collect_profile_page(self):
+        """Read every profile-page section in a single evaluate round trip.
 
-    async def _collect_interests(self):
+        Raises instead of leaving the sections empty when the page cannot be read,
+        so a failed read is not mistaken for a profile without these sections.
+        """
         if not self.driver:
             return
         try:
-            interest_titles = await self.driver.evaluate(
-                """
-                (() => {
-                    const container = document.querySelector('.pv-profile-section.pv-interests-section.artdeco-container-card') ||
-                                       document.querySelector('[id*=interests]');
-                    const items = Array.from(container?.querySelectorAll('.pv-interest-entity, li.artdeco-list__item') || []);
-                    return items.map(el => {
-                        const target = el.querySelector('h3') || el.querySelector('span') || el;
-                        return (target.innerText || '').trim();
-                    }).filter(Boolean);
-                })();
-                """
-            )
-            for title in interest_titles or []:
+            data = await self.driver.evaluate(PROFILE_PAGE_SCRIPT)
+        except Exception as exc:
+            raise RuntimeError(f"Could not read the profile page: {exc!r}") from exc
+        if not isinstance(data, dict) or data.get("schema") != PROFILE_PAGE_SCHEMA_VERSION:
+            raise RuntimeError(f"Unexpected profile page data: {data!r:.200}")
+        sections = self.sections
+        if "top_card" in sections:
+            self.name = data.get("name") or self.name
+            self.location = data.get("location") or getattr(self, "location", None)
+            self.open_to_work = bool(data.get("open_to_work"))
+        if "about" in sections:
+            self.about = data.get("about")
+        if "interests" in sections:
+            for title in data.get("interests") or []:
                 self.add_interest(Interest(title))
-        except Exception:
-            pass
-
-    async def _collect_accomplishments(self):
-        if not self.driver:
-            return
-        try:
-            accomplishments = await self.driver.evaluate(
-                """
-                (() => {
-                    const acc = document.querySelector('.pv-profile-section.pv-accomplishments-section.artdeco-container-card');
-                    if (!acc) return [];
-                    const result = [];
-                    const blocks = acc.querySelectorAll('.pv-accomplishments-block__content.break-words');
-                    blocks.forEach(block => {
-                        const category = block.querySelector('h3')?.innerText?.trim() || '';
-                        block.querySelectorAll('ul li').forEach(li => {
-                            result.push({category, title: (li.innerText || '').trim()});
-                        });
-                    });
-                    return result;
-                })();
-                """
-            )
-            for item in accomplishments or []:
+        if "accomplishments" in sections:
+            for item in data.get("accomplishments") or []:
                 self.add_accomplishment(Accomplishment(item.get("category"), item.get("title")))
-        except Exception:
-            pass
 
-    async def _collect_contact_info(self):
-        if not self.linkedin_url or not self.driver:
+    async def _collect_contact_info(self, tab: Optional[zd.Tab] = None):
+        tab = tab or self.driver
+        if not self.linkedin_url or not tab:
             return
         url = os.path.join(self.linkedin_url, "overlay/contact-info/")
-        await self.driver.get(url)
-        await actions.human_delay(self.driver, min_seconds=1, max_seconds=3)
-        try:
-            await self.driver.bring_to_front()
-        except Exception:
-            pass
+        await self._navigate(url, tab)
+        await self.pacing.pause("contact_info.load", tab)
+        if tab is self.driver:
+            try:
+                await tab.bring_to_front()
+            except Exception:
+                pass
         # Wait briefly for the overlay content to render.
         try:
             await actions.wait_for_element(
-                self.driver,
+                tab,
                 by=By.CSS_SELECTOR,
                 name="section[class*='ci-'], section.pv-contact-info__contact-type",
                 timeout=5,
@@ -584,7 +648,7 @@ class Person(Scraper):
             return results;
         })();
         """
-        contact_info = await self.driver.evaluate(script, await_promise=True)
+        contact_info = await tab.evaluate(script, await_promise=True)
         for item in contact_info or []:
             self.add_contact_info(
                 ContactInfoItem(
@@ -599,8 +663,8 @@ class Person(Scraper):
         if not self.driver:
             return
         try:
-            await self.driver.get("https://www.linkedin.com/mynetwork/invite-connect/connections/")
-            await actions.human_delay(self.driver, min_seconds=1, max_seconds=2.5)
+            await self._navigate("https://www.linkedin.com/mynetwork/invite-connect/connections/")
+            await self.pacing.pause("contacts.load", self.driver)
             contacts = await self.driver.evaluate(
                 """
                 (() => {
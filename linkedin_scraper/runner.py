@@ -0,0 +1,100 @@
+"""One process-wide event loop on a background thread that drives the synchronous Scraper API."""
+
+import asyncio
+import atexit
+import concurrent.futures
+import threading
+from typing import Any, Awaitable, Optional, Set
+
+_lock = threading.Lock()
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_thread: Optional[threading.Thread] = None
+# Browsers started on the shared loop; their connections die with it, so shutdown stops them first.
+_browsers: Set[Any] = set()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared loop, starting its thread on first use."""
+    global _loop, _thread
+    with _lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+            thread = threading.Thread(target=_serve, args=(loop, ready), name="linkedin-scraper-loop", daemon=True)
+            thread.start()
+            ready.wait()
+            _loop, _thread = loop, thread
+        return _loop
+
+
+def run(coro: Awaitable[Any], loop: Optional[asyncio.AbstractEventLoop] = None) -> Any:
+    """Run ``coro`` on ``loop`` (the shared one by default) and block until it is done.
+
+    Safe to call from any number of threads at once, but not from a thread that
+    runs an event loop itself: that loop would stall, so await the coroutine there.
+    """
+    loop = loop or get_loop()
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        if asyncio.iscoroutine(coro):
+            coro.close()
+        raise RuntimeError("The synchronous scraper API cannot be used inside a running event loop; await it instead.")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+def track(browser: Any) -> None:
+    """Remember ``browser`` for ``shutdown`` when it was started on the shared loop."""
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    if running is _loop:
+        _browsers.difference_update([known for known in _browsers if getattr(known, "stopped", False)])
+        _browsers.add(browser)
+
+
+def shutdown(timeout: float = 10) -> None:
+    """Stop the browsers started on the shared loop, then the loop itself, and join its thread.
+
+    The next ``run`` starts a new loop.
+    """
+    global _loop, _thread
+    with _lock:
+        loop, thread = _loop, _thread
+        _loop = _thread = None
+    if loop is None:
+        return
+    if thread is not threading.current_thread():
+        try:
+            asyncio.run_coroutine_threadsafe(_stop_browsers(), loop).result(timeout)
+        except concurrent.futures.TimeoutError:
+            pass
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout)
+
+
+async def _stop_browsers() -> None:
+    browsers = [browser for browser in list(_browsers) if not getattr(browser, "stopped", False)]
+    _browsers.clear()
+    # A browser that fails to stop must not keep the others running.
+    await asyncio.gather(*(browser.stop() for browser in browsers), return_exceptions=True)
+
+
+def _serve(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+    asyncio.set_event_loop(loop)
+    loop.call_soon(ready.set)
+    try:
+        loop.run_forever()
+    finally:
+        pending = asyncio.all_tasks(loop)
+        for task in pending:
+            task.cancel()
+        loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+atexit.register(shutdown)
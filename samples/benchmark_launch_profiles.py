@@ -0,0 +1,65 @@
+"""Compare browser launch profiles: startup time and memory per browser.
+
+    python samples/benchmark_launch_profiles.py --runs 3 --headless
+
+No login is needed; every run starts a browser on a throwaway profile, loads
+``--url`` and samples the memory of the whole Chromium process tree.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Ensure project root is importable when running the sample directly
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from api.memory import MB, process_tree_rss
+from linkedin_scraper import actions
+
+
+async def measure(profile: str, url: str, headless: bool, settle: float) -> tuple:
+    with tempfile.TemporaryDirectory(prefix="linkedin-scraper-bench-") as user_data_dir:
+        config = actions.build_browser_config(headless=headless, user_data_dir=user_data_dir, launch_profile=profile)
+        started = time.monotonic()
+        browser = await actions.start_browser(config)
+        try:
+            tab = await browser.get(url)
+            await tab.wait_for_ready_state("complete", timeout=60)
+            startup = time.monotonic() - started
+            await asyncio.sleep(settle)
+            process = getattr(browser, "_process", None)
+            rss = process_tree_rss(process.pid) if process is not None else None
+        finally:
+            await browser.stop()
+    return startup, rss
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profiles", nargs="+", default=list(actions.LAUNCH_PROFILES))
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--url", default="https://www.linkedin.com/")
+    parser.add_argument("--settle", type=float, default=5, help="seconds to wait before sampling memory")
+    parser.add_argument("--headless", action="store_true")
+    args = parser.parse_args()
+
+    print(f"{'profile':<10} {'runs':>4} {'startup s':>10} {'memory MB':>10}")
+    for profile in args.profiles:
+        startups, memory = [], []
+        for _ in range(args.runs):
+            startup, rss = await measure(profile, args.url, args.headless, args.settle)
+            startups.append(startup)
+            if rss is not None:
+                memory.append(rss / MB)
+        memory_text = f"{statistics.median(memory):>10.0f}" if memory else f"{'n/a':>10}"
+        print(f"{profile:<10} {args.runs:>4} {statistics.median(startups):>10.2f} {memory_text}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
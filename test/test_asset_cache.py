@@ -0,0 +1,232 @@
+import asyncio
+import base64
+import hashlib
+import http.server
+import threading
+import urllib.error
+import urllib.request
+from itertools import count
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import pytest
+from zendriver import cdp
+
+from linkedin_scraper.assets import AssetCache
+from linkedin_scraper.network import ResourceFilter
+
+ASSETS = {
+    "/app.js": (b"console.log('fixture');", "application/javascript"),
+    "/app.css": (b"body { color: black; }", "text/css"),
+}
+
+
+class AssetHandler(http.server.BaseHTTPRequestHandler):
+    """Serves ASSETS with an ETag and a one-minute lifetime; answers If-None-Match with 304."""
+
+    requests: List[Tuple[str, Optional[str]]]
+
+    def do_GET(self):
+        body, content_type = ASSETS[self.path]
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()
+        self.requests.append((self.path, self.headers.get("If-None-Match")))
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "max-age=60")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "max-age=60")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def asset_server():
+    requests: List[Tuple[str, Optional[str]]] = []
+    handler = type("Handler", (AssetHandler,), {"requests": requests})
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", requests
+    server.shutdown()
+    server.server_close()
+
+
+def _fetch(url: str, headers: Dict[str, str]) -> Tuple[int, List[Tuple[str, str]], bytes]:
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, headers=headers)) as response:
+            return response.status, list(response.headers.items()), response.read()
+    except urllib.error.HTTPError as error:
+        return error.code, list(error.headers.items()), error.read()
+
+
+class FetchTab:
+    """Plays the browser's side of the Fetch domain for one tab.
+
+    Only https URLs are cached, so requests for ``https://assets.test`` are sent
+    to the local fixture server instead. Redirects are followed with a new request.
+    """
+
+    def __init__(self, origin: str) -> None:
+        self.origin = origin
+        self.handlers: List[Any] = []
+        self._ids = count()
+        self._pending: Dict[str, Dict[str, Any]] = {}
+
+    def add_handler(self, event_type, handler) -> None:
+        self.handlers.append(handler)
+
+    async def load(self, url: str, resource_type: str) -> Tuple[str, bytes]:
+        """Request ``url`` and return how it was answered (``network`` or ``fulfilled``) and the body."""
+        request_id = f"request-{next(self._ids)}"
+        self._pending[request_id] = {
+            "url": url,
+            "resource_type": resource_type,
+            "headers": {"Accept": "*/*"},
+            "done": asyncio.get_running_loop().create_future(),
+        }
+        self._pause(request_id)
+        return await asyncio.wait_for(self._pending[request_id]["done"], timeout=10)
+
+    async def send(self, command):
+        request = next(command)
+        result = await self._handle(request["method"], request.get("params", {}))
+        try:
+            command.send(result)
+        except StopIteration as stop:
+            return stop.value
+
+    async def _handle(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        if method == "Fetch.enable":
+            return {}
+        pending = self._pending[params["requestId"]]
+        if method == "Fetch.getResponseBody":
+            return {"body": base64.b64encode(pending["response"][2]).decode(), "base64Encoded": True}
+        if method == "Fetch.fulfillRequest" and params["responseCode"] in (301, 302, 303, 307, 308):
+            location = next(entry["value"] for entry in params["responseHeaders"] if entry["name"] == "Location")
+            redirect_id = f"request-{next(self._ids)}"
+            self._pending[redirect_id] = {**pending, "url": location}
+            self._pending[redirect_id].pop("response", None)
+            self._pause(redirect_id)
+        elif method == "Fetch.fulfillRequest":
+            pending["done"].set_result(("fulfilled", base64.b64decode(params.get("body", ""))))
+        elif method == "Fetch.failRequest":
+            pending["done"].set_result(("failed", b""))
+        elif method == "Fetch.continueRequest":
+            if "response" in pending:
+                pending["done"].set_result(("network", pending["response"][2]))
+                return {}
+            headers = pending["headers"]
+            if "headers" in params:
+                headers = {entry["name"]: entry["value"] for entry in params["headers"]}
+            url = self.origin + urlsplit(pending["url"]).path
+            pending["response"] = await asyncio.to_thread(_fetch, url, headers)
+            if params.get("interceptResponse"):
+                self._pause(params["requestId"])
+            else:
+                pending["done"].set_result(("network", pending["response"][2]))
+        return {}
+
+    def _pause(self, request_id: str) -> None:
+        pending = self._pending[request_id]
+        event = {
+            "requestId": request_id,
+            "request": {
+                "url": pending["url"],
+                "method": "GET",
+                "headers": pending["headers"],
+                "initialPriority": "High",
+                "referrerPolicy": "strict-origin-when-cross-origin",
+            },
+            "frameId": "frame",
+            "resourceType": pending["resource_type"],
+        }
+        if "response" in pending:
+            status, headers, _ = pending["response"]
+            event["responseStatusCode"] = status
+            event["responseHeaders"] = [{"name": name, "value": value} for name, value in headers]
+        for handler in self.handlers:
+            handler(cdp.fetch.RequestPaused.from_json(event))
+
+
+def test_assets_are_stored_served_and_revalidated(tmp_path, asset_server):
+    origin, server_requests = asset_server
+    cache = AssetCache(tmp_path / "assets")
+    cache.open()
+    pages = [("https://assets.test/app.js", "Script"), ("https://assets.test/app.css", "Stylesheet")]
+    expected = [ASSETS["/app.js"][0], ASSETS["/app.css"][0]]
+
+    async def load_all(tab: FetchTab) -> List[Tuple[str, bytes]]:
+        return [await tab.load(url, resource_type) for url, resource_type in pages]
+
+    async def run() -> None:
+        resource_filter = ResourceFilter(asset_cache=cache)
+        tab = FetchTab(origin)
+        await resource_filter.attach(tab)
+
+        # First load: downloaded and stored.
+        first = await load_all(tab)
+        assert first == [("network", body) for body in expected]
+        assert cache.misses == 2
+        assert cache.snapshot()["entries"] == 2
+        assert len(server_requests) == 2
+
+        # Fresh: answered from disk without touching the server.
+        second = await load_all(tab)
+        assert second == [("fulfilled", body) for body in expected]
+        assert resource_filter.totals.cache_hits == 2
+        assert resource_filter.stats_for(tab).cache_bytes == sum(len(body) for body in expected)
+        assert len(server_requests) == 2
+
+        # Stale: revalidated with If-None-Match, the 304 is served from disk.
+        cache._conn.execute("UPDATE assets SET expires_at = 0")
+        third = await load_all(tab)
+        assert third == [("fulfilled", body) for body in expected]
+        assert cache.revalidated == 2
+        assert len(server_requests) == 4
+        assert all(etag is not None for _, etag in server_requests[2:])
+
+    try:
+        asyncio.run(run())
+    finally:
+        cache.close()
+
+
+def test_revalidation_without_a_stored_body_downloads_again(tmp_path, asset_server):
+    origin, server_requests = asset_server
+    cache = AssetCache(tmp_path / "assets")
+    cache.open()
+    url = "https://assets.test/app.js"
+    body = ASSETS["/app.js"][0]
+
+    async def run() -> None:
+        resource_filter = ResourceFilter(asset_cache=cache)
+        tab = FetchTab(origin)
+        await resource_filter.attach(tab)
+        assert await tab.load(url, "Script") == ("network", body)
+
+        # The body disappears after the lookup, while the conditional request is out.
+        cache._conn.execute("UPDATE assets SET expires_at = 0")
+        read = cache.read
+        cache.read = lambda asset: None
+        assert await tab.load(url, "Script") == ("network", body)
+        assert cache.revalidated == 0
+        assert [etag is not None for _, etag in server_requests] == [False, True, False]
+
+        # The repeated download was stored again and serves the next load.
+        cache.read = read
+        assert await tab.load(url, "Script") == ("fulfilled", body)
+        assert len(server_requests) == 3
+
+    try:
+        asyncio.run(run())
+    finally:
+        cache.close()
@@ -0,0 +1,200 @@
+import asyncio
+from typing import List, Optional
+
+import pytest
+
+from api import main
+from api.cache import ProfileCache, SingleFlight, canonical_profile_id, canonical_profile_url
+
+TTL = 100
+STALE_TTL = 50
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.linkedin.com/in/jane-doe/",
+        "https://www.linkedin.com/in/jane-doe",
+        "https://linkedin.com/in/Jane-Doe/?trk=pub-pbmap&originalSubdomain=de",
+        "https://in.linkedin.com/in/jane-doe/details/experience/",
+        "  HTTPS://DE.LINKEDIN.COM/in/jane-doe/#about  ",
+        "https://www.linkedin.com/in/jane%2Ddoe/",
+    ],
+)
+def test_profile_url_variants_share_one_key(url):
+    assert canonical_profile_id(url) == "in/jane-doe"
+    assert canonical_profile_url(url) == "https://www.linkedin.com/in/jane-doe/"
+
+
+def test_other_urls_keep_their_host_and_path():
+    assert canonical_profile_id("https://www.linkedin.com/company/acme/?trk=x") == "www.linkedin.com/company/acme"
+    assert canonical_profile_id("https://example.com/in/jane-doe/") == "example.com/in/jane-doe"
+    assert canonical_profile_url("https://example.com/in/jane-doe/") == "https://example.com/in/jane-doe/"
+
+
+def _age(cache: ProfileCache, key: str, seconds: float) -> None:
+    cache._memory[key].scraped_at -= seconds
+
+
+def test_entries_are_servable_until_the_stale_window_ends():
+    cache = ProfileCache(None, ttl=TTL, stale_ttl=STALE_TTL)
+
+    async def run() -> None:
+        await cache.put("in/jane-doe", "output")
+        entry = await cache.get("in/jane-doe")
+        assert entry is not None and cache.is_fresh(entry)
+
+        _age(cache, "in/jane-doe", TTL + 1)
+        entry = await cache.get("in/jane-doe")
+        assert entry is not None and not cache.is_fresh(entry)
+
+        _age(cache, "in/jane-doe", STALE_TTL)
+        assert await cache.get("in/jane-doe") is None
+
+    asyncio.run(run())
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_a_sectioned_lookup_counts_once_and_only_falls_back_to_fresh_entries():
+    cache = ProfileCache(None, ttl=TTL, stale_ttl=STALE_TTL)
+
+    async def run() -> None:
+        assert await cache.get("in/jane-doe#top_card", fallback="in/jane-doe") is None
+        assert (cache.hits, cache.misses) == (0, 1)
+
+        await cache.put("in/jane-doe", "full")
+        entry = await cache.get("in/jane-doe#top_card", fallback="in/jane-doe")
+        assert entry is not None and entry.output == "full"
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        _age(cache, "in/jane-doe", TTL + 1)
+        assert await cache.get("in/jane-doe#top_card", fallback="in/jane-doe") is None
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    asyncio.run(run())
+
+
+class FakeSessions:
+    """Stands in for the session manager; every scrape returns a new output."""
+
+    def __init__(self) -> None:
+        self.calls: List[str] = []
+        self.release: Optional[asyncio.Event] = None
+
+    async def scrape_profile(self, linkedin_url: str, sections=None) -> str:
+        self.calls.append(linkedin_url)
+        if self.release is not None:
+            await self.release.wait()
+        return f"output {len(self.calls)}"
+
+
+@pytest.fixture
+def api(monkeypatch):
+    sessions = FakeSessions()
+    monkeypatch.setattr(main, "session_manager", sessions)
+    monkeypatch.setattr(main, "rate_limiter", main.DailyRateLimiter(limit=50))
+    monkeypatch.setattr(main, "profile_cache", ProfileCache(None, ttl=TTL, stale_ttl=STALE_TTL))
+    monkeypatch.setattr(main, "scrape_flights", SingleFlight())
+    monkeypatch.setattr(main, "revalidations", set())
+    monkeypatch.setattr(main, "refresh_reserve", 0)
+    return sessions
+
+
+async def _refreshed() -> None:
+    await asyncio.gather(*main.revalidations)
+
+
+def test_cache_ttl_max_age_and_stale_while_revalidate(api):
+    url = "https://de.linkedin.com/in/Jane-Doe/?trk=pub-pbmap"
+    key = "in/jane-doe"
+
+    async def run() -> None:
+        first = await main.fetch_profile(url)
+        assert (first["output"], first["cached"]) == ("output 1", False)
+        assert api.calls == ["https://www.linkedin.com/in/jane-doe/"]
+
+        again = await main.fetch_profile("https://www.linkedin.com/in/jane-doe")
+        assert (again["output"], again["cached"]) == ("output 1", True)
+
+        _age(main.profile_cache, key, 10)
+        assert (await main.fetch_profile(url, max_age=60))["cached"] is True
+        forced = await main.fetch_profile(url, max_age=5)
+        assert (forced["output"], forced["cached"]) == ("output 2", False)
+
+        # Stale: the old result is served and a background scrape replaces it.
+        _age(main.profile_cache, key, TTL + 1)
+        stale = await main.fetch_profile(url)
+        assert (stale["output"], stale["cached"]) == ("output 2", True)
+        await _refreshed()
+        assert main.profile_cache._memory[key].output == "output 3"
+
+        # Past the stale window the entry is gone and the caller waits for a scrape.
+        _age(main.profile_cache, key, TTL + STALE_TTL + 1)
+        expired = await main.fetch_profile(url)
+        assert (expired["output"], expired["cached"]) == ("output 4", False)
+
+    asyncio.run(run())
+    assert main.rate_limiter.count == 4
+    # A lookup that ``max_age`` rejects is still a hit; only the first and the expired one missed.
+    assert (main.profile_cache.hits, main.profile_cache.misses) == (4, 2)
+
+
+def test_background_refresh_leaves_the_reserve_alone(api, monkeypatch):
+    monkeypatch.setattr(main, "refresh_reserve", 49)
+
+    async def run() -> dict:
+        await main.fetch_profile("https://www.linkedin.com/in/jane-doe/")
+        _age(main.profile_cache, "in/jane-doe", TTL + 1)
+        stale = await main.fetch_profile("https://www.linkedin.com/in/jane-doe/")
+        await _refreshed()
+        return stale
+
+    stale = asyncio.run(run())
+    assert stale["cached"] is True
+    assert len(api.calls) == 1
+    assert main.rate_limiter.count == 1
+
+
+def test_concurrent_requests_share_one_scrape_and_one_charge(api):
+    urls = [
+        "https://www.linkedin.com/in/jane-doe/",
+        "https://in.linkedin.com/in/jane-doe/?trk=x",
+        "https://linkedin.com/in/JANE-DOE",
+    ]
+
+    async def run() -> List[dict]:
+        api.release = asyncio.Event()
+        requests = asyncio.gather(*(main.fetch_profile(url) for url in urls))
+        while not main.scrape_flights.in_flight("in/jane-doe") or main.scrape_flights.coalesced < 2:
+            await asyncio.sleep(0)
+        api.release.set()
+        return await requests
+
+    profiles = asyncio.run(run())
+    assert len(api.calls) == 1
+    assert main.rate_limiter.count == 1
+    assert {profile["output"] for profile in profiles} == {"output 1"}
+    assert sorted(profile["coalesced"] for profile in profiles) == [False, True, True]
+    assert main.scrape_flights.snapshot() == {"in_flight": 0, "coalesced": 2}
+
+
+def test_disconnected_batch_skips_waiting_items_but_finishes_running_scrapes(api, monkeypatch):
+    monkeypatch.setattr(main, "batch_concurrency", 1)
+    urls = ["https://www.linkedin.com/in/jane-doe/", "https://www.linkedin.com/in/john-roe/"]
+
+    async def run() -> None:
+        api.release = asyncio.Event()
+        stream = main._stream_batch(urls, None, None)
+        reading = asyncio.ensure_future(stream.__anext__())
+        while not api.calls:
+            await asyncio.sleep(0)
+        reading.cancel()
+        await asyncio.gather(reading, return_exceptions=True)
+        api.release.set()
+        while main.scrape_flights.in_flight("in/jane-doe"):
+            await asyncio.sleep(0)
+
+    asyncio.run(run())
+    assert api.calls == ["https://www.linkedin.com/in/jane-doe/"]
+    assert main.rate_limiter.count == 1
+    assert main.profile_cache._memory["in/jane-doe"].output == "output 1"
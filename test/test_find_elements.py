@@ -0,0 +1,181 @@
+import asyncio
+import json
+import shutil
+import subprocess
+from typing import Any, Dict, List
+
+import pytest
+import zendriver as zd
+
+from linkedin_scraper import actions
+from linkedin_scraper.by import By
+
+DOCUMENT = {
+    "nodeId": 1,
+    "backendNodeId": 1,
+    "nodeType": 9,
+    "nodeName": "#document",
+    "localName": "",
+    "nodeValue": "",
+    "children": [
+        {
+            "nodeId": 2,
+            "parentId": 1,
+            "backendNodeId": 2,
+            "nodeType": 1,
+            "nodeName": "SECTION",
+            "localName": "section",
+            "nodeValue": "",
+            "attributes": ["id", "experience"],
+            "children": [
+                {
+                    "nodeId": 3,
+                    "parentId": 2,
+                    "backendNodeId": 3,
+                    "nodeType": 1,
+                    "nodeName": "SPAN",
+                    "localName": "span",
+                    "nodeValue": "",
+                    "attributes": [],
+                    "children": [
+                        {
+                            "nodeId": 4,
+                            "parentId": 3,
+                            "backendNodeId": 4,
+                            "nodeType": 3,
+                            "nodeName": "#text",
+                            "localName": "",
+                            "nodeValue": "Engineer",
+                        }
+                    ],
+                }
+            ],
+        }
+    ],
+}
+
+
+def _find(node: Dict[str, Any], node_id: int) -> Dict[str, Any]:
+    if node["nodeId"] == node_id:
+        return node
+    return next(found for child in node.get("children", []) if (found := _find(child, node_id)))
+
+
+def _remote(object_id: str) -> Dict[str, Any]:
+    return {"type": "object", "objectId": object_id}
+
+
+def _property(name: str, value: Dict[str, Any]) -> Dict[str, Any]:
+    return {"name": name, "value": value, "configurable": True, "enumerable": True, "isOwn": True}
+
+
+class FakeTab(zd.Tab):
+    """Answers the Runtime and DOM commands of one batched lookup and records them.
+
+    The page "matches" the section for the first locator, the section and the span
+    for the second and nothing for the third.
+    """
+
+    def __init__(self) -> None:
+        self.commands: List[Dict[str, Any]] = []
+
+    async def send(self, command):
+        request = next(command)
+        self.commands.append(request)
+        try:
+            command.send(self._answer(request["method"], request.get("params", {})))
+        except StopIteration as stop:
+            return stop.value
+
+    def _answer(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        if method == "Runtime.evaluate":
+            return {"result": _remote("document")}
+        if method == "Runtime.callFunctionOn":
+            return {"result": _remote("matches")}
+        if method == "Runtime.getProperties":
+            counts = [_property(str(index), {"type": "number", "value": count}) for index, count in enumerate([1, 2, 0])]
+            nodes = [_property(str(3 + index), _remote(f"node-{node_id}")) for index, node_id in enumerate([2, 2, 3])]
+            return {"result": counts + nodes + [_property("length", {"type": "number", "value": 6})]}
+        if method == "DOM.describeNode":
+            node_id = int(params["objectId"].rpartition("-")[2])
+            return {"node": _find(DOCUMENT, node_id)}
+        return {}
+
+
+def test_batch_lookup_groups_matches_without_touching_the_page():
+    tab = FakeTab()
+    locators = [
+        (By.XPATH, "//section[@id='experience']"),
+        (By.CSS_SELECTOR, "section, span"),
+        (By.CLASS_NAME, "missing"),
+    ]
+
+    results = asyncio.run(actions.find_elements_batch(tab, locators))
+
+    assert [[elem.node_id for elem in matches] for matches in results] == [[2], [2, 3], []]
+    assert results[1][1].text == "Engineer"
+
+    methods = [command["method"] for command in tab.commands]
+    # One call per step, plus one description per match; no document fetch.
+    assert methods == [
+        "Runtime.evaluate",
+        "Runtime.callFunctionOn",
+        "Runtime.getProperties",
+        "DOM.describeNode",
+        "DOM.describeNode",
+        "DOM.describeNode",
+        "Runtime.releaseObjectGroup",
+    ]
+    call = tab.commands[methods.index("Runtime.callFunctionOn")]["params"]
+    assert call["arguments"][1]["value"] == [actions._locator_spec(by, value) for by, value in locators]
+    assert "setAttribute" not in call["functionDeclaration"]
+    assert not any(method.startswith("DOM.set") for method in methods)
+
+
+# A stand-in for the page: three elements, the root scope holding only "inside",
+# and an XPath engine that answers every expression with both "outside" and "inside"
+# the way "(//li)" would from anywhere in the document.
+SCOPE_HARNESS = """
+const ELEMENT_NODE = 1;
+globalThis.Node = { ELEMENT_NODE };
+globalThis.XPathResult = { ORDERED_NODE_SNAPSHOT_TYPE: 7, ORDERED_NODE_ITERATOR_TYPE: 5 };
+const inside = { name: "inside", nodeType: ELEMENT_NODE };
+const outside = { name: "outside", nodeType: ELEMENT_NODE };
+const scope = {
+    name: "scope", nodeType: ELEMENT_NODE,
+    contains: (node) => node === scope || node === inside,
+    querySelectorAll: () => [inside],
+    querySelector: () => null,
+};
+globalThis.window = {};
+globalThis.MutationObserver = class { observe() {} disconnect() {} };
+globalThis.document = {
+    evaluate: () => {
+        const nodes = [outside, inside];
+        let next = 0;
+        return {
+            snapshotLength: nodes.length,
+            snapshotItem: (index) => nodes[index],
+            iterateNext: () => nodes[next++] || null,
+        };
+    },
+};
+const matchNodes = %(match)s;
+const waitFor = %(wait)s;
+(async () => {
+    const matched = matchNodes(scope, [{ css: null, xpath: "(//li)" }, { css: null, xpath: "(.//li)[1]" }]);
+    const onlyOutside = { ...scope, contains: (node) => node === scope };
+    const waited = await waitFor(onlyOutside, [{ css: null, xpath: "(//li)[1]" }], 10, "token");
+    console.log(JSON.stringify({ matched: matched.map((item) => item.name || item), waited }));
+})();
+"""
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="needs node to run the page scripts")
+def test_xpath_matches_stay_inside_the_scope():
+    script = SCOPE_HARNESS % {"match": actions._MATCH_NODES_JS, "wait": actions._WAIT_FOR_LOCATORS_JS}
+    output = subprocess.run(["node", "-e", script], capture_output=True, text=True, check=True).stdout
+    result = json.loads(output)
+    assert result["matched"] == [1, 1, "inside", "inside"]
+    # Nothing inside the scope matches, so the wait times out instead of reporting the outside node.
+    assert result["waited"] == -1
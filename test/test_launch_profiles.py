@@ -0,0 +1,28 @@
+from linkedin_scraper import actions
+
+
+def _command_line(**kwargs):
+    # Any path will do: the config is only rendered, never launched.
+    config = actions.build_browser_config(browser_executable_path="/usr/bin/chromium", **kwargs)
+    return config()
+
+
+def test_lean_profile_flags_reach_the_command_line():
+    args = _command_line(launch_profile="lean", headless=True)
+    for flag in actions.LEAN_BROWSER_ARGS:
+        if not flag.startswith("--disable-features="):
+            assert flag in args
+    disabled = [arg for arg in args if arg.startswith("--disable-features=")]
+    assert len(disabled) == 1
+    features = disabled[0].split("=", 1)[1].split(",")
+    assert {"VizDisplayCompositor", "Translate", "OptimizationHints"} <= set(features)
+    assert any(arg.startswith("--window-size=") for arg in args)
+    assert [arg for arg in args if arg.startswith("--user-agent=")] == [f"--user-agent={actions.HEADLESS_USER_AGENT}"]
+
+
+def test_default_profile_keeps_caller_args():
+    args = _command_line(browser_args=["--window-size=1000,700", "--user-agent=Test/1.0"])
+    assert "--window-size=1000,700" in args
+    assert "--renderer-process-limit=2" not in args
+    assert [arg for arg in args if arg.startswith("--user-agent=")] == ["--user-agent=Test/1.0"]
+    assert "--disable-blink-features=AutomationControlled" in args
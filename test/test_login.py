@@ -0,0 +1,66 @@
+import asyncio
+from pathlib import Path
+
+from linkedin_scraper import actions
+from linkedin_scraper import constants as c
+from linkedin_scraper.pacing import PacingPolicy
+
+
+class FakeElement:
+    def __init__(self) -> None:
+        self.keys = []
+
+    async def send_keys(self, text):
+        self.keys.append(text)
+
+
+class FakeTab:
+    async def get(self, url):
+        return self
+
+
+def test_is_logged_in_can_ignore_logged_out_markers(monkeypatch):
+    seen = []
+
+    async def wait_for_any(tab, locators, timeout):
+        seen.append([value for _, value in locators])
+        raise asyncio.TimeoutError
+
+    monkeypatch.setattr(actions, "wait_for_any", wait_for_any)
+    assert asyncio.run(actions.is_logged_in(FakeTab(), timeout=1, until_signed_in=True)) is False
+    assert asyncio.run(actions.is_logged_in(FakeTab(), timeout=1)) is False
+    assert c.LOGGED_OUT_SELECTOR not in seen[0]
+    assert c.LOGGED_OUT_SELECTOR in seen[1]
+
+
+def test_credential_login_waits_for_signed_in_markers(monkeypatch, tmp_path):
+    checks = []
+
+    async def wait_for_element(tab, by, name, timeout):
+        return FakeElement()
+
+    async def reject_cookies(*args, **kwargs):
+        return False
+
+    async def is_logged_in(tab, timeout=10, *, until_signed_in=False):
+        checks.append(until_signed_in)
+        return False
+
+    monkeypatch.setattr(actions, "wait_for_element", wait_for_element)
+    monkeypatch.setattr(actions, "reject_cookies", reject_cookies)
+    monkeypatch.setattr(actions, "is_logged_in", is_logged_in)
+
+    tab = FakeTab()
+    result = asyncio.run(
+        actions._login_with_credentials(
+            tab,
+            email="jane@example.com",
+            password="secret",
+            timeout=1,
+            env_file=Path(tmp_path / ".env"),
+            pauses=PacingPolicy.zero().tracker(),
+        )
+    )
+    assert result is tab
+    # Right after submitting, the login form is still up; only signed-in markers may decide.
+    assert checks == [True]
@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+import zendriver as zd
+
+from linkedin_scraper import Person, actions
+from linkedin_scraper.pacing import PacingPolicy
+from linkedin_scraper.person import PROFILE_PAGE_SCHEMA_VERSION, PROFILE_PAGE_SCRIPT
+
+PROFILE_URL = "https://www.linkedin.com/in/jane-doe/"
+
+# Timer and scheduling slack allowed on top of the budget.
+SLACK = 0.05
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_pauses_stay_within_the_budget(monkeypatch, seed):
+    async def slow_jitter(tab, move_count=0, max_events=None, max_seconds=None):
+        # A jitter that would run well past the pause if it were not cut short.
+        await asyncio.sleep(min(0.5, max_seconds if max_seconds is not None else 0.5))
+        return 1
+
+    monkeypatch.setattr(actions, "_random_mouse_movements", slow_jitter)
+    actions.random.seed(seed)
+    tracker = PacingPolicy({"step": (0.1, 0.2)}, budget=0.3).tracker()
+
+    async def run() -> None:
+        for _ in range(4):
+            await tracker.pause("step", tab=object())
+
+    asyncio.run(run())
+    assert tracker.counts["step"] == 4
+    assert tracker.total <= 0.3 + SLACK
+    assert tracker.remaining == pytest.approx(0.0, abs=SLACK)
+
+
+def test_human_delay_lasts_the_chosen_length():
+    async def run() -> float:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await actions.human_delay(None, 0.2, 0.2)
+        return loop.time() - started
+
+    assert asyncio.run(run()) == pytest.approx(0.2, abs=SLACK)
+
+
+class ProfileTab(zd.Tab):
+    """Records its own sleeps; the cookie banner keeps rendering and page scripts find nothing."""
+
+    def __init__(self, sleeps) -> None:
+        self.sleeps = sleeps
+        self.browser = None
+
+    async def get(self, url="about:blank", new_tab=False, new_window=False):
+        return self
+
+    async def evaluate(self, expression, await_promise=False, return_by_value=True):
+        if expression == PROFILE_PAGE_SCRIPT:
+            return {"schema": PROFILE_PAGE_SCHEMA_VERSION}
+        if "cookie" in expression.lower():
+            return "pending"
+        return None
+
+    async def sleep(self, t=0.25):
+        self.sleeps.append(t)
+
+    async def bring_to_front(self):
+        pass
+
+
+def test_zero_policy_scrape_sleeps_nowhere(monkeypatch):
+    sleeps = []
+    real_sleep = asyncio.sleep
+
+    async def recording_sleep(delay, result=None):
+        if delay > 0:
+            sleeps.append(delay)
+        return await real_sleep(0, result)
+
+    async def found(*args, **kwargs):
+        return None
+
+    async def signed_in(*args, **kwargs):
+        return True
+
+    # Waiting for elements polls until a condition holds; only the deliberate pauses are checked here.
+    monkeypatch.setattr(actions, "wait_for_element", found)
+    monkeypatch.setattr(actions, "is_logged_in", signed_in)
+    monkeypatch.setattr(asyncio, "sleep", recording_sleep)
+
+    async def scrape() -> Person:
+        tab = ProfileTab(sleeps)
+        person = Person(
+            PROFILE_URL,
+            driver=tab,
+            scrape=False,
+            close_on_complete=False,
+            sections=["top_card", "experiences", "educations"],
+            pacing=PacingPolicy.zero(),
+        )
+        await actions.reject_cookies(tab, timeout=0.05, retries=1, pacing=person.pacing)
+        await person.scrape_async(close_on_complete=False)
+        return person
+
+    person = asyncio.run(scrape())
+
+    assert sleeps == []
+    pauses = person.pacing.snapshot()["pauses"]
+    assert pauses["scroll.settle"]["count"] == 4
+    assert all(pause["seconds"] < SLACK for pause in pauses.values())
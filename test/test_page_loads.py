@@ -0,0 +1,206 @@
+import asyncio
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+import pytest
+import zendriver as zd
+from zendriver import cdp
+
+from linkedin_scraper import Person, actions
+from linkedin_scraper.pacing import PacingPolicy
+from linkedin_scraper.person import PROFILE_PAGE_SCHEMA_VERSION, PROFILE_PAGE_SCRIPT
+
+PROFILE_URL = "https://www.linkedin.com/in/jane-doe/"
+SECTIONS = ["top_card", "about", "experiences", "educations", "contact_info"]
+
+
+class FakeBrowser:
+    pass
+
+
+class FakeTab(zd.Tab):
+    """Records every ``get()`` and reports it as a main-frame navigation; page scripts find nothing.
+
+    URLs in ``redirects`` land on another page, as an authwall would.
+    """
+
+    def __init__(self, loads: List[str], browser: FakeBrowser, redirects: Optional[Dict[str, str]] = None) -> None:
+        self.loads = loads
+        self.browser = browser
+        self.redirects = redirects or {}
+        self.navigation_handlers: List[Any] = []
+
+    def add_handler(self, event_type, handler) -> None:
+        if event_type is cdp.page.FrameNavigated:
+            self.navigation_handlers.append(handler)
+
+    async def get(self, url="about:blank", new_tab=False, new_window=False):
+        self.loads.append(url)
+        event = cdp.page.FrameNavigated.from_json(
+            {
+                "frame": {
+                    "id": "main",
+                    "loaderId": "loader",
+                    "url": self.redirects.get(url, url),
+                    "domainAndRegistry": "linkedin.com",
+                    "securityOrigin": "https://www.linkedin.com",
+                    "mimeType": "text/html",
+                    "secureContextType": "Secure",
+                    "crossOriginIsolatedContextType": "NotIsolated",
+                    "gatedAPIFeatures": [],
+                },
+                "type": "Navigation",
+            }
+        )
+        for handler in self.navigation_handlers:
+            handler(event)
+        return self
+
+    async def evaluate(self, expression, await_promise=False, return_by_value=True):
+        if expression == PROFILE_PAGE_SCRIPT:
+            return {"schema": PROFILE_PAGE_SCHEMA_VERSION}
+        return None
+
+    async def bring_to_front(self):
+        pass
+
+    async def close(self):
+        pass
+
+
+async def _noop(*args, **kwargs):
+    return None
+
+
+async def _signed_in(*args, **kwargs):
+    return True
+
+
+@pytest.mark.parametrize("parallel_details", [False, True])
+def test_each_page_is_loaded_once(monkeypatch, parallel_details):
+    loads: List[str] = []
+    browser = FakeBrowser()
+
+    async def open_tab(browser, url="about:blank"):
+        return FakeTab(loads, browser)
+
+    monkeypatch.setattr(actions, "open_tab", open_tab)
+    monkeypatch.setattr(actions, "wait_for_element", _noop)
+    monkeypatch.setattr(actions, "human_like_scroll", _noop)
+    monkeypatch.setattr(actions, "is_logged_in", _signed_in)
+
+    async def scrape() -> Person:
+        person = Person(
+            PROFILE_URL,
+            driver=FakeTab(loads, browser),
+            scrape=False,
+            close_on_complete=False,
+            sections=SECTIONS,
+            parallel_details=parallel_details,
+            pacing=PacingPolicy.zero(),
+        )
+        await person.scrape_async(close_on_complete=False)
+        return person
+
+    person = asyncio.run(scrape())
+
+    assert max(Counter(person.page_loads).values()) == 1
+    assert sorted(person.page_loads) == sorted(loads)
+    assert set(loads) == {
+        PROFILE_URL,
+        f"{PROFILE_URL}details/experience",
+        f"{PROFILE_URL}details/education",
+        f"{PROFILE_URL}overlay/contact-info/",
+    }
+
+
+def test_unrequested_sections_skip_their_pages(monkeypatch):
+    loads: List[str] = []
+    monkeypatch.setattr(actions, "wait_for_element", _noop)
+    monkeypatch.setattr(actions, "human_like_scroll", _noop)
+    monkeypatch.setattr(actions, "is_logged_in", _signed_in)
+
+    async def scrape() -> Person:
+        person = Person(
+            PROFILE_URL,
+            driver=FakeTab(loads, FakeBrowser()),
+            scrape=False,
+            close_on_complete=False,
+            sections=["top_card", "experiences"],
+            pacing=PacingPolicy.zero(),
+        )
+        await person.scrape_async(close_on_complete=False)
+        return person
+
+    person = asyncio.run(scrape())
+
+    assert person.page_loads == [PROFILE_URL, f"{PROFILE_URL}details/experience"]
+    assert loads == person.page_loads
+
+
+def test_detail_tabs_report_a_lost_session(monkeypatch):
+    loads: List[str] = []
+    authwall = "https://www.linkedin.com/authwall?trk=details"
+    redirects = {f"{PROFILE_URL}details/education": authwall}
+    browser = FakeBrowser()
+    opened: List[FakeTab] = []
+
+    async def open_tab(browser, url="about:blank"):
+        tab = FakeTab(loads, browser, redirects)
+        opened.append(tab)
+        return tab
+
+    monkeypatch.setattr(actions, "open_tab", open_tab)
+    monkeypatch.setattr(actions, "wait_for_element", _noop)
+    monkeypatch.setattr(actions, "human_like_scroll", _noop)
+    monkeypatch.setattr(actions, "is_logged_in", _signed_in)
+    auth_state = actions.AuthState()
+
+    async def scrape() -> None:
+        person = Person(
+            PROFILE_URL,
+            driver=FakeTab(loads, browser),
+            scrape=False,
+            close_on_complete=False,
+            sections=SECTIONS,
+            parallel_details=True,
+            auth_state=auth_state,
+            pacing=PacingPolicy.zero(),
+        )
+        await person.scrape_async(close_on_complete=False)
+
+    asyncio.run(scrape())
+
+    assert len(opened) == 3
+    assert all(tab.navigation_handlers for tab in opened)
+    assert auth_state.signed_in is False
+    assert auth_state.last_logged_out_url == authwall
+
+
+@pytest.mark.parametrize("result", [None, {"schema": PROFILE_PAGE_SCHEMA_VERSION + 1}, RuntimeError("Target closed")])
+def test_unreadable_profile_page_fails_the_scrape(monkeypatch, result):
+    monkeypatch.setattr(actions, "wait_for_element", _noop)
+    monkeypatch.setattr(actions, "human_like_scroll", _noop)
+    monkeypatch.setattr(actions, "is_logged_in", _signed_in)
+
+    class BrokenPageTab(FakeTab):
+        async def evaluate(self, expression, await_promise=False, return_by_value=True):
+            if expression != PROFILE_PAGE_SCRIPT:
+                return None
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+    async def scrape() -> None:
+        person = Person(
+            PROFILE_URL,
+            driver=BrokenPageTab([], FakeBrowser()),
+            scrape=False,
+            close_on_complete=False,
+            sections=["top_card", "about"],
+            pacing=PacingPolicy.zero(),
+        )
+        await person.scrape_async(close_on_complete=False)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(scrape())
@@ -0,0 +1,211 @@
+import asyncio
+import http.server
+import re
+import threading
+import urllib.request
+from fnmatch import fnmatchcase
+from itertools import count
+from typing import Any, Dict, List, Tuple
+from urllib.parse import urljoin
+
+import pytest
+from zendriver import cdp
+
+from linkedin_scraper.network import DEFAULT_ESTIMATED_SIZES, ResourceFilter, ResourcePolicy
+
+TRACKER_URL = "https://px.ads.linkedin.com/insight.js"
+PAGE = f"""<!doctype html>
+<html>
+  <head>
+    <link rel="preload" as="font" href="/font.woff2">
+    <script src="/app.js"></script>
+    <script src="{TRACKER_URL}"></script>
+  </head>
+  <body><img src="/logo.png"></body>
+</html>
+""".encode()
+FILES = {
+    "/": (PAGE, "text/html"),
+    "/app.js": (b"console.log('page');", "application/javascript"),
+    "/logo.png": (b"\x89PNG fixture", "image/png"),
+    "/font.woff2": (b"wOF2 fixture", "font/woff2"),
+}
+RESOURCE_TYPES = {".js": "Script", ".png": "Image", ".woff2": "Font"}
+
+
+class PageHandler(http.server.BaseHTTPRequestHandler):
+    requests: List[str]
+
+    def do_GET(self):
+        self.requests.append(self.path)
+        body, content_type = FILES[self.path]
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def page_server():
+    requests: List[str] = []
+    handler = type("Handler", (PageHandler,), {"requests": requests})
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", requests
+    server.shutdown()
+    server.server_close()
+
+
+def _download(url: str) -> bytes:
+    with urllib.request.urlopen(url) as response:
+        return response.read()
+
+
+class PageTab:
+    """Loads a page and its subresources the way Chrome's Fetch domain would.
+
+    Only requests that match the enabled patterns are paused and handed to the
+    handlers; the rest go straight to the network.
+    """
+
+    def __init__(self, fail_fulfill: bool = False) -> None:
+        self.fail_fulfill = fail_fulfill
+        self.handlers: List[Any] = []
+        self.patterns: List[cdp.fetch.RequestPattern] = []
+        self.paused: List[str] = []
+        self.methods: List[str] = []
+        self._ids = count()
+        self._outcomes: Dict[str, asyncio.Future] = {}
+        self._urls: Dict[str, str] = {}
+
+    def add_handler(self, event_type, handler) -> None:
+        self.handlers.append(handler)
+
+    async def send(self, command):
+        request = next(command)
+        method, params = request["method"], request.get("params", {})
+        self.methods.append(method)
+        if method == "Fetch.enable":
+            self.patterns = [cdp.fetch.RequestPattern.from_json(item) for item in params.get("patterns", [])]
+        elif method == "Fetch.fulfillRequest":
+            if self.fail_fulfill:
+                raise RuntimeError("fulfillRequest failed")
+            self._outcomes[params["requestId"]].set_result("stubbed")
+        elif method == "Fetch.failRequest":
+            self._outcomes[params["requestId"]].set_result(f"failed:{params['errorReason']}")
+        elif method == "Fetch.continueRequest":
+            url = self._urls[params["requestId"]]
+            await asyncio.to_thread(_download, url)
+            self._outcomes[params["requestId"]].set_result("network")
+        try:
+            command.send({})
+        except StopIteration as stop:
+            return stop.value
+
+    async def load_page(self, url: str) -> Dict[str, str]:
+        """Load ``url`` and its subresources; returns how each request was answered."""
+        outcomes = {url: await self._load(url, "Document")}
+        html = (await asyncio.to_thread(_download, url)).decode()
+        for reference in re.findall(r'(?:src|href)="([^"]+)"', html):
+            resource_url = urljoin(url, reference)
+            resource_type = RESOURCE_TYPES[reference[reference.rfind(".") :]]
+            outcomes[resource_url] = await self._load(resource_url, resource_type)
+        return outcomes
+
+    async def _load(self, url: str, resource_type: str) -> str:
+        if not any(self._matches(pattern, url, resource_type) for pattern in self.patterns):
+            await asyncio.to_thread(_download, url)
+            return "network"
+        request_id = f"request-{next(self._ids)}"
+        self.paused.append(url)
+        self._urls[request_id] = url
+        self._outcomes[request_id] = asyncio.get_running_loop().create_future()
+        event = cdp.fetch.RequestPaused.from_json(
+            {
+                "requestId": request_id,
+                "request": {
+                    "url": url,
+                    "method": "GET",
+                    "headers": {},
+                    "initialPriority": "Low",
+                    "referrerPolicy": "strict-origin-when-cross-origin",
+                },
+                "frameId": "frame",
+                "resourceType": resource_type,
+            }
+        )
+        for handler in self.handlers:
+            handler(event)
+        return await asyncio.wait_for(self._outcomes[request_id], timeout=10)
+
+    @staticmethod
+    def _matches(pattern: cdp.fetch.RequestPattern, url: str, resource_type: str) -> bool:
+        if pattern.resource_type is not None and pattern.resource_type.value != resource_type:
+            return False
+        return pattern.url_pattern is None or fnmatchcase(url, pattern.url_pattern)
+
+
+def test_policy_actions_and_patterns():
+    policy = ResourcePolicy()
+    assert policy.action_for("Image", "https://media.licdn.com/logo.png") == "stub"
+    assert policy.action_for("Font", "https://static.licdn.com/font.woff2") == "block"
+    assert policy.action_for("Script", TRACKER_URL) == "block"
+    assert policy.action_for("Script", "https://static.licdn.com/app.js") is None
+    assert policy.action_for("Document", "https://www.linkedin.com/in/jane-doe/") is None
+
+    patterns = policy.patterns()
+    types = {pattern.resource_type.value for pattern in patterns if pattern.resource_type is not None}
+    assert types == {"Image", "Media", "Font"}
+    assert {pattern.url_pattern for pattern in patterns if pattern.url_pattern} == set(policy.block_urls)
+    assert all(pattern.request_stage == cdp.fetch.RequestStage.REQUEST for pattern in patterns)
+
+
+def test_page_loads_only_what_the_scrape_needs(page_server):
+    origin, server_requests = page_server
+
+    async def run() -> Tuple[Dict[str, str], PageTab, ResourceFilter]:
+        resource_filter = ResourceFilter(ResourcePolicy())
+        tab = PageTab()
+        await resource_filter.attach(tab)
+        return await tab.load_page(f"{origin}/"), tab, resource_filter
+
+    outcomes, tab, resource_filter = asyncio.run(run())
+
+    assert outcomes == {
+        f"{origin}/": "network",
+        f"{origin}/font.woff2": "failed:BlockedByClient",
+        f"{origin}/app.js": "network",
+        TRACKER_URL: "failed:BlockedByClient",
+        f"{origin}/logo.png": "stubbed",
+    }
+    # Documents and scripts never match a pattern, so they are not paused at all.
+    assert tab.paused == [f"{origin}/font.woff2", TRACKER_URL, f"{origin}/logo.png"]
+    assert sorted(server_requests) == ["/", "/", "/app.js"]
+
+    stats = resource_filter.stats_for(tab)
+    assert (stats.blocked, stats.stubbed) == (2, 1)
+    assert stats.estimated_bytes_saved == (
+        DEFAULT_ESTIMATED_SIZES["Font"] + DEFAULT_ESTIMATED_SIZES["Other"] + DEFAULT_ESTIMATED_SIZES["Image"]
+    )
+    assert resource_filter.totals.snapshot() == stats.snapshot()
+
+
+def test_request_is_continued_when_answering_it_fails(page_server):
+    origin, server_requests = page_server
+
+    async def run() -> Tuple[str, PageTab]:
+        resource_filter = ResourceFilter(ResourcePolicy())
+        tab = PageTab(fail_fulfill=True)
+        await resource_filter.attach(tab)
+        return await tab._load(f"{origin}/logo.png", "Image"), tab
+
+    outcome, tab = asyncio.run(run())
+
+    assert outcome == "network"
+    assert tab.methods[-2:] == ["Fetch.fulfillRequest", "Fetch.continueRequest"]
+    assert server_requests == ["/logo.png"]
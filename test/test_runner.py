@@ -0,0 +1,36 @@
+import asyncio
+
+import zendriver as zd
+
+from linkedin_scraper import actions, runner
+
+
+class FakeBrowser:
+    def __init__(self) -> None:
+        self.stopped = False
+        self.stop_loop = None
+
+    async def stop(self) -> None:
+        self.stop_loop = asyncio.get_running_loop()
+        self.stopped = True
+
+
+def test_shutdown_stops_browsers_started_on_the_shared_loop(monkeypatch):
+    started = []
+
+    async def start(config):
+        browser = FakeBrowser()
+        started.append(browser)
+        return browser
+
+    monkeypatch.setattr(zd, "start", start)
+    config = actions.build_browser_config(headless=True, browser_executable_path="/usr/bin/chromium")
+
+    shared = runner.run(actions.start_browser(config))
+    own_loop = asyncio.run(actions.start_browser(config))
+    loop = runner.get_loop()
+    runner.shutdown()
+
+    assert shared.stopped and shared.stop_loop is loop
+    assert not own_loop.stopped
+    assert loop.is_closed()
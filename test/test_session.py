@@ -0,0 +1,174 @@
+import asyncio
+import subprocess
+import sys
+import time
+from collections import deque
+
+from api.memory import MB, RecyclePolicy
+from api.session import BrowserSession, SessionManager, TabPool
+from linkedin_scraper import actions
+from linkedin_scraper.network import tab_key
+
+
+class FakeConnection:
+    async def send(self, command):
+        return None
+
+
+class FakeBrowser:
+    def __init__(self, process) -> None:
+        self._process = process
+        self.connection = FakeConnection()
+
+
+def test_browser_failure_notices_an_exited_process():
+    process = subprocess.Popen([sys.executable, "-c", "raise SystemExit(3)"])
+    # Let the child exit without reaping it; only poll() would notice.
+    time.sleep(0.5)
+    manager = SessionManager()
+    session = BrowserSession("blue", None, max_waiters=1, recycle=manager.recycle)
+    session.browser = FakeBrowser(process)
+    assert asyncio.run(manager._browser_failure(session)) == "browser exited with code 3"
+
+
+def test_browser_failure_passes_a_running_browser():
+    process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        manager = SessionManager()
+        session = BrowserSession("blue", None, max_waiters=1, recycle=manager.recycle)
+        session.browser = FakeBrowser(process)
+        assert asyncio.run(manager._browser_failure(session)) is None
+    finally:
+        process.kill()
+        process.wait()
+
+
+class FakeTab:
+    def add_handler(self, event_type, handler):
+        pass
+
+    async def evaluate(self, expression):
+        return 1
+
+    async def close(self):
+        pass
+
+
+def test_refresh_drains_the_old_session_outside_the_lock():
+    async def run() -> None:
+        manager = SessionManager(tab_pool_size=1)
+        closed = []
+
+        async def open_session(slot):
+            session = BrowserSession(slot, None, max_waiters=1, recycle=manager.recycle)
+            await session.pool.open(None, [FakeTab()])
+            return session
+
+        async def close_session(session):
+            closed.append(session.slot)
+
+        manager._open_session = open_session
+        manager._close_session = close_session
+        await manager.refresh_session()
+        old = manager.session
+
+        async with old.pool.checkout() as pooled:
+            refresh = asyncio.create_task(manager.refresh_session())
+            while manager.retiring is None:
+                await asyncio.sleep(0.01)
+            # The new session serves and the lock is free while the old one drains.
+            assert manager.session is not old
+            assert manager.session.slot != old.slot
+            assert not manager.lock.locked()
+            assert not refresh.done()
+            assert closed == []
+            assert pooled.tab is not None
+        await asyncio.wait_for(refresh, timeout=5)
+        assert closed == [old.slot]
+        assert manager.retiring is None
+
+    asyncio.run(run())
+
+
+def test_session_failing_during_a_refresh_is_recovered_before_the_replacement_is_ready():
+    async def run() -> None:
+        manager = SessionManager(tab_pool_size=1)
+        closed = []
+        replacement_ready = asyncio.Event()
+
+        async def open_session(slot):
+            if manager.session is not None and slot != manager.session.slot:
+                # The refresh's replacement takes as long as a full LinkedIn login.
+                await replacement_ready.wait()
+            session = BrowserSession(slot, None, max_waiters=1, recycle=manager.recycle)
+            await session.pool.open(None, [FakeTab()])
+            return session
+
+        async def close_session(session):
+            closed.append(session)
+
+        manager._open_session = open_session
+        manager._close_session = close_session
+        await manager.refresh_session()
+        crashed = manager.session
+
+        refresh = asyncio.create_task(manager.refresh_session())
+        await asyncio.sleep(0.05)
+        assert not manager.lock.locked()
+
+        recovery = manager._request_recovery(crashed, "browser exited with code 1")
+        await asyncio.wait_for(recovery, timeout=5)
+        recovered = manager.session
+        assert recovered is not crashed and recovered.slot == crashed.slot
+        assert manager.is_available and manager.restarts == 1
+        assert not refresh.done()
+
+        replacement_ready.set()
+        await asyncio.wait_for(refresh, timeout=5)
+        assert manager.session.slot != recovered.slot
+        assert closed == [crashed, recovered]
+
+    asyncio.run(run())
+
+
+class HeapTab(FakeTab):
+    """Reports a large JS heap once ``heap_ready`` is set."""
+
+    def __init__(self, heap_ready: asyncio.Event) -> None:
+        self.heap_ready = heap_ready
+        self.closed = False
+
+    async def send(self, command):
+        await self.heap_ready.wait()
+        return 512 * MB, 1024 * MB
+
+    async def close(self):
+        self.closed = True
+
+
+def test_recycling_runs_after_the_tab_is_returned(monkeypatch):
+    async def run() -> None:
+        heap_ready = asyncio.Event()
+        auth = actions.AuthState()
+        pool = TabPool(recycle=RecyclePolicy())
+        old_tab = HeapTab(heap_ready)
+        await pool.open(object(), [old_tab], auth=auth)
+
+        async def open_tab(browser, url="about:blank"):
+            return FakeTab()
+
+        monkeypatch.setattr(actions, "open_tab", open_tab)
+
+        async with pool.checkout() as pooled:
+            pass
+        # The checkout returned while the heap check is still pending; the tab is not handed out meanwhile.
+        assert pooled.in_use and pool._idle == deque()
+        assert auth._watched == {tab_key(old_tab)}
+
+        heap_ready.set()
+        async with pool.checkout(timeout=5) as pooled:
+            assert pooled.tab is not old_tab
+        assert old_tab.closed and pool.recycled_tabs == 1
+        assert auth._watched == {tab_key(pooled.tab)}
+
+    asyncio.run(run())
@@ -0,0 +1,42 @@
+import asyncio
+import gc
+
+import zendriver as zd
+
+from linkedin_scraper import actions
+from linkedin_scraper.network import tab_key
+
+
+class FakeTab(zd.Tab):
+    """A tab without a target, so it is keyed by ``id()``; resizes are delivered by hand."""
+
+    def __init__(self) -> None:
+        self.handlers = []
+        self.evaluations = 0
+
+    def add_handler(self, event_type, handler) -> None:
+        self.handlers.append(handler)
+
+    async def evaluate(self, expression, await_promise=False, return_by_value=True):
+        self.evaluations += 1
+        return [1280, 720]
+
+
+def test_viewport_is_cached_until_resized_and_dropped_with_the_tab():
+    tab = FakeTab()
+    key = tab_key(tab)
+
+    assert asyncio.run(actions._viewport_size(tab)) == (1280, 720)
+    assert asyncio.run(actions._viewport_size(tab)) == (1280, 720)
+    assert tab.evaluations == 1
+
+    for handler in tab.handlers:
+        handler(None)
+    asyncio.run(actions._viewport_size(tab))
+    assert tab.evaluations == 2
+    assert len(tab.handlers) == 1
+
+    del tab, handler
+    gc.collect()
+    assert key not in actions._viewports
+    assert key not in actions._viewport_watched
@@ -0,0 +1,58 @@
+from pathlib import Path
+
+from api.main import WorkerDispatcher
+
+
+class DeadProcess:
+    exitcode = 1
+
+    def is_alive(self) -> bool:
+        return False
+
+
+def _dispatcher(monkeypatch) -> WorkerDispatcher:
+    dispatcher = WorkerDispatcher(workers=1, settings={}, profile_root=Path("unused"), max_failed_starts=4)
+    spawned = []
+
+    def spawn(handle):
+        spawned.append(handle.worker_id)
+        handle.process = DeadProcess()
+
+    monkeypatch.setattr(dispatcher, "_spawn", spawn)
+    dispatcher.spawned = spawned
+    return dispatcher
+
+
+def test_workers_that_keep_failing_back_off_and_are_given_up(monkeypatch):
+    dispatcher = _dispatcher(monkeypatch)
+    handle = dispatcher.handles[0]
+    handle.process = DeadProcess()
+
+    now = 0.0
+    delays = []
+    for _ in range(3):
+        dispatcher._check_workers(now)
+        delays.append(handle.restart_at - now)
+        now = handle.restart_at
+        dispatcher._check_workers(now)
+    assert delays == [10, 20, 40]
+    assert len(dispatcher.spawned) == 3
+
+    dispatcher._check_workers(now)
+    assert handle.failed and handle.failed_starts == 4
+    dispatcher._check_workers(now + 3600)
+    assert len(dispatcher.spawned) == 3
+
+
+def test_backoff_resets_once_the_worker_is_available(monkeypatch):
+    dispatcher = _dispatcher(monkeypatch)
+    handle = dispatcher.handles[0]
+    handle.process = DeadProcess()
+    dispatcher._check_workers(0)
+    dispatcher._check_workers(10)
+    assert handle.failed_starts == 1
+
+    dispatcher._handle_message(("state", 0, True, {}))
+    assert handle.failed_starts == 0
+    dispatcher._check_workers(100)
+    assert handle.restart_at == 110